@@ -52,7 +52,9 @@ orchestrator = PipelineOrchestrator()
 document_downloader = DocumentDownloader(
     download_folder=os.getenv('DOWNLOAD_FOLDER', 'downloads'),
     timeout=int(os.getenv('DOWNLOAD_TIMEOUT', 30)),
-    max_size=int(os.getenv('MAX_UPLOAD_SIZE', 10485760))
+    max_size=int(os.getenv('MAX_UPLOAD_SIZE', 10485760)),
+    preflight=os.getenv('DOWNLOAD_HEAD_PREFLIGHT', 'false').lower() == 'true',
+    dns_cache=os.getenv('DOWNLOAD_DNS_CACHE', 'false').lower() == 'true'
 )
 
 # Initialize Swagger
@@ -806,6 +808,13 @@ def bulk_process_documents_from_urls():
         errors = []
         downloaded_files = []  # Track downloaded files for cleanup
         
+        # Download all documents concurrently, then process them in order
+        downloads = document_downloader.download_many(
+            urls,
+            [custom_filename if custom_filename else None for custom_filename in custom_filenames],
+            max_workers=int(os.getenv('DOWNLOAD_WORKERS', 8))
+        )
+        
         # Process each URL
         for idx, url in enumerate(urls):
             file_result = {
@@ -819,12 +828,10 @@ def bulk_process_documents_from_urls():
             }
             
             try:
-                custom_filename = custom_filenames[idx] if custom_filenames[idx] else None
-                
                 logger.info(f"Bulk processing - URL {idx+1}/{len(urls)}: {url}")
                 
-                # Download document
-                file_path, download_error = document_downloader.download_document(url, custom_filename)
+                # Downloaded document
+                file_path, download_error = downloads[idx]
                 
                 if download_error:
                     file_result['error'] = f'Download failed: {download_error}'
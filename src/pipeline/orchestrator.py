@@ -4,26 +4,47 @@ Coordinates all stages of the document quality verification pipeline.
 """
 
 import os
+import re
+import importlib.util
 import time
 import logging
 import threading
+import copy
+import hashlib
+from collections import OrderedDict
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, List, Optional
+import numpy as np
 from dotenv import load_dotenv
 
 from src.stages.stage1_basic_quality import BasicQualityChecker
 from src.stages.stage2_ocr_confidence import OCRConfidenceAnalyzer
 from src.stages.stage3_handwriting_detection import HandwritingDetector
 from src.stages.stage4_brisque_quality import BRISQUEQualityScorer
+from src.stages.stage_result import StageResult
 from src.utils.pdf_converter import PDFConverter
 from src.utils.image_processor import ImageProcessor
 
+# Set up logger
+logger = logging.getLogger(__name__)
+
 # Optional Florence-2 integration (modular component)
+# Availability is checked without importing torch/transformers - the classifier is imported on first use
+FLORENCE_AVAILABLE = (
+    importlib.util.find_spec('torch') is not None and
+    importlib.util.find_spec('transformers') is not None
+)
+if not FLORENCE_AVAILABLE:
+    logger.warning("Florence-2 classifier not available (install torch and transformers to enable)")
+
+# Optional xxhash for fast page content hashing (falls back to hashlib.blake2b)
 try:
-    from src.utils.florence_classifier import get_florence_instance
-    FLORENCE_AVAILABLE = True
+    import xxhash
+    XXHASH_AVAILABLE = True
 except ImportError:
-    FLORENCE_AVAILABLE = False
-    logger.warning("Florence-2 classifier not available (install torch and transformers to enable)")
+    XXHASH_AVAILABLE = False
 
 # Optional Index-II specialized processor (modular component)
 try:
@@ -35,8 +56,96 @@ except ImportError:
 
 load_dotenv()
 
-# Set up logger
-logger = logging.getLogger(__name__)
+# Precompiled classifiers for critical-failure messages (case folding handled by the regex engine)
+_BLUR_PATTERN = re.compile(r'\b(blur|blurry)\b', re.IGNORECASE)
+_HANDWRITING_PATTERN = re.compile(r'\bhandwriting\b', re.IGNORECASE)
+
+# Stage names share a fixed 'Stage N' prefix, so results can be indexed by prefix
+STAGE_PREFIX_LENGTH = len('Stage 1')
+
+
+def index_stage_results(stage_results: List[StageResult]) -> Dict[str, StageResult]:
+    """
+    Index stage results by their 'Stage N' prefix in a single pass.
+    
+    Args:
+        stage_results: List of stage results
+        
+    Returns:
+        Dictionary mapping 'Stage 1'..'Stage 4' to the first matching stage result
+    """
+    stage_by_prefix = {}
+    for stage_result in stage_results:
+        stage_by_prefix.setdefault(stage_result.stage[:STAGE_PREFIX_LENGTH], stage_result)
+    return stage_by_prefix
+
+
+@dataclass(slots=True)
+class PageResult:
+    """Per-page pipeline result (serialized with to_dict() for API responses)."""
+    page_number: int
+    total_pages: int
+    final_quality_score: float
+    has_critical_failures: bool
+    critical_failures: List[str]
+    warnings: List[str]
+    status: str
+    priority: str
+    message: str
+    ocr_confidence: Optional[float]
+    handwriting_percentage: Optional[float]
+    stage_results: List[StageResult]
+    florence_override: Optional[Dict] = None
+    
+    def to_dict(self) -> Dict:
+        """Convert to the page result dictionary returned by the API."""
+        page_dict = {
+            'page_number': self.page_number,
+            'total_pages': self.total_pages,
+            'final_quality_score': self.final_quality_score,
+            'has_critical_failures': self.has_critical_failures,
+            'critical_failures': self.critical_failures,
+            'warnings': self.warnings,
+            'status': self.status,
+            'priority': self.priority,
+            'message': self.message,
+            'ocr_confidence': self.ocr_confidence,
+            'handwriting_percentage': self.handwriting_percentage,
+            'stage_results': [r.to_dict() for r in self.stage_results]
+        }
+        
+        # Florence override info is only included when present
+        if self.florence_override:
+            page_dict['florence_override'] = self.florence_override
+        
+        return page_dict
+
+
+# Per-process Stage 1 checker for the page process pool (created once per worker process)
+_stage1_worker_checker = None
+
+
+def _run_stage1_in_worker(image_path: str) -> StageResult:
+    """
+    Run Stage 1 on a page inside a pool worker process.
+    
+    Args:
+        image_path: Path to the page image
+        
+    Returns:
+        Stage 1 result (failed result with error if the stage raised)
+    """
+    global _stage1_worker_checker
+    if _stage1_worker_checker is None:
+        _stage1_worker_checker = BasicQualityChecker()
+    try:
+        return _stage1_worker_checker.process(image_path)
+    except Exception as e:
+        return StageResult(
+            stage='Stage 1: Basic Quality Checks',
+            passed=False,
+            error=str(e)
+        )
 
 
 class PipelineOrchestrator:
@@ -45,20 +154,46 @@ class PipelineOrchestrator:
     def __init__(self):
         """Initialize all pipeline stages."""
         self.stage1 = BasicQualityChecker()
-        # Initialize Florence classifier if available (lazy loaded)
-        self.florence_classifier = None
-        if FLORENCE_AVAILABLE:
-            try:
-                self.florence_classifier = get_florence_instance()
-                logger.info("Florence-2 classifier available (will load on first use)")
-            except Exception as e:
-                logger.warning(f"Florence-2 classifier initialization failed: {e}")
+        # Florence classifier is created on first use (see florence_classifier property)
+        self._florence_classifier = None
+        self._florence_init_failed = False
         self.stage2 = OCRConfidenceAnalyzer()
         self.stage3 = HandwritingDetector()
         self.stage4 = BRISQUEQualityScorer()
+        self._stages = [
+            (self.stage1, 'Stage 1: Basic Quality Checks'),
+            (self.stage2, 'Stage 2: OCR Confidence Analysis'),
+            (self.stage3, 'Stage 3: Handwriting Detection'),
+            (self.stage4, 'Stage 4: Overall Quality Score (BRISQUE)')
+        ]
         self.pdf_converter = PDFConverter()
         self.image_processor = ImageProcessor()
         
+        # Stage-level gating: skip expensive stages on pages that are already rejected
+        # (opt-in - extreme blur is otherwise allowed to be recovered by high OCR confidence)
+        self.early_reject = os.getenv('EARLY_REJECT', 'false').lower() in ('1', 'true')
+        self.blur_extreme_threshold = float(os.getenv('BLUR_EXTREME_THRESHOLD', 15))
+        self.brisque_skip_ocr_threshold = float(os.getenv('BRISQUE_SKIP_OCR_THRESHOLD', 20))
+        
+        # Tracebacks are expensive on repeated errors (e.g. broken Tesseract install in a bulk run):
+        # only log them when enabled, and only for the first occurrence of each exception type
+        self.with_traceback = os.getenv('WITH_TRACEBACK', 'false').lower() in ('1', 'true')
+        self._seen_tracebacks = set()
+        
+        # Stage 1 is pure CPU and independent per page - optionally run it for all pages in a process pool
+        self.stage1_workers = int(os.getenv('STAGE1_WORKERS', 1))
+        
+        # OCR all pages of a multi-page document in one Tesseract invocation (loads the model once)
+        self.ocr_batch = os.getenv('OCR_BATCH', 'false').lower() in ('1', 'true')
+        
+        # Otherwise OCR pages in parallel, one single-threaded Tesseract per worker (1 = sequential)
+        self.ocr_workers = int(os.getenv('OCR_WORKERS', 1))
+        
+        # LRU cache of Stage 2-4 results keyed by page content hash (repeated/re-uploaded pages); 0 disables
+        self.stage_cache_size = int(os.getenv('STAGE_CACHE_SIZE', 256))
+        self._stage_cache = OrderedDict()
+        self._stage_cache_lock = threading.Lock()
+        
         # Initialize Index-II processor if available
         self.index2_processor = None
         if INDEX2_PROCESSOR_AVAILABLE:
@@ -68,7 +203,20 @@ class PipelineOrchestrator:
             except Exception as e:
                 logger.warning(f"Index-II processor initialization failed: {e}")
     
-    def calculate_final_quality_score(self, stage_results: List[Dict]) -> float:
+    @property
+    def florence_classifier(self):
+        """Florence-2 classifier, created on first use (None if unavailable)."""
+        if self._florence_classifier is None and FLORENCE_AVAILABLE and not self._florence_init_failed:
+            try:
+                from src.utils.florence_classifier import get_florence_instance
+                self._florence_classifier = get_florence_instance()
+                logger.info("Florence-2 classifier available (will load on first use)")
+            except Exception as e:
+                self._florence_init_failed = True
+                logger.warning(f"Florence-2 classifier initialization failed: {e}")
+        return self._florence_classifier
+    
+    def calculate_final_quality_score(self, stage_results: List[StageResult]) -> float:
         """
         Calculate final composite quality score.
         
@@ -81,16 +229,17 @@ class PipelineOrchestrator:
                        (BRISQUE × 0.05)
         
         Args:
-            stage_results: List of stage result dictionaries
+            stage_results: List of stage results
             
         Returns:
             Final quality score (0-100)
         """
         # Extract stage scores
-        stage1_score = next((r.get('stage_score', 0) for r in stage_results if r.get('stage') == 'Stage 1: Basic Quality Checks'), 0)
-        stage2_score = next((r.get('stage_score', 0) for r in stage_results if r.get('stage') == 'Stage 2: OCR Confidence Analysis'), 0)
-        stage3_score = next((r.get('stage_score', 0) for r in stage_results if r.get('stage') == 'Stage 3: Handwriting Detection'), 0)
-        stage4_score = next((r.get('stage_score', 0) for r in stage_results if r.get('stage') == 'Stage 4: Overall Quality Score (BRISQUE)'), 0)
+        stage_scores = {prefix: r.stage_score for prefix, r in index_stage_results(stage_results).items()}
+        stage1_score = stage_scores.get('Stage 1', 0)
+        stage2_score = stage_scores.get('Stage 2', 0)
+        stage3_score = stage_scores.get('Stage 3', 0)
+        stage4_score = stage_scores.get('Stage 4', 0)
         
         # Weighted average
         final_score = (
@@ -445,12 +594,10 @@ class PipelineOrchestrator:
         
         # Only reject for blur if OCR also confirms it's unreadable
         # If OCR can read it well, blur is acceptable (scanned documents often have lower blur scores)
-        blur_extreme_threshold = float(os.getenv('BLUR_EXTREME_THRESHOLD', 15))
-        
         if blur_score is not None and blur_score < 30:
             # EXTREME BLUR: Very low blur scores (< 15 by default)
             # BUT: If OCR is very high (>= 80%), trust OCR - blur detection may be false positive
-            if blur_score < blur_extreme_threshold:
+            if blur_score < self.blur_extreme_threshold:
                 # Check OCR first - if OCR can read it well, blur detection is likely wrong
                 if ocr_confidence is not None and ocr_confidence >= 80:
                     # Very high OCR - document is clearly readable despite low blur score
@@ -508,22 +655,21 @@ class PipelineOrchestrator:
         if ocr_confidence is not None and ocr_confidence >= 80:
             all_critical = [
                 f for f in all_critical 
-                if 'blur' not in f.lower() and 'blurry' not in f.lower() and 'handwriting' not in f.lower()
+                if not _BLUR_PATTERN.search(f) and not _HANDWRITING_PATTERN.search(f)
             ]
         
         if len(all_critical) > 0:
             # If document is readable (OCR >= 50%), don't reject for blur/handwriting
             # Extreme blur is now checked above with OCR validation (line 450-501)
-            blur_extreme_threshold = float(os.getenv('BLUR_EXTREME_THRESHOLD', 15))
             is_readable = ocr_confidence is not None and ocr_confidence >= 50
-            is_extreme_blur = blur_score is not None and blur_score < blur_extreme_threshold
+            is_extreme_blur = blur_score is not None and blur_score < self.blur_extreme_threshold
             
             # If OCR is very high (>= 80%), ignore extreme blur (already filtered above)
             # If OCR is good (>= 50%), ignore moderate blur
             if is_readable and (not is_extreme_blur or ocr_confidence >= 80):
                 # Check Florence for handwriting false positives BEFORE filtering
                 # If Florence confirms printed, we can safely filter handwriting failures
-                handwriting_critical = [f for f in all_critical if 'handwriting' in f.lower()]
+                handwriting_critical = [f for f in all_critical if _HANDWRITING_PATTERN.search(f)]
                 if handwriting_critical and image_path:
                     # Check Florence to verify if handwriting is false positive
                     florence_override = self._check_florence_override(
@@ -537,13 +683,13 @@ class PipelineOrchestrator:
                         )
                         all_critical = [
                             f for f in all_critical 
-                            if 'handwriting' not in f.lower()
+                            if not _HANDWRITING_PATTERN.search(f)
                         ]
                 
                 # Filter out blur and handwriting issues for readable documents (but not extreme blur)
                 filtered_critical = [
                     f for f in all_critical 
-                    if 'blur' not in f.lower() and 'blurry' not in f.lower() and 'handwriting' not in f.lower()
+                    if not _BLUR_PATTERN.search(f) and not _HANDWRITING_PATTERN.search(f)
                 ]
                 if len(filtered_critical) == 0:
                     # No real critical issues - document is readable
@@ -701,12 +847,12 @@ class PipelineOrchestrator:
         # 5. For higher handwriting, require higher OCR
         # OPTIMIZATION: Skip Florence if OCR is extremely high (>= 90%) - trust OCR in these cases
         if (not FLORENCE_AVAILABLE or 
-            not self.florence_classifier or 
             not image_path or 
             ocr_confidence is None or 
             ocr_confidence < 50 or  # Require readable OCR (50%)
             handwriting_pct is None or
-            handwriting_pct < 20):
+            handwriting_pct < 20 or
+            not self.florence_classifier):  # Checked last - creates the classifier on first use
             return None
         
         # OPTIMIZATION: Skip Florence for extremely high OCR (>= 90%) - saves processing time
@@ -865,10 +1011,275 @@ class PipelineOrchestrator:
             return result
             
         except Exception as e:
-            logger.error(f"Florence override check failed: {e}", exc_info=True)
+            self._log_error("Florence override check failed: %s", e, error=e)
             return None
     
-    def determine_status(self, final_score: float, has_critical_failures: bool, ocr_confidence: Optional[float] = None, stage_results: Optional[List[Dict]] = None) -> Dict:
+    def _log_error(self, message: str, *args, error: Exception):
+        """
+        Log an error, attaching the traceback only when enabled and not already logged for this exception type.
+        
+        Args:
+            message: Log message (%-style, formatted lazily by logging)
+            *args: Message arguments
+            error: Exception being logged
+        """
+        exc_info = None
+        if (self.with_traceback or logger.isEnabledFor(logging.DEBUG)) and type(error) not in self._seen_tracebacks:
+            self._seen_tracebacks.add(type(error))
+            exc_info = error
+        logger.error(message, *args, exc_info=exc_info)
+    
+    def _run_stage1_parallel(self, image_paths: List[str]) -> Dict[str, StageResult]:
+        """
+        Run Stage 1 for all pages in a process pool.
+        
+        Args:
+            image_paths: Page image paths
+            
+        Returns:
+            Dictionary mapping image path to Stage 1 result (empty if the pool is disabled or fails)
+        """
+        if self.stage1_workers <= 1 or len(image_paths) <= 1:
+            return {}
+        
+        try:
+            max_workers = min(self.stage1_workers, len(image_paths))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return dict(zip(image_paths, executor.map(_run_stage1_in_worker, image_paths)))
+        except Exception as e:
+            logger.warning(f"Parallel Stage 1 failed, falling back to sequential processing: {e}")
+            return {}
+    
+    def _run_stage2_batch(self, image_paths: List[str]) -> Dict[str, StageResult]:
+        """
+        Run Stage 2 for all pages ahead of the page loop - a single batched Tesseract call
+        (OCR_BATCH) or parallel per-page OCR (OCR_WORKERS).
+        
+        Args:
+            image_paths: Page image paths
+            
+        Returns:
+            Dictionary mapping image path to Stage 2 result (empty if disabled or failed)
+        """
+        if len(image_paths) <= 1 or not (self.ocr_batch or self.ocr_workers > 1):
+            return {}
+        
+        try:
+            if self.ocr_batch:
+                return dict(zip(image_paths, self.stage2.process_batch(image_paths)))
+            return dict(zip(image_paths, self.stage2.process_many(image_paths, self.ocr_workers)))
+        except Exception as e:
+            logger.warning(f"Multi-page OCR failed, falling back to per-page OCR: {e}")
+            return {}
+    
+    def _hash_page(self, image_path: str) -> Optional[str]:
+        """
+        Hash a page image's bytes for the stage result cache.
+        
+        Args:
+            image_path: Path to the page image
+            
+        Returns:
+            Hex digest of the file content, or None if caching is disabled or the file can't be read
+        """
+        if self.stage_cache_size <= 0:
+            return None
+        try:
+            with open(image_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_hexdigest(data)
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    
+    def _get_cached_stage_result(self, page_hash: Optional[str], stage_idx: int) -> Optional[StageResult]:
+        """
+        Look up a cached stage result for a page.
+        
+        Args:
+            page_hash: Page content hash (None = caching disabled)
+            stage_idx: Index of the stage in self._stages
+            
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        if page_hash is None:
+            return None
+        with self._stage_cache_lock:
+            cached = self._stage_cache.get((page_hash, stage_idx))
+            if cached is None:
+                return None
+            self._stage_cache.move_to_end((page_hash, stage_idx))
+        # Results are adjusted per page later on (e.g. filtered failures) - never hand out the cached object
+        return copy.deepcopy(cached)
+    
+    def _store_stage_result(self, page_hash: Optional[str], stage_idx: int, stage_result: StageResult):
+        """
+        Cache a stage result for a page (errors are not cached).
+        
+        Args:
+            page_hash: Page content hash (None = caching disabled)
+            stage_idx: Index of the stage in self._stages
+            stage_result: Result to cache
+        """
+        if page_hash is None or stage_result.error is not None:
+            return
+        cached = copy.deepcopy(stage_result)
+        with self._stage_cache_lock:
+            self._stage_cache[(page_hash, stage_idx)] = cached
+            self._stage_cache.move_to_end((page_hash, stage_idx))
+            while len(self._stage_cache) > self.stage_cache_size:
+                self._stage_cache.popitem(last=False)
+    
+    def _run_stage(self, stage, stage_name: str, image_path: str) -> StageResult:
+        """
+        Run a single stage, converting any exception into a failed stage result.
+        
+        Args:
+            stage: Stage instance with a process(image_path) method
+            stage_name: Full stage name (used for the error result)
+            image_path: Path to the page image
+            
+        Returns:
+            Stage result
+        """
+        try:
+            return stage.process(image_path)
+        except Exception as e:
+            return StageResult(
+                stage=stage_name,
+                passed=False,
+                error=str(e)
+            )
+    
+    def _is_extreme_blur(self, stage1_result: StageResult) -> bool:
+        """
+        Check whether Stage 1 found blur below the extreme threshold.
+        
+        Args:
+            stage1_result: Stage 1 result
+            
+        Returns:
+            True if the page has an extreme blur critical failure
+        """
+        if not stage1_result.critical_failures:
+            return False
+        blur_details = stage1_result.checks.get('blur_details', {})
+        blur_score = blur_details.get('blur_score')
+        return blur_score is not None and blur_score < self.blur_extreme_threshold
+    
+    def _is_unreadable(self, stage2_result: StageResult) -> bool:
+        """
+        Check whether Stage 2 OCR confidence is below the point where any rule can accept the page.
+        
+        Args:
+            stage2_result: Stage 2 result
+            
+        Returns:
+            True if OCR confidence is below the BRISQUE skip threshold
+        """
+        ocr_confidence = stage2_result.analysis.get('average_confidence')
+        return ocr_confidence is not None and ocr_confidence < self.brisque_skip_ocr_threshold
+    
+    def _skipped_stage_result(self, stage_name: str, reason: str) -> StageResult:
+        """
+        Build the result for a stage skipped by early rejection.
+        
+        Args:
+            stage_name: Full stage name
+            reason: Why the stage was skipped
+            
+        Returns:
+            Stage result
+        """
+        return StageResult(
+            stage=stage_name,
+            passed=False,
+            extra={'skipped': True, 'message': reason}
+        )
+    
+    def _select_best_page_index(
+        self,
+        page_results: List[PageResult],
+        page_processed: List[bool],
+        total_pages: int
+    ) -> Optional[int]:
+        """
+        Select the best page from the page results collected so far.
+        
+        Rules:
+        - 1-page document: Use page 1
+        - 2-page document: Always use page 2 (content is typically on page 2)
+        - 3+ page document: Use best page (highest score, no critical failures preferred)
+        
+        Pages that failed to process are never selected here; the caller falls back
+        to the highest score when no page qualifies.
+        
+        Args:
+            page_results: Page results in page order
+            page_processed: Whether each page completed all stages
+            total_pages: Total number of pages in the document
+            
+        Returns:
+            Index into page_results, or None if no page qualifies yet
+        """
+        if not page_results:
+            return None
+        
+        processed = np.array(page_processed, dtype=bool)
+        
+        if total_pages == 1:
+            return 0 if processed[0] else None
+        if total_pages == 2:
+            # Page 1 of a 2-page document is skipped (page 2 will be used)
+            return 1 if processed.size > 1 and processed[1] else None
+        
+        scores = np.array([p.final_quality_score for p in page_results], dtype=np.float64)
+        critical = np.array([p.has_critical_failures for p in page_results], dtype=bool)
+        
+        # Prefer pages without critical failures, otherwise highest scoring processed page
+        candidates = np.flatnonzero(processed & ~critical)
+        if candidates.size == 0:
+            candidates = np.flatnonzero(processed)
+        if candidates.size == 0:
+            return None
+        # argmax returns the first maximum, matching the earliest page on ties
+        return int(candidates[np.argmax(scores[candidates])])
+    
+    def _is_new_best_page(
+        self,
+        page_result: PageResult,
+        page_idx: int,
+        current_best: Optional[PageResult],
+        total_pages: int
+    ) -> bool:
+        """
+        Check whether a newly processed page replaces the running best page.
+        Applies the rules of _select_best_page_index incrementally (constant time per page).
+        
+        Args:
+            page_result: Result of the page just processed
+            page_idx: Index of that page
+            current_best: Running best page so far (None if no page qualifies yet)
+            total_pages: Total number of pages in the document
+            
+        Returns:
+            True if page_result becomes the running best page
+        """
+        if total_pages == 1:
+            return page_idx == 0
+        if total_pages == 2:
+            return page_idx == 1
+        if current_best is None:
+            return True
+        if page_result.has_critical_failures != current_best.has_critical_failures:
+            # Pages without critical failures are preferred
+            return not page_result.has_critical_failures
+        # Strictly higher score - the earliest page wins ties, like the final argmax
+        return page_result.final_quality_score > current_best.final_quality_score
+    
+    def determine_status(self, final_score: float, has_critical_failures: bool, ocr_confidence: Optional[float] = None, stage_results: Optional[List[StageResult]] = None) -> Dict:
         """
         Determine document status based on final score and critical failures.
         
@@ -883,11 +1294,9 @@ class PipelineOrchestrator:
         """
         # Extract OCR confidence from stage results if not provided
         if ocr_confidence is None and stage_results is not None:
-            for stage_result in stage_results:
-                if 'OCR Confidence Analysis' in stage_result.get('stage', ''):
-                    if 'analysis' in stage_result:
-                        ocr_confidence = stage_result['analysis'].get('average_confidence')
-                        break
+            stage2_result = index_stage_results(stage_results).get('Stage 2')
+            if stage2_result:
+                ocr_confidence = stage2_result.analysis.get('average_confidence')
         # Reject if critical failures detected (regardless of score)
         if has_critical_failures:
             return {
@@ -1047,86 +1456,60 @@ class PipelineOrchestrator:
             }
         
         # Process all pages/images
-        page_results = []
-        best_page_result = None
-        best_page_score = -1
-        best_page_index = 0
+        page_results = []  # Lightweight summaries; only the best page keeps full stage details
+        detail_pages = []  # Pages still holding full stage results (best page or fallback candidates)
+        page_processed = []  # Whether each page completed all stages (False for pages that errored)
+        running_best = None  # Best processed page so far (same rules as _select_best_page_index)
+        
+        # Stage results computed ahead for all pages (Stage 1 process pool, Stage 2 batch/parallel OCR), keyed by stage index
+        precomputed = {
+            0: self._run_stage1_parallel(image_paths),
+            1: self._run_stage2_batch(image_paths)
+        }
         
         for page_idx, image_path in enumerate(image_paths):
             page_num = page_idx + 1
             logger.info(f"Processing page {page_num}/{len(image_paths)} of {file_path}")
             
             try:
-                page_stage_results = []
+                page_stage_results = [None] * len(self._stages)
                 page_critical_failures = []
                 page_warnings = []
+                skipped_stages = {}  # Stage index -> skip reason (early reject gating)
+                page_hash = self._hash_page(image_path)
                 
                 # Run ALL stages for this page
-                # Stage 1: Basic Quality Checks
-                try:
-                    stage1_result = self.stage1.process(image_path)
-                    page_stage_results.append(stage1_result)
-                    page_critical_failures.extend(stage1_result.get('critical_failures', []))
-                    page_warnings.extend(stage1_result.get('warnings', []))
-                except Exception as e:
-                    page_stage_results.append({
-                        'stage': 'Stage 1: Basic Quality Checks',
-                        'passed': False,
-                        'error': str(e),
-                        'critical_failures': [],
-                        'warnings': []
-                    })
-                
-                # Stage 2: OCR Confidence Analysis
-                try:
-                    stage2_result = self.stage2.process(image_path)
-                    page_stage_results.append(stage2_result)
-                    page_critical_failures.extend(stage2_result.get('critical_failures', []))
-                    page_warnings.extend(stage2_result.get('warnings', []))
-                except Exception as e:
-                    page_stage_results.append({
-                        'stage': 'Stage 2: OCR Confidence Analysis',
-                        'passed': False,
-                        'error': str(e),
-                        'critical_failures': [],
-                        'warnings': []
-                    })
-                
-                # Stage 3: Handwriting Detection
-                try:
-                    stage3_result = self.stage3.process(image_path)
-                    page_stage_results.append(stage3_result)
-                    page_critical_failures.extend(stage3_result.get('critical_failures', []))
-                    page_warnings.extend(stage3_result.get('warnings', []))
-                except Exception as e:
-                    page_stage_results.append({
-                        'stage': 'Stage 3: Handwriting Detection',
-                        'passed': False,
-                        'error': str(e),
-                        'critical_failures': [],
-                        'warnings': []
-                    })
+                for stage_idx, (stage, stage_name) in enumerate(self._stages):
+                    if stage_idx in skipped_stages:
+                        page_stage_results[stage_idx] = self._skipped_stage_result(stage_name, skipped_stages[stage_idx])
+                        continue
+                    
+                    if image_path in precomputed.get(stage_idx, {}):
+                        stage_result = precomputed[stage_idx].pop(image_path)
+                    elif stage_idx > 0:
+                        # Stages 2-4 (OCR, handwriting, BRISQUE) are cached by page content
+                        stage_result = self._get_cached_stage_result(page_hash, stage_idx)
+                        if stage_result is None:
+                            stage_result = self._run_stage(stage, stage_name, image_path)
+                            self._store_stage_result(page_hash, stage_idx, stage_result)
+                    else:
+                        stage_result = self._run_stage(stage, stage_name, image_path)
+                    page_stage_results[stage_idx] = stage_result
+                    page_critical_failures.extend(stage_result.critical_failures)
+                    page_warnings.extend(stage_result.warnings)
+                    
+                    if self.early_reject:
+                        if stage_idx == 0 and self._is_extreme_blur(stage_result):
+                            # Reject on Stage 1's extreme blur alone. This skips the OCR >= 80% override, so
+                            # pages the full path would accept as readable can be rejected here
+                            for skipped_idx in range(1, len(self._stages)):
+                                skipped_stages[skipped_idx] = 'Skipped - page rejected for extreme blur'
+                        elif stage_idx == 1 and self._is_unreadable(stage_result):
+                            # Skip BRISQUE (heaviest stage) when OCR is too low for any rule to accept the page
+                            skipped_stages[3] = 'Skipped - page already rejected'
                 
-                # Stage 4: BRISQUE Quality Score
-                try:
-                    stage4_result = self.stage4.process(image_path)
-                    page_stage_results.append(stage4_result)
-                    page_critical_failures.extend(stage4_result.get('critical_failures', []))
-                    page_warnings.extend(stage4_result.get('warnings', []))
-                except Exception as e:
-                    page_stage_results.append({
-                        'stage': 'Stage 4: Overall Quality Score (BRISQUE)',
-                        'passed': False,
-                        'error': str(e),
-                        'critical_failures': [],
-                        'warnings': []
-                    })
-        
-                # Extract metrics for this page
-                page_stage1_result = next((r for r in page_stage_results if 'Basic Quality Checks' in r.get('stage', '')), None)
-                page_stage2_result = next((r for r in page_stage_results if 'OCR Confidence Analysis' in r.get('stage', '')), None)
-                page_stage3_result = next((r for r in page_stage_results if 'Handwriting Detection' in r.get('stage', '')), None)
-                page_stage4_result = next((r for r in page_stage_results if 'BRISQUE' in r.get('stage', '')), None)
+                # Extract metrics for this page (results are stored in stage order)
+                page_stage1_result, page_stage2_result, page_stage3_result, page_stage4_result = page_stage_results
                 
                 page_ocr_confidence = None
                 page_handwriting_pct = None
@@ -1134,16 +1517,16 @@ class PipelineOrchestrator:
                 page_blur_score = None
                 page_resolution = None
                 
-                if page_stage2_result and 'analysis' in page_stage2_result:
-                    page_ocr_confidence = page_stage2_result['analysis'].get('average_confidence')
+                if page_stage2_result:
+                    page_ocr_confidence = page_stage2_result.analysis.get('average_confidence')
                 
-                if page_stage3_result and 'analysis' in page_stage3_result:
-                    page_handwriting_analysis = page_stage3_result['analysis']
+                if page_stage3_result and page_stage3_result.analysis:
+                    page_handwriting_analysis = page_stage3_result.analysis
                     page_handwriting_pct = page_handwriting_analysis.get('handwriting_percentage')
                     page_handwriting_dist = page_handwriting_analysis.get('distribution', {})
                 
-                if page_stage1_result and 'checks' in page_stage1_result:
-                    checks = page_stage1_result['checks']
+                if page_stage1_result:
+                    checks = page_stage1_result.checks
                     if 'blur_details' in checks:
                         page_blur_score = checks['blur_details'].get('blur_score')
                     if 'resolution_details' in checks:
@@ -1152,77 +1535,43 @@ class PipelineOrchestrator:
                 
                 # Filter blur and handwriting false positives for this page
                 page_is_very_blurry = page_blur_score is not None and page_blur_score < 30
-                page_blur_extreme_threshold = float(os.getenv('BLUR_EXTREME_THRESHOLD', 15))
-                page_is_extreme_blur = page_blur_score is not None and page_blur_score < page_blur_extreme_threshold
+                page_is_extreme_blur = page_blur_score is not None and page_blur_score < self.blur_extreme_threshold
                 page_is_readable = page_ocr_confidence is not None and page_ocr_confidence >= 50
                 page_is_very_readable = page_ocr_confidence is not None and page_ocr_confidence >= 80
                 
-                # If OCR is very high (>= 80%), trust OCR over blur detection even for extreme blur
-                if page_is_very_readable:
-                    # Very high OCR - document is clearly readable, blur detection is likely false positive
-                    blur_critical_failures = [
-                        f for f in page_stage1_result.get('critical_failures', []) 
-                        if 'blur' in f.lower() or 'blurry' in f.lower()
-                    ]
-                    if blur_critical_failures:
-                        page_critical_failures = [
-                            f for f in page_critical_failures 
-                            if f not in blur_critical_failures
-                        ]
-                        if page_stage1_result:
-                            page_stage1_result['critical_failures'] = [
-                                f for f in page_stage1_result.get('critical_failures', [])
-                                if f not in blur_critical_failures
-                            ]
-                            if 'warnings' not in page_stage1_result:
-                                page_stage1_result['warnings'] = []
-                            warning_msg = f'Blur score ({page_blur_score:.1f}) is low but OCR is very high ({page_ocr_confidence:.1f}%) - blur detection likely false positive'
-                            page_stage1_result['warnings'].append(warning_msg)
-                            page_warnings.append(warning_msg)
+                # Single pass per stage: classify each critical failure as kept or dropped (false positive)
+                dropped_failures = set()
                 
-                if page_is_readable and not page_is_extreme_blur:
-                    # Document is readable and not extremely blurry - remove blur critical failures
-                    blur_critical_failures = [
-                        f for f in page_stage1_result.get('critical_failures', []) 
-                        if 'blur' in f.lower() or 'blurry' in f.lower()
-                    ]
-                    if blur_critical_failures:
-                        page_critical_failures = [
-                            f for f in page_critical_failures 
-                            if f not in blur_critical_failures
-                        ]
-                        if page_stage1_result:
-                            page_stage1_result['critical_failures'] = [
-                                f for f in page_stage1_result.get('critical_failures', [])
-                                if f not in blur_critical_failures
-                            ]
-                            if 'warnings' not in page_stage1_result:
-                                page_stage1_result['warnings'] = []
+                # Blur failures are dropped when OCR is very high (>= 80%, even for extreme blur)
+                # or when the document is readable and not extremely blurry
+                if page_stage1_result and (page_is_very_readable or (page_is_readable and not page_is_extreme_blur)):
+                    kept, dropped = [], []
+                    for f in page_stage1_result.critical_failures:
+                        (dropped if _BLUR_PATTERN.search(f) else kept).append(f)
+                    if dropped:
+                        page_stage1_result.critical_failures = kept
+                        dropped_failures.update(dropped)
+                        if page_is_very_readable:
+                            warning_msg = f'Blur score ({page_blur_score:.1f}) is low but OCR is very high ({page_ocr_confidence:.1f}%) - blur detection likely false positive'
+                        else:
                             warning_msg = f'Document is slightly blurry (blur score: {page_blur_score:.1f}) but readable (OCR: {page_ocr_confidence:.1f}%)'
-                            page_stage1_result['warnings'].append(warning_msg)
-                            page_warnings.append(warning_msg)
-                    
-                    # Also remove handwriting false positives when document is readable
-                    if page_is_very_blurry:
-                        handwriting_critical_failures = [
-                            f for f in page_stage3_result.get('critical_failures', []) 
-                            if 'handwriting' in f.lower()
-                        ]
-                        if handwriting_critical_failures:
-                            page_critical_failures = [
-                                f for f in page_critical_failures 
-                                if f not in handwriting_critical_failures
-                            ]
-                            if page_stage3_result:
-                                page_stage3_result['critical_failures'] = [
-                                    f for f in page_stage3_result.get('critical_failures', [])
-                                    if f not in handwriting_critical_failures
-                                ]
-                                if 'warnings' not in page_stage3_result:
-                                    page_stage3_result['warnings'] = []
-                                warning_msg = f'Handwriting detection unreliable due to blur (blur score: {page_blur_score:.1f}). OCR confidence ({page_ocr_confidence:.1f}%) confirms printed text.'
-                                page_stage3_result['warnings'].append(warning_msg)
-                                page_warnings.append(warning_msg)
+                        page_stage1_result.warnings.append(warning_msg)
+                        page_warnings.append(warning_msg)
+                
+                # Also remove handwriting false positives when document is readable but very blurry
+                if page_stage3_result and page_is_readable and not page_is_extreme_blur and page_is_very_blurry:
+                    kept, dropped = [], []
+                    for f in page_stage3_result.critical_failures:
+                        (dropped if _HANDWRITING_PATTERN.search(f) else kept).append(f)
+                    if dropped:
+                        page_stage3_result.critical_failures = kept
+                        dropped_failures.update(dropped)
+                        warning_msg = f'Handwriting detection unreliable due to blur (blur score: {page_blur_score:.1f}). OCR confidence ({page_ocr_confidence:.1f}%) confirms printed text.'
+                        page_stage3_result.warnings.append(warning_msg)
+                        page_warnings.append(warning_msg)
+                
+                if dropped_failures:
+                    page_critical_failures = [f for f in page_critical_failures if f not in dropped_failures]
                 
                 # CONSENSUS-BASED DECISION LOGIC for this page
                 consensus_status = self.make_consensus_decision(
@@ -1231,9 +1580,9 @@ class PipelineOrchestrator:
                     handwriting_dist=page_handwriting_dist,
                     blur_score=page_blur_score,
                     resolution=page_resolution,
-                    stage1_critical=page_stage1_result.get('critical_failures', []) if page_stage1_result else [],
-                    stage2_critical=page_stage2_result.get('critical_failures', []) if page_stage2_result else [],
-                    stage3_critical=page_stage3_result.get('critical_failures', []) if page_stage3_result else [],
+                    stage1_critical=page_stage1_result.critical_failures if page_stage1_result else [],
+                    stage2_critical=page_stage2_result.critical_failures if page_stage2_result else [],
+                    stage3_critical=page_stage3_result.critical_failures if page_stage3_result else [],
                     image_path=image_path  # Pass image path for Florence override
                 )
                 
@@ -1255,95 +1604,63 @@ class PipelineOrchestrator:
                         page_has_critical_failures = True
                 
                 # Store page result
-                page_result = {
-                    'page_number': page_num,
-                    'total_pages': len(image_paths),
-                    'final_quality_score': page_final_score,
-                    'has_critical_failures': page_has_critical_failures,
-                    'critical_failures': page_critical_failures,
-                    'warnings': page_warnings,
-                    'status': page_status_info['status'],
-                    'priority': page_status_info['priority'],
-                    'message': page_status_info['message'],
-                    'ocr_confidence': page_ocr_confidence,
-                    'handwriting_percentage': page_handwriting_pct,
-                    'stage_results': page_stage_results
-                }
-                
-                # Add Florence override info if available
-                if florence_info:
-                    page_result['florence_override'] = florence_info
+                page_result = PageResult(
+                    page_number=page_num,
+                    total_pages=len(image_paths),
+                    final_quality_score=page_final_score,
+                    has_critical_failures=page_has_critical_failures,
+                    critical_failures=page_critical_failures,
+                    warnings=page_warnings,
+                    status=page_status_info['status'],
+                    priority=page_status_info['priority'],
+                    message=page_status_info['message'],
+                    ocr_confidence=page_ocr_confidence,
+                    handwriting_percentage=page_handwriting_pct,
+                    stage_results=page_stage_results,
+                    florence_override=florence_info  # Florence override info if available
+                )
                 
                 page_results.append(page_result)
                 
-                # Track best page with special rules:
-                # - 1-page document: Use page 1
-                # - 2-page document: Always use page 2 (content is typically on page 2)
-                # - 3+ page document: Use best page (highest score, no critical failures preferred)
+                page_processed.append(True)
                 
-                # Special handling for 2-page documents: prioritize page 2
-                if len(image_paths) == 2:
-                    if page_num == 2:
-                        # For 2-page documents, always use page 2 as the primary page
-                        best_page_score = page_final_score
-                        best_page_result = page_result
-                        best_page_index = page_idx
-                    # For page 1 of 2-page document, skip (page 2 will be used)
-                elif len(image_paths) == 1:
-                    # For 1-page documents, use page 1
-                    if page_num == 1:
-                        best_page_score = page_final_score
-                        best_page_result = page_result
-                        best_page_index = page_idx
-                else:
-                    # For 3+ page documents, use best page logic
-                    if not page_has_critical_failures:
-                        # This page has no critical failures
-                        if best_page_result is None or best_page_result['has_critical_failures']:
-                            # First page without failures, or previous best had failures
-                            best_page_score = page_final_score
-                            best_page_result = page_result
-                            best_page_index = page_idx
-                        elif page_final_score > best_page_score:
-                            # Both have no failures, use higher score
-                            best_page_score = page_final_score
-                            best_page_result = page_result
-                            best_page_index = page_idx
-                    else:
-                        # This page has critical failures
-                        if best_page_result is None:
-                            # First page processed, use it as best for now
-                            best_page_score = page_final_score
-                            best_page_result = page_result
-                            best_page_index = page_idx
-                        elif best_page_result['has_critical_failures'] and page_final_score > best_page_score:
-                            # Both have failures, use higher score
-                            best_page_score = page_final_score
-                            best_page_result = page_result
-                            best_page_index = page_idx
+                # Stream-reduce: release stage details of pages that can no longer be the best page.
+                # Until a best page exists, every page is kept as a fallback candidate.
+                detail_pages.append(page_result)
+                if self._is_new_best_page(page_result, page_idx, running_best, len(image_paths)):
+                    running_best = page_result
+                if running_best is not None:
+                    for detail_page in detail_pages:
+                        if detail_page is not running_best:
+                            detail_page.stage_results = []
+                    detail_pages = [running_best]
             except Exception as e:
                 # If a page fails to process, log error and continue with other pages
-                logger.error(f"Error processing page {page_num} of {file_path}: {str(e)}", exc_info=True)
-                page_results.append({
-                    'page_number': page_num,
-                    'total_pages': len(image_paths),
-                    'final_quality_score': 0,
-                    'has_critical_failures': True,
-                    'critical_failures': [f'Error processing page {page_num}: {str(e)}'],
-                    'warnings': [],
-                    'status': 'REJECTED',
-                    'priority': 'N/A',
-                    'message': f'Failed to process page {page_num}',
-                    'ocr_confidence': None,
-                    'handwriting_percentage': None,
-                    'stage_results': []
-                })
-        
-        # Ensure we have a best page result
-        if best_page_result is None and page_results:
+                self._log_error("Error processing page %d of %s: %s", page_num, file_path, e, error=e)
+                page_results.append(PageResult(
+                    page_number=page_num,
+                    total_pages=len(image_paths),
+                    final_quality_score=0,
+                    has_critical_failures=True,
+                    critical_failures=[f'Error processing page {page_num}: {str(e)}'],
+                    warnings=[],
+                    status='REJECTED',
+                    priority='N/A',
+                    message=f'Failed to process page {page_num}',
+                    ocr_confidence=None,
+                    handwriting_percentage=None,
+                    stage_results=[]
+                ))
+                page_processed.append(False)
+        
+        # Select best page in one pass over the collected page scores
+        best_page_result = None
+        best_page_index = self._select_best_page_index(page_results, page_processed, len(image_paths))
+        if best_page_index is None and page_results:
             # Fallback: use page with highest score
-            best_page_result = max(page_results, key=lambda x: x['final_quality_score'])
-            best_page_index = page_results.index(best_page_result)
+            best_page_index = int(np.argmax([p.final_quality_score for p in page_results]))
+        if best_page_index is not None:
+            best_page_result = page_results[best_page_index]
         
         # Aggregate results from all pages
         all_critical_failures = []
@@ -1352,15 +1669,16 @@ class PipelineOrchestrator:
         
         # Use best page's stage results for main display
         if best_page_result:
-            stage_results = best_page_result['stage_results']
-            all_critical_failures = best_page_result['critical_failures']
-            all_warnings = best_page_result['warnings']
+            stage_results = best_page_result.stage_results
+            all_critical_failures = best_page_result.critical_failures
+            all_warnings = best_page_result.warnings
         
         # Extract metrics from best page
-        stage1_result = next((r for r in stage_results if 'Basic Quality Checks' in r.get('stage', '')), None)
-        stage2_result = next((r for r in stage_results if 'OCR Confidence Analysis' in r.get('stage', '')), None)
-        stage3_result = next((r for r in stage_results if 'Handwriting Detection' in r.get('stage', '')), None)
-        stage4_result = next((r for r in stage_results if 'BRISQUE' in r.get('stage', '')), None)
+        stage_by_prefix = index_stage_results(stage_results)
+        stage1_result = stage_by_prefix.get('Stage 1')
+        stage2_result = stage_by_prefix.get('Stage 2')
+        stage3_result = stage_by_prefix.get('Stage 3')
+        stage4_result = stage_by_prefix.get('Stage 4')
         
         ocr_confidence = None
         handwriting_pct = None
@@ -1368,16 +1686,16 @@ class PipelineOrchestrator:
         blur_score = None
         resolution = None
         
-        if stage2_result and 'analysis' in stage2_result:
-            ocr_confidence = stage2_result['analysis'].get('average_confidence')
+        if stage2_result:
+            ocr_confidence = stage2_result.analysis.get('average_confidence')
         
-        if stage3_result and 'analysis' in stage3_result:
-            handwriting_analysis = stage3_result['analysis']
+        if stage3_result and stage3_result.analysis:
+            handwriting_analysis = stage3_result.analysis
             handwriting_pct = handwriting_analysis.get('handwriting_percentage')
             handwriting_dist = handwriting_analysis.get('distribution', {})
         
-        if stage1_result and 'checks' in stage1_result:
-            checks = stage1_result['checks']
+        if stage1_result:
+            checks = stage1_result.checks
             if 'blur_details' in checks:
                 blur_score = checks['blur_details'].get('blur_score')
             if 'resolution_details' in checks:
@@ -1385,18 +1703,18 @@ class PipelineOrchestrator:
                 resolution = (res_details.get('width', 0), res_details.get('height', 0))
         
         # Final decision based on best page
-        final_score = best_page_result['final_quality_score'] if best_page_result else 0
-        has_critical_failures = best_page_result['has_critical_failures'] if best_page_result else True
+        final_score = best_page_result.final_quality_score if best_page_result else 0
+        has_critical_failures = best_page_result.has_critical_failures if best_page_result else True
         status_info = {
-            'status': best_page_result['status'] if best_page_result else 'REJECTED',
-            'priority': best_page_result['priority'] if best_page_result else 'N/A',
-            'message': best_page_result['message'] if best_page_result else 'All pages failed quality checks'
+            'status': best_page_result.status if best_page_result else 'REJECTED',
+            'priority': best_page_result.priority if best_page_result else 'N/A',
+            'message': best_page_result.message if best_page_result else 'All pages failed quality checks'
         }
         
         # If multiple pages, update message to indicate which page was used
         if len(image_paths) == 2:
             # For 2-page documents, always check page 2 (content page)
-            if best_page_result and best_page_result['page_number'] == 2:
+            if best_page_result and best_page_result.page_number == 2:
                 if status_info['status'] == 'ACCEPTED':
                     status_info['message'] = f"Document accepted. {status_info['message']}"
                 else:
@@ -1410,7 +1728,7 @@ class PipelineOrchestrator:
                 status_info['message'] = f"Document accepted. {status_info['message']}"
             else:
                 # Check if any page passed
-                passed_pages = [p for p in page_results if p['status'] == 'ACCEPTED']
+                passed_pages = [p for p in page_results if p.status == 'ACCEPTED']
                 if passed_pages:
                     status_info['status'] = 'ACCEPTED'
                     status_info['priority'] = 'Normal'
@@ -1421,13 +1739,8 @@ class PipelineOrchestrator:
         processing_time = round(time.time() - start_time, 2)
         
         # Check if any page had Florence override
-        florence_override_used = False
-        florence_override_info = None
-        for page_result in page_results:
-            if page_result.get('florence_override'):
-                florence_override_used = True
-                florence_override_info = page_result.get('florence_override')
-                break  # Use first override found
+        florence_override_info = next((p.florence_override for p in page_results if p.florence_override), None)  # First override found
+        florence_override_used = florence_override_info is not None
         
         result = {
             'success': True,
@@ -1442,10 +1755,10 @@ class PipelineOrchestrator:
             'status': status_info['status'],
             'priority': status_info['priority'],
             'message': status_info['message'],
-            'rejection_reasons': all_critical_failures + all_warnings if status_info['status'] != 'ACCEPTED' else [],
-            'stage_results': stage_results,
-            'page_results': page_results,  # Results for each page
-            'best_page': best_page_result['page_number'] if best_page_result else 1
+            'rejection_reasons': list(chain(all_critical_failures, all_warnings)) if status_info['status'] != 'ACCEPTED' else [],
+            'stage_results': [r.to_dict() for r in stage_results],
+            'page_results': [p.to_dict() for p in page_results],  # Results for each page
+            'best_page': best_page_result.page_number if best_page_result else 1
         }
         
         # Add Florence override info if used
@@ -0,0 +1,74 @@
+"""
+Page Image
+Decoded page shared by Stages 2-4 so each page is read from disk and converted to grayscale once.
+"""
+
+import cv2
+import numpy as np
+import functools
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class PageImage:
+    """Decoded page image (treat arrays as read-only - they are shared between stages)."""
+    path: str
+    bgr: np.ndarray
+    gray: np.ndarray
+
+
+def load_page_image(image_path: str) -> Optional[PageImage]:
+    """
+    Load a page image, reusing the decoded arrays while the file is unchanged.
+    
+    Args:
+        image_path: Path to the image file
+    
+    Returns:
+        PageImage, or None if the image could not be loaded
+    """
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return None
+    # Modification time and size are part of the key so reused temp paths are not served stale
+    return _decode_page_image(image_path, stat.st_mtime_ns, stat.st_size)
+
+
+def downscale_to_max_dim(image: np.ndarray, max_dim: int) -> np.ndarray:
+    """
+    Shrink an image so its larger side is at most max_dim pixels (area interpolation).
+    
+    Args:
+        image: Image as numpy array
+        max_dim: Maximum size of the larger side (0 or less disables downscaling)
+    
+    Returns:
+        Downscaled image, or the input image if it is already small enough
+    """
+    scale = max_dim / max(image.shape[:2]) if max_dim > 0 else 1.0
+    if scale >= 1.0:
+        return image
+    return cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+
+@functools.lru_cache(maxsize=2)
+def _decode_page_image(image_path: str, mtime_ns: int, size: int) -> Optional[PageImage]:
+    """
+    Decode a page image and convert it to grayscale (cached for the page being processed).
+    
+    Args:
+        image_path: Path to the image file
+        mtime_ns: File modification time (cache key only)
+        size: File size in bytes (cache key only)
+    
+    Returns:
+        PageImage, or None if the image could not be decoded
+    """
+    image = cv2.imread(image_path)
+    if image is None:
+        return None
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+    return PageImage(path=image_path, bgr=image, gray=gray)
@@ -9,26 +9,128 @@ from PIL import Image
 import cv2
 import numpy as np
 from typing import Dict, List
+import contextlib
+import functools
 import os
+import tempfile
+import threading
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+from src.stages.page_image import load_page_image
+from src.stages.stage_result import StageResult
+
+# Optional tesserocr bindings (persistent Tesseract API, no subprocess per page)
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 load_dotenv()
 
+# Number of process_many calls currently running pages in parallel, and the OMP_THREAD_LIMIT
+# to restore once they finish (guarded by the lock)
+_parallel_ocr_calls = 0
+_omp_thread_limit_before = None
+_parallel_ocr_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _single_threaded_tesseract():
+    """
+    Limit Tesseract's OpenMP threads to one while pages are OCR'd in parallel.
+    Tesseract subprocesses (and tesserocr's OpenMP runtime) read OMP_THREAD_LIMIT from the
+    process environment; the previous value is restored once the last parallel call finishes.
+    """
+    global _parallel_ocr_calls, _omp_thread_limit_before
+    with _parallel_ocr_lock:
+        if _parallel_ocr_calls == 0:
+            _omp_thread_limit_before = os.environ.get('OMP_THREAD_LIMIT')
+            os.environ['OMP_THREAD_LIMIT'] = '1'
+        _parallel_ocr_calls += 1
+    try:
+        yield
+    finally:
+        with _parallel_ocr_lock:
+            _parallel_ocr_calls -= 1
+            if _parallel_ocr_calls == 0:
+                if _omp_thread_limit_before is None:
+                    os.environ.pop('OMP_THREAD_LIMIT', None)
+                else:
+                    os.environ['OMP_THREAD_LIMIT'] = _omp_thread_limit_before
+
+
+# Gray levels used for the batched Otsu between-class variance
+OTSU_LEVELS = np.arange(256, dtype=np.float64)
+
+
+def otsu_thresholds(images: List[np.ndarray]) -> np.ndarray:
+    """
+    Compute Otsu thresholds for several 8-bit grayscale images in one vectorized pass.
+    Per-image histograms are stacked into a (B, 256) array and the between-class variance
+    is evaluated for every candidate threshold of every image with cumulative sums.
+    
+    Args:
+        images: 8-bit grayscale images (sizes may differ)
+        
+    Returns:
+        Array of B thresholds, matching cv2.threshold(..., THRESH_OTSU) per image
+    """
+    hist = np.stack([np.bincount(image.ravel(), minlength=256) for image in images]).astype(np.float64)
+    hist /= hist.sum(axis=1, keepdims=True)
+    
+    q1 = hist.cumsum(axis=1)
+    q2 = 1.0 - q1
+    weighted = (hist * OTSU_LEVELS).cumsum(axis=1)
+    mu = weighted[:, -1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mu1 = weighted / q1
+        mu2 = (mu - weighted) / q2
+        sigma_b2 = q1 * q2 * (mu1 - mu2) ** 2
+    # Thresholds leaving one class (almost) empty are skipped, as in OpenCV
+    sigma_b2[(q1 < 1e-12) | (q2 < 1e-12)] = 0.0
+    return sigma_b2.argmax(axis=1)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_thresholds() -> SimpleNamespace:
+    """
+    Parse Stage 2 thresholds from environment variables (cached after the first call).
+    
+    Returns:
+        Namespace of threshold attributes for OCRConfidenceAnalyzer
+    """
+    thresholds = SimpleNamespace()
+    
+    # Critical threshold (immediate reject)
+    thresholds.ocr_critical_threshold = float(os.getenv('OCR_CRITICAL_THRESHOLD', 25))
+    
+    # Warning thresholds (partial credit)
+    thresholds.avg_confidence_threshold = float(os.getenv('OCR_AVG_CONFIDENCE_THRESHOLD', 45))
+    thresholds.high_confidence_words = int(os.getenv('OCR_HIGH_CONFIDENCE_WORDS', 5))
+    thresholds.high_confidence_score = float(os.getenv('OCR_HIGH_CONFIDENCE_SCORE', 70))
+    thresholds.min_text_regions = int(os.getenv('OCR_MIN_TEXT_REGIONS', 2))
+    thresholds.min_characters = int(os.getenv('OCR_MIN_CHARACTERS', 30))
+    
+    # Non-local means denoising before binarization (slow - only for very noisy scans)
+    thresholds.use_nlm_denoise = os.getenv('OCR_USE_NLM_DENOISE', 'false').lower() in ('1', 'true')
+    
+    return thresholds
+
 
 class OCRConfidenceAnalyzer:
     """Analyzes OCR confidence to determine text readability."""
     
     def __init__(self):
         """Initialize thresholds from environment variables."""
-        # Critical threshold (immediate reject)
-        self.ocr_critical_threshold = float(os.getenv('OCR_CRITICAL_THRESHOLD', 25))
+        # Thresholds are parsed from the environment once per process and shared by all instances
+        self.__dict__.update(vars(_load_thresholds()))
         
-        # Warning thresholds (partial credit)
-        self.avg_confidence_threshold = float(os.getenv('OCR_AVG_CONFIDENCE_THRESHOLD', 45))
-        self.high_confidence_words = int(os.getenv('OCR_HIGH_CONFIDENCE_WORDS', 5))
-        self.high_confidence_score = float(os.getenv('OCR_HIGH_CONFIDENCE_SCORE', 70))
-        self.min_text_regions = int(os.getenv('OCR_MIN_TEXT_REGIONS', 2))
-        self.min_characters = int(os.getenv('OCR_MIN_CHARACTERS', 30))
+        # Instances hold no per-page state and can be shared across threads;
+        # tesserocr API handles are not thread-safe - keep one per thread (created on first use)
+        self._tesserocr = threading.local()
     
     def preprocess_image(self, image_path: str) -> np.ndarray:
         """
@@ -40,21 +142,39 @@ class OCRConfidenceAnalyzer:
         Returns:
             Preprocessed image as numpy array
         """
-        image = cv2.imread(image_path)
-        if image is None:
+        denoised = self.denoise_image(image_path)
+        if denoised is None:
             return None
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
-        
-        # Apply denoising
-        denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
-        
         # Apply thresholding
         _, thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         
         return thresh
     
+    def denoise_image(self, image_path: str) -> np.ndarray:
+        """
+        Grayscale and denoise a page ahead of Otsu thresholding.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            Denoised grayscale image, or None if the image could not be loaded
+        """
+        # Shared decode (grayscale conversion done once per page)
+        page = load_page_image(image_path)
+        if page is None:
+            return None
+        gray = page.gray
+        
+        # Apply denoising (Gaussian blur is enough ahead of Otsu; non-local means is far costlier)
+        if self.use_nlm_denoise:
+            denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
+        else:
+            denoised = cv2.GaussianBlur(gray, (5, 5), 0)
+        
+        return denoised
+    
     def get_ocr_data(self, image_path: str) -> Dict:
         """
         Extract OCR data with confidence scores.
@@ -70,11 +190,48 @@ class OCRConfidenceAnalyzer:
         if processed_image is None:
             return None
         
-        # Convert to PIL Image
-        pil_image = Image.fromarray(processed_image)
-        
         # Get OCR data with detailed information
-        ocr_data = pytesseract.image_to_data(pil_image, output_type=pytesseract.Output.DICT)
+        if TESSEROCR_AVAILABLE:
+            return self.get_tesserocr_data(Image.fromarray(processed_image))
+        
+        # Hand Tesseract an uncompressed BMP - pytesseract would re-encode the image as PNG (Deflate)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            page_file = os.path.join(temp_dir, 'page.bmp')
+            cv2.imwrite(page_file, processed_image)
+            ocr_data = pytesseract.image_to_data(page_file, output_type=pytesseract.Output.DICT)
+        
+        return ocr_data
+    
+    def get_tesserocr_data(self, pil_image: Image.Image) -> Dict:
+        """
+        Extract word-level OCR data with a persistent tesserocr API handle.
+        
+        Args:
+            pil_image: Preprocessed page image
+            
+        Returns:
+            Dictionary with 'text', 'conf' and 'block_num' lists (same keys as pytesseract.image_to_data)
+        """
+        api = getattr(self._tesserocr, 'api', None)
+        if api is None:
+            api = PyTessBaseAPI(lang='eng')
+            self._tesserocr.api = api
+        
+        api.SetImage(pil_image)
+        api.Recognize()
+        
+        ocr_data = {'text': [], 'conf': [], 'block_num': []}
+        iterator = api.GetIterator()
+        if iterator is None:  # Nothing recognized
+            return ocr_data
+        
+        block_num = 0
+        for word in iterate_level(iterator, RIL.WORD):
+            if word.IsAtBeginningOf(RIL.BLOCK):
+                block_num += 1
+            ocr_data['text'].append(word.GetUTF8Text(RIL.WORD) or '')
+            ocr_data['conf'].append(int(word.Confidence(RIL.WORD)))
+            ocr_data['block_num'].append(block_num)
         
         return ocr_data
     
@@ -88,30 +245,11 @@ class OCRConfidenceAnalyzer:
         Returns:
             Dictionary with confidence analysis results
         """
-        confidences = []
-        words = []
-        text_regions = set()
-        character_count = 0
+        # Parallel per-token arrays; non-empty text marks a recognized word
+        texts = np.array([str(text).strip() for text in ocr_data['text']], dtype=object)
+        is_word = texts.astype(bool)
         
-        # Extract confidence scores and text
-        for i in range(len(ocr_data['text'])):
-            text = ocr_data['text'][i].strip()
-            conf = int(ocr_data['conf'][i]) if ocr_data['conf'][i] != '-1' else 0
-            
-            if text:  # Non-empty text
-                confidences.append(conf)
-                words.append({
-                    'text': text,
-                    'confidence': conf
-                })
-                character_count += len(text)
-                
-                # Track text regions (blocks)
-                block_num = ocr_data['block_num'][i]
-                if block_num > 0:
-                    text_regions.add(block_num)
-        
-        if not confidences:
+        if not is_word.any():
             return {
                 'average_confidence': 0,
                 'high_confidence_words_count': 0,
@@ -121,19 +259,39 @@ class OCRConfidenceAnalyzer:
                 'words': []
             }
         
-        avg_confidence = np.mean(confidences)
-        high_confidence_words_list = [w for w in words if w['confidence'] >= self.high_confidence_score]
+        # Confidences arrive as ints (pytesseract >= 0.3.8, tesserocr) or strings (older pytesseract);
+        # convert the whole column at once, Tesseract's -1 (no confidence) counts as 0
+        conf_column = ocr_data['conf']
+        if isinstance(conf_column[0], str):
+            confs = np.asarray(conf_column, dtype=np.float64).astype(np.int32)
+        else:
+            confs = np.asarray(conf_column, dtype=np.int32)
+        np.maximum(confs, 0, out=confs)
+        blocks = np.asarray(ocr_data['block_num'], dtype=np.int32)
+        
+        word_texts = texts[is_word]
+        confidences = confs[is_word]
+        word_blocks = blocks[is_word]
+        
+        # Track text regions (blocks)
+        text_regions_count = int(np.unique(word_blocks[word_blocks > 0]).size)
+        character_count = int(sum(map(len, word_texts)))
+        avg_confidence = confidences.mean()
+        high_confidence_words_count = int(np.count_nonzero(confidences >= self.high_confidence_score))
+        
+        # Return first 20 words for debugging
+        words = [{'text': text, 'confidence': int(conf)} for text, conf in zip(word_texts[:20], confidences[:20])]
         
         return {
             'average_confidence': round(avg_confidence, 2),
-            'high_confidence_words_count': len(high_confidence_words_list),
-            'text_regions_count': len(text_regions),
+            'high_confidence_words_count': high_confidence_words_count,
+            'text_regions_count': text_regions_count,
             'character_count': character_count,
-            'total_words': len(words),
-            'words': words[:20]  # Return first 20 words for debugging
+            'total_words': int(word_texts.size),
+            'words': words
         }
     
-    def process(self, image_path: str) -> Dict:
+    def process(self, image_path: str) -> StageResult:
         """
         Run OCR confidence analysis on an image.
         
@@ -141,18 +299,126 @@ class OCRConfidenceAnalyzer:
             image_path: Path to the image file
             
         Returns:
-            Dictionary with overall result and detailed analysis
+            StageResult with overall result and detailed analysis
         """
         # Get OCR data
         ocr_data = self.get_ocr_data(image_path)
         if ocr_data is None:
-            return {
-                'stage': 'Stage 2: OCR Confidence Analysis',
-                'passed': False,
-                'error': 'Could not process image for OCR',
-                'analysis': {}
-            }
+            return StageResult(
+                stage='Stage 2: OCR Confidence Analysis',
+                passed=False,
+                error='Could not process image for OCR'
+            )
+        
+        return self.evaluate_ocr_data(ocr_data)
+    
+    def process_many(self, image_paths: List[str], max_workers: int) -> List[StageResult]:
+        """
+        Run OCR confidence analysis on several pages in parallel.
+        Uses threads: pytesseract waits on a tesseract subprocess and tesserocr releases the GIL
+        during recognition (one API handle per thread), so each page runs a single-threaded
+        Tesseract (OMP_THREAD_LIMIT=1) on its own core.
+        
+        Args:
+            image_paths: Paths to the page images
+            max_workers: Maximum number of pages processed concurrently
+            
+        Returns:
+            List of StageResults in the same order as image_paths
+        """
+        def process_page(image_path: str) -> StageResult:
+            try:
+                return self.process(image_path)
+            except Exception as e:
+                return StageResult(
+                    stage='Stage 2: OCR Confidence Analysis',
+                    passed=False,
+                    error=str(e)
+                )
+        
+        if max_workers <= 1 or len(image_paths) <= 1:
+            return [process_page(image_path) for image_path in image_paths]
+        
+        with _single_threaded_tesseract(), \
+                ThreadPoolExecutor(max_workers=min(max_workers, len(image_paths))) as executor:
+            return list(executor.map(process_page, image_paths))
+    
+    def process_batch(self, image_paths: List[str]) -> List[StageResult]:
+        """
+        Run OCR confidence analysis on several pages with a single Tesseract invocation.
+        Preprocessed pages are written to a temp directory and passed to Tesseract as a
+        list file, so the model is loaded once per batch instead of once per page.
+        
+        Args:
+            image_paths: Paths to the page images
+            
+        Returns:
+            List of StageResults in the same order as image_paths
+        """
+        # tesserocr already keeps Tesseract loaded; a single page gains nothing from batching
+        if TESSEROCR_AVAILABLE or len(image_paths) <= 1:
+            return [self.process(image_path) for image_path in image_paths]
         
+        results = [
+            StageResult(
+                stage='Stage 2: OCR Confidence Analysis',
+                passed=False,
+                error='Could not process image for OCR'
+            )
+            for _ in image_paths
+        ]
+        
+        batch_indices = []  # Position in the list file -> index in image_paths
+        denoised_pages = []
+        for idx, image_path in enumerate(image_paths):
+            denoised = self.denoise_image(image_path)
+            if denoised is not None:
+                batch_indices.append(idx)
+                denoised_pages.append(denoised)
+        
+        if not denoised_pages:
+            return results
+        
+        # Otsu thresholds for the whole batch at once
+        thresholds = otsu_thresholds(denoised_pages)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            batch_files = []
+            for idx, denoised, threshold in zip(batch_indices, denoised_pages, thresholds):
+                _, processed_image = cv2.threshold(denoised, int(threshold), 255, cv2.THRESH_BINARY)
+                page_file = os.path.join(temp_dir, f'page_{idx}.bmp')
+                cv2.imwrite(page_file, processed_image)
+                batch_files.append(page_file)
+            
+            list_file = os.path.join(temp_dir, 'pages.txt')
+            with open(list_file, 'w') as f:
+                f.write('\n'.join(batch_files) + '\n')
+            
+            ocr_data = pytesseract.image_to_data(list_file, output_type=pytesseract.Output.DICT)
+        
+        # Split rows by page (page_num is 1-based position in the list file)
+        pages = [{'text': [], 'conf': [], 'block_num': []} for _ in batch_files]
+        for text, conf, block_num, page_num in zip(ocr_data['text'], ocr_data['conf'], ocr_data['block_num'], ocr_data['page_num']):
+            page = pages[page_num - 1]
+            page['text'].append(text)
+            page['conf'].append(conf)
+            page['block_num'].append(block_num)
+        
+        for idx, page_data in zip(batch_indices, pages):
+            results[idx] = self.evaluate_ocr_data(page_data)
+        
+        return results
+    
+    def evaluate_ocr_data(self, ocr_data: Dict) -> StageResult:
+        """
+        Score a page from its OCR data.
+        
+        Args:
+            ocr_data: OCR data dictionary from Tesseract
+            
+        Returns:
+            StageResult with overall result and detailed analysis
+        """
         # Analyze confidence
         analysis = self.analyze_confidence(ocr_data)
         
@@ -169,16 +435,15 @@ class OCRConfidenceAnalyzer:
                 f"OCR confidence too low ({avg_confidence:.1f}%) - document unreadable. "
                 f"Document may be too dark, overexposed, corrupted, or have broader lines that make text unreadable."
             )
-            return {
-                'stage': 'Stage 2: OCR Confidence Analysis',
-                'passed': False,
-                'stage_score': 0,
-                'critical_failures': critical_failures,
-                'warnings': [],
-                'analysis': analysis,
-                'checks': {},
-                'rejection_reasons': critical_failures
-            }
+            return StageResult(
+                stage='Stage 2: OCR Confidence Analysis',
+                passed=False,
+                stage_score=0,
+                critical_failures=critical_failures,
+                warnings=[],
+                analysis=analysis,
+                rejection_reasons=critical_failures
+            )
         
         # Check all criteria
         checks = {
@@ -207,14 +472,14 @@ class OCRConfidenceAnalyzer:
         other_checks_score = (passed_checks / len(checks)) * 60  # 60% weight
         weighted_score = confidence_score + other_checks_score
         
-        return {
-            'stage': 'Stage 2: OCR Confidence Analysis',
-            'passed': all_passed,
-            'stage_score': round(weighted_score, 2),
-            'critical_failures': critical_failures,
-            'warnings': warnings,
-            'analysis': analysis,
-            'checks': checks,
-            'rejection_reasons': warnings if not all_passed else []
-        }
+        return StageResult(
+            stage='Stage 2: OCR Confidence Analysis',
+            passed=all_passed,
+            stage_score=round(weighted_score, 2),
+            critical_failures=critical_failures,
+            warnings=warnings,
+            analysis=analysis,
+            checks=checks,
+            rejection_reasons=warnings if not all_passed else []
+        )
 
@@ -6,162 +6,224 @@ Processing Time: 0.5-2 seconds per page
 
 import cv2
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+import functools
 import os
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
+from src.stages.page_image import downscale_to_max_dim, load_page_image
+from src.stages.stage_result import StageResult
+
+# Optional Numba JIT for the projection spacing statistics (falls back to NumPy)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 load_dotenv()
 
 
+def _spacing_cv_numpy(projection: np.ndarray, threshold: float, above: bool, min_gap: int) -> float:
+    """NumPy version of spacing_cv (used when Numba is not installed)."""
+    positions = np.where(projection > threshold if above else projection < threshold)[0]
+    spacing = np.diff(positions)
+    spacing = spacing[spacing > min_gap]
+    if len(spacing) == 0 or np.mean(spacing) <= 0:
+        return 0.0
+    return float(np.std(spacing) / np.mean(spacing)) * 100
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def spacing_cv(projection, threshold, above, min_gap):
+        """
+        Coefficient of variation (in %) of the gaps between projection positions above
+        (or below) a threshold, keeping only gaps larger than min_gap. Single pass with
+        a running mean/variance (Welford) instead of where/diff/filter/std temporaries.
+        
+        Returns:
+            Spacing CV in percent, 0.0 if there are no qualifying gaps
+        """
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        previous = -1
+        for i in range(projection.shape[0]):
+            selected = projection[i] > threshold if above else projection[i] < threshold
+            if not selected:
+                continue
+            if previous >= 0:
+                gap = i - previous
+                if gap > min_gap:
+                    count += 1
+                    delta = gap - mean
+                    mean += delta / count
+                    m2 += delta * (gap - mean)
+            previous = i
+        if count == 0 or mean <= 0:
+            return 0.0
+        return np.sqrt(m2 / count) / mean * 100
+else:
+    spacing_cv = _spacing_cv_numpy
+
+
+@functools.lru_cache(maxsize=1)
+def _load_thresholds() -> SimpleNamespace:
+    """
+    Parse Stage 3 thresholds from environment variables (cached after the first call).
+    
+    Returns:
+        Namespace of threshold attributes for HandwritingDetector
+    """
+    thresholds = SimpleNamespace()
+    
+    # Critical threshold (immediate reject) - for spread-out handwriting
+    # Default to 20% for spread-out handwriting (handwritten documents)
+    thresholds.handwriting_critical_threshold = float(os.getenv('HANDWRITING_CRITICAL_THRESHOLD', 20))
+    
+    # Warning threshold (for minor handwriting like signatures)
+    thresholds.handwriting_threshold = float(os.getenv('HANDWRITING_THRESHOLD', 15))
+    
+    # Optionally analyze a downscaled page (0 = full resolution; the pixel thresholds below
+    # are tuned for full-resolution scans, so downscaling shifts the handwriting percentage)
+    thresholds.max_dim = int(os.getenv('HANDWRITING_MAX_DIM', 0))
+    
+    return thresholds
+
+
 class HandwritingDetector:
     """Detects handwriting in documents using traditional CV methods."""
     
     def __init__(self):
         """Initialize thresholds from environment variables."""
-        # Critical threshold (immediate reject) - for spread-out handwriting
-        # Default to 20% for spread-out handwriting (handwritten documents)
-        self.handwriting_critical_threshold = float(os.getenv('HANDWRITING_CRITICAL_THRESHOLD', 20))
-        
-        # Warning threshold (for minor handwriting like signatures)
-        self.handwriting_threshold = float(os.getenv('HANDWRITING_THRESHOLD', 15))
+        # Thresholds are parsed from the environment once per process and shared by all instances
+        self.__dict__.update(vars(_load_thresholds()))
     
-    def analyze_stroke_width(self, image: np.ndarray) -> float:
+    def analyze_stroke_width(self, gray: np.ndarray, edges: Optional[np.ndarray] = None) -> float:
         """
         Analyze stroke width variance (handwriting has more variance).
         
         Args:
-            image: Input image as numpy array
+            gray: Grayscale image as numpy array
+            edges: Precomputed Canny(50, 150) edge map of the image (optional)
             
         Returns:
             Variance score (higher = more handwriting-like)
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
-        
         # Apply edge detection
-        edges = cv2.Canny(gray, 50, 150)
+        if edges is None:
+            edges = cv2.Canny(gray, 50, 150)
         
         # Calculate stroke width using distance transform
         dist_transform = cv2.distanceTransform(edges, cv2.DIST_L2, 5)
         
-        # Get stroke widths (non-zero values)
-        stroke_widths = dist_transform[dist_transform > 0]
-        
-        if len(stroke_widths) == 0:
+        # Stroke widths are the non-zero distances, i.e. exactly the edge pixels - use the
+        # edge map as mask for a single masked mean/std pass
+        if cv2.countNonZero(edges) == 0:
             return 0.0
+        mean, std = (value.item() for value in cv2.meanStdDev(dist_transform, mask=edges))
         
         # Calculate coefficient of variation (std/mean)
-        if np.mean(stroke_widths) > 0:
-            cv_score = (np.std(stroke_widths) / np.mean(stroke_widths)) * 100
+        if mean > 0:
+            cv_score = (std / mean) * 100
         else:
             cv_score = 0.0
         
         return cv_score
     
-    def analyze_baseline_variance(self, image: np.ndarray) -> float:
+    def compute_dark_mask(self, gray: np.ndarray) -> np.ndarray:
+        """
+        Mark dark (text) pixels for the projection profiles.
+        
+        Args:
+            gray: Grayscale image as numpy array
+            
+        Returns:
+            uint8 mask with 1 where gray < 128, else 0
+        """
+        _, dark_mask = cv2.threshold(gray, 127, 1, cv2.THRESH_BINARY_INV)
+        return dark_mask
+    
+    def analyze_baseline_variance(self, gray: np.ndarray, dark_mask: Optional[np.ndarray] = None) -> float:
         """
         Analyze baseline variance (handwriting has wavy baselines).
         
         Args:
-            image: Input image as numpy array
+            gray: Grayscale image as numpy array
+            dark_mask: Precomputed 0/1 mask of pixels below 128 (optional)
             
         Returns:
             Baseline variance score
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
-        
         # Apply horizontal projection to find text lines
-        horizontal_projection = np.sum(gray < 128, axis=1)
+        if dark_mask is None:
+            dark_mask = self.compute_dark_mask(gray)
+        horizontal_projection = cv2.reduce(dark_mask, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel()
         
-        # Find peaks (text lines)
-        threshold = np.max(horizontal_projection) * 0.3
-        peaks = np.where(horizontal_projection > threshold)[0]
+        # Find peaks (text lines) and the variation in their spacing
+        # For printed text, peaks should be evenly spaced
+        threshold = float(np.max(horizontal_projection)) * 0.3
         
-        if len(peaks) < 2:
-            return 0.0
+        # Use coefficient of variation instead of raw variance
+        # This is more robust and less sensitive to document size
+        cv_score = spacing_cv(horizontal_projection, threshold, True, 0)
         
-        # Calculate variance in peak positions
-        # For printed text, peaks should be evenly spaced
-        if len(peaks) > 1:
-            spacing = np.diff(peaks)
-            spacing_variance = np.var(spacing) if len(spacing) > 0 else 0
-            mean_spacing = np.mean(spacing) if len(spacing) > 0 else 1
-            
-            # Use coefficient of variation instead of raw variance
-            # This is more robust and less sensitive to document size
-            if mean_spacing > 0:
-                cv_score = (np.std(spacing) / mean_spacing) * 100
-            else:
-                cv_score = 0.0
-            
-            # Cap the score more reasonably - printed text can have CV up to 30-40%
-            # Only very irregular spacing (CV > 50%) suggests handwriting
-            variance_score = min(cv_score * 1.5, 60)  # Cap at 60 instead of 100
-        else:
-            variance_score = 0.0
+        # Cap the score more reasonably - printed text can have CV up to 30-40%
+        # Only very irregular spacing (CV > 50%) suggests handwriting
+        variance_score = min(cv_score * 1.5, 60)  # Cap at 60 instead of 100
         
         return variance_score
     
-    def analyze_character_spacing(self, image: np.ndarray) -> float:
+    def analyze_character_spacing(self, gray: np.ndarray, dark_mask: Optional[np.ndarray] = None) -> float:
         """
         Analyze character spacing regularity.
         
         Args:
-            image: Input image as numpy array
+            gray: Grayscale image as numpy array
+            dark_mask: Precomputed 0/1 mask of pixels below 128 (optional)
             
         Returns:
             Spacing irregularity score
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
-        
         # Apply vertical projection to find character boundaries
-        vertical_projection = np.sum(gray < 128, axis=0)
-        
-        # Find valleys (spaces between characters)
-        threshold = np.max(vertical_projection) * 0.1
-        valleys = np.where(vertical_projection < threshold)[0]
-        
-        if len(valleys) < 2:
-            return 0.0
-        
-        # Calculate spacing between valleys
-        spacing = np.diff(valleys)
-        spacing = spacing[spacing > 5]  # Filter out very small gaps
-        
-        if len(spacing) == 0:
-            return 0.0
+        if dark_mask is None:
+            dark_mask = self.compute_dark_mask(gray)
+        vertical_projection = cv2.reduce(dark_mask, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel()
         
-        # Calculate coefficient of variation
-        if np.mean(spacing) > 0:
-            cv_score = (np.std(spacing) / np.mean(spacing)) * 100
-        else:
-            cv_score = 0.0
+        # Find valleys (spaces between characters) and the coefficient of variation
+        # of their spacing, filtering out very small gaps (<= 5 px)
+        threshold = float(np.max(vertical_projection)) * 0.1
+        cv_score = spacing_cv(vertical_projection, threshold, False, 5)
         
         return min(cv_score, 100)
     
-    def analyze_connected_components(self, image: np.ndarray) -> float:
+    def analyze_connected_components(self, gray: np.ndarray, binary: Optional[np.ndarray] = None) -> float:
         """
         Analyze connected component characteristics.
         
         Args:
-            image: Input image as numpy array
+            gray: Grayscale image as numpy array
+            binary: Precomputed inverted Otsu binarization of the image (optional)
             
         Returns:
             Handwriting likelihood score
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
-        
         # Threshold
-        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        if binary is None:
+            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
         
-        # Find connected components
-        num_labels, labels, stats, centroids = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        # Find connected components (Bolelli's 8-connectivity labeling; only the stats are used)
+        num_labels, _, stats, _ = cv2.connectedComponentsWithStatsWithAlgorithm(
+            binary, 8, cv2.CV_32S, cv2.CCL_BOLELLI
+        )
         
         if num_labels < 2:
             return 0.0
         
-        # Analyze component sizes and shapes
-        component_areas = stats[1:, cv2.CC_STAT_AREA]  # Skip background
-        component_widths = stats[1:, cv2.CC_STAT_WIDTH]
+        # Analyze component shapes
+        component_widths = stats[1:, cv2.CC_STAT_WIDTH]  # Skip background
         component_heights = stats[1:, cv2.CC_STAT_HEIGHT]
         
         # Calculate aspect ratios
@@ -175,49 +237,49 @@ class HandwritingDetector:
         
         return score
     
-    def analyze_handwriting_distribution(self, image: np.ndarray) -> Dict:
+    def analyze_handwriting_distribution(self, gray: np.ndarray, edges: Optional[np.ndarray] = None) -> Dict:
         """
         Analyze if handwriting is concentrated (signatures/stamps) or spread throughout.
         
         Args:
-            image: Input image as numpy array
+            gray: Grayscale image as numpy array
+            edges: Precomputed Canny(50, 150) edge map of the image (optional)
             
         Returns:
             Dictionary with distribution analysis
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
         height, width = gray.shape
         
-        # Divide image into grid regions
+        # Edge map and distance transform computed once for the whole page and sliced per region
+        if edges is None:
+            edges = cv2.Canny(gray, 50, 150)
+        dist_transform = cv2.distanceTransform(edges, cv2.DIST_L2, 3)
+        
+        # Divide image into grid regions (last row/column absorb the remainder)
         grid_rows, grid_cols = 4, 4
-        region_height = height // grid_rows
-        region_width = width // grid_cols
-        
-        # Analyze each region for handwriting characteristics
-        region_scores = []
-        handwriting_regions = 0
-        
-        for row in range(grid_rows):
-            for col in range(grid_cols):
-                y_start = row * region_height
-                y_end = (row + 1) * region_height if row < grid_rows - 1 else height
-                x_start = col * region_width
-                x_end = (col + 1) * region_width if col < grid_cols - 1 else width
-                
-                region = gray[y_start:y_end, x_start:x_end]
-                
-                # Quick handwriting check for this region
-                # Use stroke width variance as indicator
-                edges = cv2.Canny(region, 50, 150)
-                if np.sum(edges) > 0:
-                    dist_transform = cv2.distanceTransform(edges, cv2.DIST_L2, 3)
-                    stroke_widths = dist_transform[dist_transform > 0]
-                    if len(stroke_widths) > 10:
-                        cv_score = (np.std(stroke_widths) / (np.mean(stroke_widths) + 1e-5)) * 100
-                        region_scores.append(cv_score)
-                        # If region has high handwriting score, count it
-                        if cv_score > 20:  # Threshold for handwriting in region
-                            handwriting_regions += 1
+        row_starts = np.arange(grid_rows) * (height // grid_rows)
+        col_starts = np.arange(grid_cols) * (width // grid_cols)
+        
+        def region_sums(values: np.ndarray) -> np.ndarray:
+            """Sum values over every grid region at once (grid_rows x grid_cols, float64)."""
+            band_sums = np.add.reduceat(values, row_starts, axis=0, dtype=np.float64)
+            return np.add.reduceat(band_sums, col_starts, axis=1)
+        
+        # Quick handwriting check per region: stroke width variance as indicator.
+        # Non-zero distances are exactly the edge pixels, so plain sums over the distance map
+        # give the per-region stroke width sum / sum of squares
+        edge_counts = region_sums(edges > 0)
+        width_sums = region_sums(dist_transform)
+        width_sq_sums = region_sums(cv2.multiply(dist_transform, dist_transform))
+        
+        has_strokes = edge_counts > 10
+        counts = edge_counts[has_strokes]
+        means = width_sums[has_strokes] / counts
+        stds = np.sqrt(np.maximum(width_sq_sums[has_strokes] / counts - means * means, 0.0))
+        region_scores = (stds / (means + 1e-5)) * 100
+        
+        # If region has high handwriting score, count it
+        handwriting_regions = int(np.count_nonzero(region_scores > 20))  # Threshold for handwriting in region
         
         total_regions = grid_rows * grid_cols
         handwriting_region_percentage = (handwriting_regions / total_regions) * 100 if total_regions > 0 else 0
@@ -233,24 +295,29 @@ class HandwritingDetector:
             'handwriting_region_percentage': round(handwriting_region_percentage, 2),
             'is_concentrated': is_concentrated,
             'is_spread_out': is_spread_out,
-            'average_region_score': round(np.mean(region_scores) if region_scores else 0, 2)
+            'average_region_score': round(float(np.mean(region_scores)) if region_scores.size else 0, 2)
         }
     
-    def calculate_handwriting_percentage(self, image: np.ndarray) -> Dict:
+    def calculate_handwriting_percentage(self, gray: np.ndarray) -> Dict:
         """
         Calculate overall handwriting percentage with distribution analysis.
         
         Args:
-            image: Input image as numpy array
+            gray: Grayscale image as numpy array
             
         Returns:
             Dictionary with handwriting analysis results
         """
+        # Shared intermediates - computed once and passed to the analyzers
+        edges = cv2.Canny(gray, 50, 150)
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        dark_mask = self.compute_dark_mask(gray)
+        
         # Get individual scores
-        stroke_score = self.analyze_stroke_width(image)
-        baseline_score = self.analyze_baseline_variance(image)
-        spacing_score = self.analyze_character_spacing(image)
-        component_score = self.analyze_connected_components(image)
+        stroke_score = self.analyze_stroke_width(gray, edges)
+        baseline_score = self.analyze_baseline_variance(gray, dark_mask)
+        spacing_score = self.analyze_character_spacing(gray, dark_mask)
+        component_score = self.analyze_connected_components(gray, binary)
         
         # Weighted average - reduced baseline weight since it's more prone to false positives
         handwriting_percentage = (
@@ -261,7 +328,7 @@ class HandwritingDetector:
         )
         
         # Analyze distribution
-        distribution = self.analyze_handwriting_distribution(image)
+        distribution = self.analyze_handwriting_distribution(gray, edges)
         
         return {
             'handwriting_percentage': round(handwriting_percentage, 2),
@@ -272,7 +339,7 @@ class HandwritingDetector:
             'distribution': distribution
         }
     
-    def process(self, image_path: str) -> Dict:
+    def process(self, image_path: str) -> StageResult:
         """
         Run handwriting detection on an image.
         
@@ -280,20 +347,19 @@ class HandwritingDetector:
             image_path: Path to the image file
             
         Returns:
-            Dictionary with overall result and detailed analysis
+            StageResult with overall result and detailed analysis
         """
-        # Load image
-        image = cv2.imread(image_path)
-        if image is None:
-            return {
-                'stage': 'Stage 3: Handwriting Detection',
-                'passed': False,
-                'error': 'Could not load image',
-                'analysis': {}
-            }
+        # Load image (shared decode - grayscale conversion done once per page)
+        page = load_page_image(image_path)
+        if page is None:
+            return StageResult(
+                stage='Stage 3: Handwriting Detection',
+                passed=False,
+                error='Could not load image'
+            )
         
         # Calculate handwriting percentage with distribution analysis
-        analysis = self.calculate_handwriting_percentage(image)
+        analysis = self.calculate_handwriting_percentage(downscale_to_max_dim(page.gray, self.max_dim))
         
         handwriting_pct = analysis['handwriting_percentage']
         distribution = analysis.get('distribution', {})
@@ -361,14 +427,14 @@ class HandwritingDetector:
             action = 'ACCEPT'
             stage_score = 100
         
-        return {
-            'stage': 'Stage 3: Handwriting Detection',
-            'passed': passed,
-            'action': action,
-            'stage_score': round(stage_score, 2),
-            'critical_failures': critical_failures,
-            'warnings': warnings,
-            'analysis': analysis,
-            'rejection_reasons': critical_failures + warnings
-        }
+        return StageResult(
+            stage='Stage 3: Handwriting Detection',
+            passed=passed,
+            stage_score=round(stage_score, 2),
+            critical_failures=critical_failures,
+            warnings=warnings,
+            analysis=analysis,
+            rejection_reasons=critical_failures + warnings,
+            extra={'action': action}
+        )
 
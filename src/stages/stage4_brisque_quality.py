@@ -6,21 +6,73 @@ Processing Time: 100-200ms
 
 import cv2
 import numpy as np
-from typing import Dict
+import functools
+import logging
 import os
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
+from src.stages.page_image import downscale_to_max_dim, load_page_image
+from src.stages.stage_result import StageResult
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_thresholds() -> SimpleNamespace:
+    """
+    Parse Stage 4 thresholds from environment variables (cached after the first call).
+    
+    Returns:
+        Namespace of threshold attributes for BRISQUEQualityScorer
+    """
+    thresholds = SimpleNamespace()
+    thresholds.brisque_threshold = float(os.getenv('BRISQUE_THRESHOLD', 55))
+    
+    # Optionally compute BRISQUE statistics on a downscaled page (0 = full resolution;
+    # downscaling changes the score)
+    thresholds.max_dim = int(os.getenv('BRISQUE_MAX_DIM', 0))
+    
+    # Trained BRISQUE model for OpenCV's quality module (see opencv_contrib/modules/quality/samples)
+    thresholds.model_path = os.path.abspath(os.getenv('BRISQUE_MODEL_PATH', 'brisque_model.yml'))
+    thresholds.range_path = os.path.abspath(os.getenv('BRISQUE_RANGE_PATH', 'brisque_range.yml'))
+    
+    return thresholds
+
 
 class BRISQUEQualityScorer:
     """Calculates BRISQUE quality score for images."""
     
     def __init__(self):
-        """Initialize threshold from environment variables."""
-        self.brisque_threshold = float(os.getenv('BRISQUE_THRESHOLD', 55))
+        """Initialize thresholds from environment variables."""
+        # Thresholds are parsed from the environment once per process and shared by all instances
+        self.__dict__.update(vars(_load_thresholds()))
+        
+        # SVM model is loaded once and reused for every page
+        self._brisque = self._create_brisque_model()
     
-    def calculate_brisque_score(self, image: np.ndarray) -> float:
+    def _create_brisque_model(self):
+        """
+        Load OpenCV's BRISQUE model from model_path / range_path.
+        
+        Returns:
+            cv2.quality.QualityBRISQUE instance, or None if the model cannot be loaded
+        """
+        if not (os.path.isfile(self.model_path) and os.path.isfile(self.range_path)):
+            logger.warning(
+                f"BRISQUE model files not found ({self.model_path}, {self.range_path}) - "
+                f"using the simplified (slower) BRISQUE fallback"
+            )
+            return None
+        try:
+            return cv2.quality.QualityBRISQUE_create(self.model_path, self.range_path)
+        except (AttributeError, cv2.error) as e:
+            logger.warning(f"Could not load BRISQUE model, using the simplified BRISQUE fallback: {e}")
+            return None
+    
+    def calculate_brisque_score(self, image: np.ndarray, gray: np.ndarray) -> float:
         """
         Calculate BRISQUE (Blind/Referenceless Image Spatial Quality Evaluator) score.
         
@@ -29,42 +81,46 @@ class BRISQUEQualityScorer:
         
         Args:
             image: Input image as numpy array
+            gray: Grayscale version of the image
             
         Returns:
             BRISQUE score (lower is better, 0-100 scale)
         """
-        try:
-            # Try to use OpenCV's quality module
-            quality = cv2.quality.QualityBRISQUE_compute(image, "brisque_model.yml", "brisque_range.yml")
-            if quality is not None and len(quality) > 0:
-                return float(quality[0])
-        except:
-            pass
+        if self._brisque is not None:
+            try:
+                # OpenCV's quality module with the preloaded model
+                quality = self._brisque.compute(image)
+                if quality is not None and len(quality) > 0:
+                    return float(quality[0])
+            except cv2.error as e:
+                logger.warning(f"OpenCV BRISQUE failed, using the simplified fallback: {e}")
         
         # Fallback: Simplified BRISQUE-like calculation
-        # Convert to grayscale if needed
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
-        
         # Normalize to 0-1 range
-        gray_norm = gray.astype(np.float32) / 255.0
+        # (all intermediates below are computed in place in three float32 buffers)
+        gray_norm = gray.astype(np.float32)
+        gray_norm /= 255.0
         
         # Calculate natural scene statistics
         # Mean subtracted contrast normalized (MSCN) coefficients
         mu = cv2.GaussianBlur(gray_norm, (7, 7), 7/6)
-        mu_sq = mu * mu
-        sigma_sq = cv2.GaussianBlur(gray_norm * gray_norm, (7, 7), 7/6)
-        sigma = np.sqrt(np.abs(sigma_sq - mu_sq) + 1e-10)
-        struct = (gray_norm - mu) / sigma
-        
-        # Calculate horizontal and vertical pairwise products
-        h_pair = struct[:, :-1] * struct[:, 1:]
-        v_pair = struct[:-1, :] * struct[1:, :]
+        sigma = np.multiply(gray_norm, gray_norm)
+        cv2.GaussianBlur(sigma, (7, 7), 7/6, dst=sigma)  # sigma_sq
+        mu_sq = np.multiply(mu, mu)
+        cv2.absdiff(sigma, mu_sq, dst=sigma)
+        sigma += 1e-10
+        cv2.sqrt(sigma, dst=sigma)
+        struct = np.subtract(gray_norm, mu, out=gray_norm)
+        np.divide(struct, sigma, out=struct)
+        
+        # Calculate horizontal and vertical pairwise products (reusing the mu_sq and mu buffers)
+        h_pair = np.multiply(struct[:, :-1], struct[:, 1:], out=mu_sq[:, :-1])
+        v_pair = np.multiply(struct[:-1, :], struct[1:, :], out=mu[:-1, :])
         
         # Calculate statistics (these should be small values for natural images)
-        h_mean = np.mean(h_pair)
-        h_std = np.std(h_pair)
-        v_mean = np.mean(v_pair)
-        v_std = np.std(v_pair)
+        # Mean and std in a single pass per array
+        h_mean, h_std = (value.item() for value in cv2.meanStdDev(h_pair))
+        v_mean, v_std = (value.item() for value in cv2.meanStdDev(v_pair))
         
         # Simplified BRISQUE score (higher = worse quality)
         # For natural images, these statistics are typically small
@@ -78,7 +134,7 @@ class BRISQUEQualityScorer:
         
         return score
     
-    def process(self, image_path: str) -> Dict:
+    def process(self, image_path: str) -> StageResult:
         """
         Run BRISQUE quality assessment on an image.
         
@@ -86,20 +142,22 @@ class BRISQUEQualityScorer:
             image_path: Path to the image file
             
         Returns:
-            Dictionary with overall result and quality score
+            StageResult with overall result and quality score
         """
-        # Load image
-        image = cv2.imread(image_path)
-        if image is None:
-            return {
-                'stage': 'Stage 4: Overall Quality Score (BRISQUE)',
-                'passed': False,
-                'error': 'Could not load image',
-                'score': 0
-            }
+        # Load image (shared decode - grayscale conversion done once per page)
+        page = load_page_image(image_path)
+        if page is None:
+            return StageResult(
+                stage='Stage 4: Overall Quality Score (BRISQUE)',
+                passed=False,
+                error='Could not load image',
+                extra={'score': 0}
+            )
         
         # Calculate BRISQUE score
-        brisque_score = self.calculate_brisque_score(image)
+        # The color page is only read by OpenCV's BRISQUE model - the fallback uses gray alone
+        bgr = downscale_to_max_dim(page.bgr, self.max_dim) if self._brisque is not None else page.bgr
+        brisque_score = self.calculate_brisque_score(bgr, downscale_to_max_dim(page.gray, self.max_dim))
         
         # Convert to quality score (0-100, higher = better)
         # Inverse of BRISQUE score
@@ -122,14 +180,13 @@ class BRISQUEQualityScorer:
         else:
             quality_level = 'Excellent'
         
-        return {
-            'stage': 'Stage 4: Overall Quality Score (BRISQUE)',
-            'passed': passed,
-            'brisque_score': round(brisque_score, 2),
-            'quality_level': quality_level,
-            'stage_score': round(quality_score, 2),
-            'critical_failures': [],
-            'warnings': warnings,
-            'rejection_reasons': warnings if not passed else []
-        }
+        return StageResult(
+            stage='Stage 4: Overall Quality Score (BRISQUE)',
+            passed=passed,
+            stage_score=round(quality_score, 2),
+            critical_failures=[],
+            warnings=warnings,
+            rejection_reasons=warnings if not passed else [],
+            extra={'brisque_score': round(brisque_score, 2), 'quality_level': quality_level}
+        )
 
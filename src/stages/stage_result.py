@@ -0,0 +1,53 @@
+"""
+Stage Result
+Common result type returned by all pipeline stages.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass(slots=True)
+class StageResult:
+    """Result of a single pipeline stage (serialized with to_dict() for API responses)."""
+    stage: str
+    passed: bool
+    stage_score: float = 0
+    critical_failures: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    analysis: Dict = field(default_factory=dict)
+    checks: Dict = field(default_factory=dict)
+    rejection_reasons: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    extra: Dict = field(default_factory=dict)  # Stage-specific fields (e.g. action, brisque_score)
+
+    def to_dict(self) -> Dict:
+        """Convert to the stage result dictionary returned by the API."""
+        if self.error is not None:
+            # Error results keep their original shape (no score or rejection reasons)
+            result = {
+                'stage': self.stage,
+                'passed': self.passed,
+                'critical_failures': self.critical_failures,
+                'warnings': self.warnings
+            }
+        else:
+            result = {
+                'stage': self.stage,
+                'passed': self.passed,
+                'stage_score': self.stage_score,
+                'critical_failures': self.critical_failures,
+                'warnings': self.warnings,
+                'rejection_reasons': self.rejection_reasons
+            }
+
+        # Only include optional sections when populated
+        if self.analysis:
+            result['analysis'] = self.analysis
+        if self.checks:
+            result['checks'] = self.checks
+        if self.error is not None:
+            result['error'] = self.error
+        result.update(self.extra)
+
+        return result
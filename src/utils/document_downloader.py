@@ -3,20 +3,144 @@ Document Downloader Utility
 Downloads documents from URLs for processing.
 """
 
+import functools
 import os
+import shutil
+import socket
+import tempfile
+import time
 import uuid
 import requests
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Tuple
+from urllib3.util import connection as urllib3_connection
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Seconds a cached DNS answer is reused
+DNS_CACHE_TTL = 300
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve(host: str, port: int, family: int, ttl_bucket: int) -> Tuple:
+    """
+    Resolve a host with getaddrinfo (memoized; ttl_bucket expires entries every DNS_CACHE_TTL seconds).
+    
+    Args:
+        host: Host name
+        port: Port number
+        family: Address family allowed by urllib3
+        ttl_bucket: time.monotonic() // DNS_CACHE_TTL (cache key only)
+        
+    Returns:
+        Tuple of getaddrinfo results
+    """
+    return tuple(socket.getaddrinfo(host, port, family, socket.SOCK_STREAM))
+
+
+_create_connection = urllib3_connection.create_connection
+
+
+def _create_connection_cached_dns(address, *args, **kwargs):
+    """urllib3 create_connection that connects to cached DNS answers (TLS still uses the host name for SNI)."""
+    host, port = address
+    addresses = _resolve(host, port, urllib3_connection.allowed_gai_family(), int(time.monotonic() // DNS_CACHE_TTL))
+    error = None
+    for *_, sockaddr in addresses:
+        try:
+            return _create_connection((sockaddr[0], port), *args, **kwargs)
+        except OSError as e:
+            error = e
+    if error is not None:
+        raise error
+    raise OSError(f"getaddrinfo returns an empty list for {host}")
+
+
+def enable_dns_cache():
+    """Route urllib3 (and so requests) connections through the cached resolver."""
+    urllib3_connection.create_connection = _create_connection_cached_dns
+
+
+class _SizeLimitedReader:
+    """File-like wrapper that stops reading after a byte limit (for shutil.copyfileobj)."""
+    
+    def __init__(self, raw, limit: int):
+        self.raw = raw
+        self.remaining = limit
+    
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b''
+        size = self.remaining if size is None or size < 0 else min(size, self.remaining)
+        data = self.raw.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+@functools.lru_cache(maxsize=1024)
+def _extension_from_url(url: str) -> Optional[str]:
+    """
+    Extract a supported document extension from a URL path (memoized).
+    
+    Args:
+        url: Document URL
+        
+    Returns:
+        File extension (without dot) or None
+    """
+    parsed = urlparse(url)
+    path = parsed.path
+    
+    # Try to get extension from path
+    if '.' in path:
+        ext = path.rsplit('.', 1)[1].lower()
+        # Remove query parameters if any
+        if '?' in ext:
+            ext = ext.split('?')[0]
+        # Common document extensions
+        if ext in ['pdf', 'png', 'jpg', 'jpeg', 'bmp', 'tiff', 'tif']:
+            return ext
+    
+    # Try to get from Content-Type header (will be checked in download)
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _extension_from_content_type(content_type: str) -> Optional[str]:
+    """
+    Map a Content-Type header value to a file extension (memoized).
+    
+    Args:
+        content_type: HTTP Content-Type header value
+        
+    Returns:
+        File extension (without dot) or None
+    """
+    content_type_map = {
+        'application/pdf': 'pdf',
+        'image/png': 'png',
+        'image/jpeg': 'jpg',
+        'image/jpg': 'jpg',
+        'image/bmp': 'bmp',
+        'image/tiff': 'tiff',
+        'image/tif': 'tif'
+    }
+    
+    # Remove charset and other parameters
+    content_type = content_type.split(';')[0].strip().lower()
+    return content_type_map.get(content_type)
+
+
 class DocumentDownloader:
     """Downloads documents from URLs."""
     
-    def __init__(self, download_folder: str = 'downloads', timeout: int = 30, max_size: int = 10485760):
+    def __init__(self, download_folder: str = 'downloads', timeout: int = 30, max_size: int = 10485760,
+                 chunk_size: int = 65536, preflight: bool = False, dns_cache: bool = False):
         """
         Initialize document downloader.
         
@@ -24,14 +148,40 @@ class DocumentDownloader:
             download_folder: Directory to save downloaded files
             timeout: Request timeout in seconds (default: 30)
             max_size: Maximum file size in bytes (default: 10MB)
+            chunk_size: Read size in bytes while streaming a download (default: 64KB)
+            preflight: Send a HEAD request first and reject oversized files without downloading any body
+            dns_cache: Cache DNS answers for DNS_CACHE_TTL seconds (process-wide, affects all urllib3 connections)
         """
         self.download_folder = download_folder
         self.timeout = timeout
         self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.preflight = preflight
+        
+        if dns_cache:
+            enable_dns_cache()
+        
+        # Shared session: keep-alive connection pool per host (reuses TCP/TLS connections)
+        # and retries for transient gateway errors
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Create download folder if it doesn't exist
         os.makedirs(self.download_folder, exist_ok=True)
     
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+    
     def get_file_extension_from_url(self, url: str) -> Optional[str]:
         """
         Extract file extension from URL.
@@ -43,21 +193,7 @@ class DocumentDownloader:
             File extension (without dot) or None
         """
         try:
-            parsed = urlparse(url)
-            path = parsed.path
-            
-            # Try to get extension from path
-            if '.' in path:
-                ext = path.rsplit('.', 1)[1].lower()
-                # Remove query parameters if any
-                if '?' in ext:
-                    ext = ext.split('?')[0]
-                # Common document extensions
-                if ext in ['pdf', 'png', 'jpg', 'jpeg', 'bmp', 'tiff', 'tif']:
-                    return ext
-            
-            # Try to get from Content-Type header (will be checked in download)
-            return None
+            return _extension_from_url(url)
         except Exception as e:
             logger.warning(f"Error extracting extension from URL {url}: {e}")
             return None
@@ -72,19 +208,7 @@ class DocumentDownloader:
         Returns:
             File extension (without dot) or None
         """
-        content_type_map = {
-            'application/pdf': 'pdf',
-            'image/png': 'png',
-            'image/jpeg': 'jpg',
-            'image/jpg': 'jpg',
-            'image/bmp': 'bmp',
-            'image/tiff': 'tiff',
-            'image/tif': 'tif'
-        }
-        
-        # Remove charset and other parameters
-        content_type = content_type.split(';')[0].strip().lower()
-        return content_type_map.get(content_type)
+        return _extension_from_content_type(content_type)
     
     def download_document(self, url: str, filename: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -107,69 +231,21 @@ class DocumentDownloader:
             if not parsed.scheme or not parsed.netloc:
                 return None, "Invalid URL format"
             
-            # Make request with streaming to handle large files
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            # Reject oversized files from the HEAD response without transferring any body
+            if self.preflight:
+                size = self._preflight_size(url)
+                if size is not None and size > self.max_size:
+                    return None, f"File too large ({size / 1024 / 1024:.2f}MB). Maximum size: {self.max_size / 1024 / 1024:.2f}MB"
             
-            response = requests.get(
+            # Make request with streaming to handle large files (closing the response
+            # returns the connection to the session pool)
+            with self.session.get(
                 url,
-                headers=headers,
                 timeout=self.timeout,
                 stream=True,
                 allow_redirects=True
-            )
-            
-            # Check status code
-            response.raise_for_status()
-            
-            # Check Content-Length if available
-            content_length = response.headers.get('Content-Length')
-            if content_length:
-                size = int(content_length)
-                if size > self.max_size:
-                    return None, f"File too large ({size / 1024 / 1024:.2f}MB). Maximum size: {self.max_size / 1024 / 1024:.2f}MB"
-            
-            # Determine file extension
-            file_extension = None
-            
-            # Try to get from URL first
-            file_extension = self.get_file_extension_from_url(url)
-            
-            # If not found, try Content-Type header
-            if not file_extension:
-                content_type = response.headers.get('Content-Type', '')
-                file_extension = self.get_file_extension_from_content_type(content_type)
-            
-            # Default to pdf if still not found
-            if not file_extension:
-                file_extension = 'pdf'
-                logger.warning(f"Could not determine file type from URL or headers, defaulting to PDF")
-            
-            # Generate filename
-            if filename:
-                unique_filename = f"{filename}.{file_extension}"
-            else:
-                unique_filename = f"{uuid.uuid4()}.{file_extension}"
-            
-            file_path = os.path.join(self.download_folder, unique_filename)
-            
-            # Download file in chunks to handle large files and check size
-            downloaded_size = 0
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-                        
-                        # Check size during download
-                        if downloaded_size > self.max_size:
-                            os.remove(file_path)
-                            return None, f"File too large ({downloaded_size / 1024 / 1024:.2f}MB). Maximum size: {self.max_size / 1024 / 1024:.2f}MB"
-            
-            logger.info(f"Successfully downloaded document: {url} -> {file_path} ({downloaded_size / 1024:.2f}KB)")
-            
-            return file_path, None
+            ) as response:
+                return self._save_response(url, response, filename)
             
         except requests.exceptions.Timeout:
             return None, f"Request timeout after {self.timeout} seconds"
@@ -183,6 +259,122 @@ class DocumentDownloader:
             logger.error(f"Error downloading document from {url}: {str(e)}", exc_info=True)
             return None, f"Download error: {str(e)}"
     
+    def _preflight_size(self, url: str) -> Optional[int]:
+        """
+        Get the document size from a HEAD request.
+        
+        Args:
+            url: Document URL
+            
+        Returns:
+            Content-Length in bytes, or None if HEAD is not allowed or gives no size
+            (the streamed GET then enforces the limit)
+        """
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            content_length = response.headers.get('Content-Length')
+            if response.ok and content_length:
+                return int(content_length)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.debug(f"HEAD preflight failed for {url}, falling back to GET: {e}")
+        return None
+    
+    def download_many(self, urls: List[str], filenames: Optional[List[Optional[str]]] = None,
+                      max_workers: int = 16) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Download several documents concurrently through the shared session.
+        
+        Args:
+            urls: Document URLs
+            filenames: Optional custom filenames (without extension), one per URL
+            max_workers: Maximum number of concurrent downloads (at most the pool size of 64)
+            
+        Returns:
+            List of (file_path, error_message) tuples in the same order as urls
+        """
+        if filenames is None:
+            filenames = [None] * len(urls)
+        if not urls:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, 64, len(urls)))) as executor:
+            return list(executor.map(self.download_document, urls, filenames))
+    
+    def _save_response(self, url: str, response: requests.Response, filename: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Validate a streamed response and write its body to the download folder.
+        
+        Args:
+            url: Document URL
+            response: Streamed response for the URL
+            filename: Optional custom filename (without extension)
+            
+        Returns:
+            Tuple of (file_path, error_message)
+        """
+        # Check status code
+        response.raise_for_status()
+        
+        # Check Content-Length if available
+        content_length = response.headers.get('Content-Length')
+        if content_length:
+            size = int(content_length)
+            if size > self.max_size:
+                return None, f"File too large ({size / 1024 / 1024:.2f}MB). Maximum size: {self.max_size / 1024 / 1024:.2f}MB"
+        
+        # Determine file extension
+        file_extension = None
+        
+        # Try to get from URL first
+        file_extension = self.get_file_extension_from_url(url)
+        
+        # If not found, try Content-Type header
+        if not file_extension:
+            content_type = response.headers.get('Content-Type', '')
+            file_extension = self.get_file_extension_from_content_type(content_type)
+        
+        # Default to pdf if still not found
+        if not file_extension:
+            file_extension = 'pdf'
+            logger.warning(f"Could not determine file type from URL or headers, defaulting to PDF")
+        
+        # Generate filename
+        if filename:
+            unique_filename = f"{filename}.{file_extension}"
+        else:
+            unique_filename = f"{uuid.uuid4()}.{file_extension}"
+        
+        file_path = os.path.join(self.download_folder, unique_filename)
+        
+        # Stream the (decoded) body straight to disk in C; reading stops one byte past
+        # max_size so oversized files are detected without downloading them completely.
+        # The body goes to a .part file that only replaces file_path once complete, so a
+        # truncated or oversized download is never visible under the final name. Each download
+        # gets its own .part file, so concurrent downloads sharing a custom filename never interleave
+        part_fd, part_path = tempfile.mkstemp(dir=self.download_folder, prefix=f"{unique_filename}.", suffix='.part')
+        response.raw.decode_content = True
+        try:
+            with os.fdopen(part_fd, 'wb', buffering=1024 * 1024) as f:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                shutil.copyfileobj(_SizeLimitedReader(response.raw, self.max_size + 1), f, length=self.chunk_size)
+                downloaded_size = f.tell()
+            
+            # Check size after download
+            if downloaded_size > self.max_size:
+                os.remove(part_path)
+                return None, f"File too large (more than {self.max_size / 1024 / 1024:.2f}MB). Maximum size: {self.max_size / 1024 / 1024:.2f}MB"
+            
+            os.replace(part_path, file_path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        
+        logger.info(f"Successfully downloaded document: {url} -> {file_path} ({downloaded_size / 1024:.2f}KB)")
+        
+        return file_path, None
+    
     def cleanup_file(self, file_path: str):
         """
         Delete downloaded file.
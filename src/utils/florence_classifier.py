@@ -4,15 +4,95 @@ Modular component for detecting false positive handwriting classifications.
 Only loads model when first used (lazy loading).
 """
 
+import copy
+import hashlib
+import threading
 import torch
 from PIL import Image
 from transformers import AutoProcessor, AutoModelForCausalLM
 import logging
 import os
-from typing import Dict, Union, Optional
+import re
+from collections import OrderedDict
+from typing import Dict, List, Union, Optional
+
+# Optional Aho-Corasick automaton for keyword matching (falls back to a compiled regex)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Keywords indicating printed documents (strong signals)
+PRINTED_KEYWORDS_STRONG = frozenset([
+    'printed', 'typed', 'computer-generated', 'digital',
+    'system-generated', 'form', 'official document',
+    'certificate', 'template', 'scanned document'
+])
+
+PRINTED_KEYWORDS_WEAK = frozenset([
+    'document', 'pdf', 'text', 'stamp', 'seal'
+])
+
+# Keywords indicating handwritten (strong signals)
+HANDWRITTEN_KEYWORDS_STRONG = frozenset([
+    'handwritten', 'handwriting', 'written by hand',
+    'manuscript', 'cursive', 'script', 'hand-drawn',
+    'written manually', 'hand written'
+])
+
+HANDWRITTEN_KEYWORDS_WEAK = frozenset([
+    'pen', 'pencil', 'ink', 'written'
+])
+
+# Markers for mixed documents (signatures/stamps on printed text)
+SIGNATURE_KEYWORDS = frozenset(['signature', 'signed', 'stamp', 'seal'])
+PRINTED_TEXT_KEYWORDS = frozenset(['text', 'printed', 'typed', 'form', 'document'])
+
+_ALL_KEYWORDS = (
+    PRINTED_KEYWORDS_STRONG | PRINTED_KEYWORDS_WEAK | HANDWRITTEN_KEYWORDS_STRONG |
+    HANDWRITTEN_KEYWORDS_WEAK | SIGNATURE_KEYWORDS | PRINTED_TEXT_KEYWORDS
+)
+
+# One case-insensitive pass finds the longest keyword starting at every position (zero-width
+# lookahead, so overlapping keywords are all seen); keywords nested in a match (e.g. 'pen' in
+# 'pencil', 'written' in 'handwritten') are added through _CONTAINED_KEYWORDS
+_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kw in sorted(_ALL_KEYWORDS, key=len, reverse=True)) + '))',
+    re.IGNORECASE
+)
+_CONTAINED_KEYWORDS = {
+    kw: frozenset(other for other in _ALL_KEYWORDS if other in kw) for kw in _ALL_KEYWORDS
+}
+
+# Aho-Corasick reports every (overlapping, nested) keyword occurrence in one linear scan
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _ALL_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+
+def find_keywords(text: str) -> frozenset:
+    """
+    Find which classification keywords occur in a text (case-insensitive substring match).
+    
+    Args:
+        text: Florence output text
+        
+    Returns:
+        Set of keywords present in the text
+    """
+    if AHOCORASICK_AVAILABLE:
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text.lower()))
+    
+    present = set()
+    for match in set(_KEYWORD_RE.findall(text)):
+        present |= _CONTAINED_KEYWORDS[match.lower()]
+    return frozenset(present)
+
 
 class FlorenceHandwritingClassifier:
     """
@@ -22,20 +102,32 @@ class FlorenceHandwritingClassifier:
     This is a modular component that can be enabled/disabled via configuration.
     """
     
-    def __init__(self, model_name: str = "microsoft/Florence-2-base", enabled: bool = True):
+    def __init__(self, model_name: str = "microsoft/Florence-2-base", enabled: bool = True,
+                 cache_size: int = 256, compile_mode: Optional[str] = None):
         """
         Initialize Florence classifier.
         
         Args:
             model_name: HuggingFace model name
             enabled: Whether Florence classification is enabled
+            cache_size: Number of classifications kept per image content hash (0 disables)
+            compile_mode: torch.compile mode for the model's forward passes (None = not compiled)
         """
         self.model = None
         self.processor = None
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        # Half precision on GPU (halves weight bandwidth, uses tensor cores); fp32 on CPU
+        self.dtype = torch.float16 if self.device == "cuda" else torch.float32
         self.model_name = model_name
         self.enabled = enabled
         self._model_loaded = False
+        self._use_kv_cache = True  # Switched off if generation with past_key_values fails
+        self.compile_mode = compile_mode
+        
+        # LRU cache of classification results keyed by (image hash, prompt)
+        self.cache_size = cache_size
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
         
     def _load_model(self):
         """Lazy load model on first use"""
@@ -67,31 +159,23 @@ class FlorenceHandwritingClassifier:
                     raise ImportError(error_msg)
                 
                 # Dependencies available, proceed with model loading
-                # Set environment variable to avoid SDPA compatibility issues
-                import os as os_module
-                original_attn = os_module.environ.get('TRANSFORMERS_ATTENTION_IMPLEMENTATION', None)
-                os_module.environ['TRANSFORMERS_ATTENTION_IMPLEMENTATION'] = 'eager'
-                
+                # Prefer fused SDPA attention; fall back to eager attention where SDPA is not supported
                 try:
-                    self.model = AutoModelForCausalLM.from_pretrained(
-                        self.model_name,
-                        trust_remote_code=True,
-                        attn_implementation="eager"  # Use eager attention to avoid SDPA issues
-                    ).to(self.device)
-                    
-                    self.processor = AutoProcessor.from_pretrained(
-                        self.model_name,
-                        trust_remote_code=True
-                    )
-                    self._model_loaded = True
-                    logger.info(f"Florence model loaded successfully on {self.device}")
-                    return True
-                finally:
-                    # Restore original environment variable
-                    if original_attn is not None:
-                        os_module.environ['TRANSFORMERS_ATTENTION_IMPLEMENTATION'] = original_attn
-                    elif 'TRANSFORMERS_ATTENTION_IMPLEMENTATION' in os_module.environ:
-                        del os_module.environ['TRANSFORMERS_ATTENTION_IMPLEMENTATION']
+                    self.model = self._load_pretrained("sdpa")
+                except Exception as e:
+                    logger.warning(f"SDPA attention not available for Florence-2, using eager attention: {e}")
+                    self.model = self._load_pretrained("eager")
+                
+                if self.compile_mode:
+                    self._compile_model()
+                
+                self.processor = AutoProcessor.from_pretrained(
+                    self.model_name,
+                    trust_remote_code=True
+                )
+                self._model_loaded = True
+                logger.info(f"Florence model loaded successfully on {self.device} ({self.dtype})")
+                return True
             except ImportError as e:
                 # Missing dependencies - don't log as error, just warn
                 logger.warning(f"Florence-2 dependencies missing: {e}")
@@ -105,14 +189,82 @@ class FlorenceHandwritingClassifier:
                 return False
         return self._model_loaded
     
+    def _load_pretrained(self, attn_implementation: str):
+        """
+        Load the Florence-2 weights on the target device and dtype.
+        
+        Args:
+            attn_implementation: Attention implementation ('sdpa' or 'eager')
+            
+        Returns:
+            Model in eval mode
+        """
+        # Set environment variable as well - the remote Florence code reads it
+        import os as os_module
+        original_attn = os_module.environ.get('TRANSFORMERS_ATTENTION_IMPLEMENTATION', None)
+        os_module.environ['TRANSFORMERS_ATTENTION_IMPLEMENTATION'] = attn_implementation
+        
+        try:
+            return AutoModelForCausalLM.from_pretrained(
+                self.model_name,
+                trust_remote_code=True,
+                torch_dtype=self.dtype,
+                attn_implementation=attn_implementation
+            ).to(self.device).eval()
+        finally:
+            # Restore original environment variable
+            if original_attn is not None:
+                os_module.environ['TRANSFORMERS_ATTENTION_IMPLEMENTATION'] = original_attn
+            elif 'TRANSFORMERS_ATTENTION_IMPLEMENTATION' in os_module.environ:
+                del os_module.environ['TRANSFORMERS_ATTENTION_IMPLEMENTATION']
+    
+    def _compile_model(self):
+        """
+        Compile the forward passes used by generate() with TorchInductor (fused kernels, less
+        Python overhead per op). Compilation happens lazily on the first classification;
+        the eager model is kept if torch.compile is unavailable.
+        """
+        try:
+            # generate() is driven by the language model's forward; the vision tower runs once per image
+            modules = [getattr(self.model, 'language_model', None), getattr(self.model, 'vision_tower', None)]
+            for module in [module for module in modules if module is not None] or [self.model]:
+                module.forward = torch.compile(module.forward, mode=self.compile_mode, fullgraph=False)
+            logger.info(f"Florence model compiled with torch.compile (mode={self.compile_mode})")
+        except Exception as e:
+            logger.warning(f"torch.compile not available for Florence-2, using the eager model: {e}")
+    
+    def _image_hash(self, image_path_or_pil: Union[str, Image.Image]) -> Optional[str]:
+        """
+        Content hash of an image file or PIL image (cache key).
+        
+        Args:
+            image_path_or_pil: Path to image or PIL Image object
+            
+        Returns:
+            Hex digest, or None if the image cannot be read
+        """
+        try:
+            hasher = hashlib.sha1()
+            if isinstance(image_path_or_pil, str):
+                with open(image_path_or_pil, 'rb') as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b''):
+                        hasher.update(block)
+            else:
+                hasher.update(f"{image_path_or_pil.mode}:{image_path_or_pil.size}".encode())
+                hasher.update(image_path_or_pil.tobytes())
+            return hasher.hexdigest()
+        except (OSError, ValueError):
+            return None
+    
     def classify_document(self, image_path_or_pil: Union[str, Image.Image], 
-                         prompt: Optional[str] = None) -> Dict:
+                         prompt: Optional[str] = None, use_cache: bool = True) -> Dict:
         """
         Classify if document is handwritten or printed.
         
         Args:
             image_path_or_pil: Path to image or PIL Image object
             prompt: Custom prompt (optional, uses default if None)
+            use_cache: Reuse the result of an earlier classification of identical image content
             
         Returns:
             dict with keys:
@@ -122,74 +274,198 @@ class FlorenceHandwritingClassifier:
                 - raw_scores: dict with keyword scores
                 - error: str (if classification failed)
         """
+        return self.classify_documents([image_path_or_pil], prompt=prompt, batch_size=1, use_cache=use_cache)[0]
+    
+    def classify_documents(self, images: List[Union[str, Image.Image]], prompt: Optional[str] = None,
+                           batch_size: int = 8, use_cache: bool = True) -> List[Dict]:
+        """
+        Classify several documents, running Florence-2 on batches of images.
+        
+        Args:
+            images: Paths to images or PIL Image objects
+            prompt: Custom prompt (optional, uses default if None)
+            batch_size: Number of images per model.generate call
+            use_cache: Reuse results of earlier classifications of identical image content
+            
+        Returns:
+            List of classification dicts (see classify_document) in the same order as images
+        """
         if not self.enabled:
-            return {
+            return [{
                 'is_printed': None,
                 'confidence': 0.0,
                 'explanation': 'Florence classifier is disabled',
                 'error': 'Classifier disabled'
-            }
+            } for _ in images]
         
         if not self._load_model():
-            return {
+            return [{
                 'is_printed': None,
                 'confidence': 0.0,
                 'explanation': 'Failed to load Florence model',
                 'error': 'Model loading failed'
-            }
+            } for _ in images]
         
-        try:
-            # Load image
-            if isinstance(image_path_or_pil, str):
-                if not os.path.exists(image_path_or_pil):
-                    raise FileNotFoundError(f"Image not found: {image_path_or_pil}")
-                image = Image.open(image_path_or_pil).convert('RGB')
-            else:
-                image = image_path_or_pil.convert('RGB')
-            
-            # OPTIMIZATION: Resize large images to speed up processing
-            # Florence-2 works well with smaller images and processes much faster
-            max_size = 1024  # Maximum dimension
-            if max(image.size) > max_size:
-                ratio = max_size / max(image.size)
-                new_size = (int(image.size[0] * ratio), int(image.size[1] * ratio))
-                image = image.resize(new_size, Image.Resampling.LANCZOS)
-                logger.debug(f"Resized image from {image_path_or_pil if isinstance(image_path_or_pil, str) else 'PIL'} to {new_size} for faster processing")
-            
-            # Default prompt optimized for document classification
-            if prompt is None:
-                prompt = "<MORE_DETAILED_CAPTION>"
-            
-            # Run inference
-            inputs = self.processor(text=prompt, images=image, return_tensors="pt").to(self.device)
+        # Identical image content and prompt give the same classification
+        results = [None] * len(images)
+        cache_keys = [None] * len(images)
+        if use_cache and self.cache_size > 0:
+            for idx, image_path_or_pil in enumerate(images):
+                image_hash = self._image_hash(image_path_or_pil)
+                if image_hash is not None:
+                    cache_keys[idx] = (image_hash, prompt)
+                    results[idx] = self._get_cached_result(cache_keys[idx])
+        
+        pending = [idx for idx, result in enumerate(results) if result is None]
+        for batch_start in range(0, len(pending), max(1, batch_size)):
+            batch = pending[batch_start:batch_start + max(1, batch_size)]
+            for idx, result in zip(batch, self._classify_batch([images[idx] for idx in batch], prompt)):
+                results[idx] = result
+                # Only successful classifications are cached
+                if cache_keys[idx] is not None and not result.get('error'):
+                    self._store_result(cache_keys[idx], result)
+        
+        return results
+    
+    def _get_cached_result(self, cache_key) -> Optional[Dict]:
+        """Cached classification for a (image hash, prompt) key (a copy), or None."""
+        with self._result_cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+    
+    def _store_result(self, cache_key, result: Dict):
+        """Store a copy of a classification, evicting the least recently used entries."""
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = copy.deepcopy(result)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+    
+    def _load_image(self, image_path_or_pil: Union[str, Image.Image]) -> Image.Image:
+        """
+        Load an image as RGB, downscaled for faster inference.
+        
+        Args:
+            image_path_or_pil: Path to image or PIL Image object
             
-            with torch.no_grad():
-                # OPTIMIZATION: Reduce max_new_tokens significantly - we only need classification, not long descriptions
-                # Reduced from 512 to 50 tokens - much faster while still getting classification info
-                try:
-                    generated_ids = self.model.generate(
-                        input_ids=inputs["input_ids"],
-                        pixel_values=inputs["pixel_values"],
-                        max_new_tokens=50,  # Reduced from 512 - we only need classification, not full description
-                        num_beams=1,  # Greedy decoding (fastest)
-                        do_sample=False,
-                        use_cache=False,  # Disable cache to avoid past_key_values issues
-                        pad_token_id=self.processor.tokenizer.pad_token_id or self.processor.tokenizer.eos_token_id,
-                        early_stopping=True  # Stop early if possible
-                    )
-                except AttributeError as e:
-                    # Fallback: try with minimal parameters
-                    logger.warning(f"Generation with cache failed, trying without: {e}")
-                    generated_ids = self.model.generate(
-                        input_ids=inputs["input_ids"],
-                        pixel_values=inputs["pixel_values"],
-                        max_new_tokens=30,  # Even smaller for fallback
-                        do_sample=False,
-                        early_stopping=True
-                    )
+        Returns:
+            RGB PIL image with max dimension 1024
+        """
+        if isinstance(image_path_or_pil, str):
+            if not os.path.exists(image_path_or_pil):
+                raise FileNotFoundError(f"Image not found: {image_path_or_pil}")
+            # Decode inside the context manager so the file handle is closed even if decoding fails
+            with Image.open(image_path_or_pil) as image:
+                image.load()
+        else:
+            image = image_path_or_pil
+        
+        # convert() always copies - only convert images that are not RGB already
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        # OPTIMIZATION: Resize large images to speed up processing
+        # Florence-2 works well with smaller images and processes much faster
+        max_size = 1024  # Maximum dimension
+        if max(image.size) > max_size:
+            ratio = max_size / max(image.size)
+            new_size = (int(image.size[0] * ratio), int(image.size[1] * ratio))
+            image = image.resize(new_size, Image.Resampling.LANCZOS)
+            logger.debug(f"Resized image from {image_path_or_pil if isinstance(image_path_or_pil, str) else 'PIL'} to {new_size} for faster processing")
+        
+        return image
+    
+    def _classify_batch(self, images: List[Union[str, Image.Image]], prompt: Optional[str]) -> List[Dict]:
+        """
+        Run Florence-2 on a batch of images with a single generate call and parse the classifications.
+        Falls back to one image at a time if the batch fails, so one bad image does not fail the others.
+        
+        Args:
+            images: Paths to images or PIL Image objects
+            prompt: Custom prompt (optional, uses default if None)
             
-            generated_text = self.processor.batch_decode(generated_ids, skip_special_tokens=False)[0]
+        Returns:
+            List of classification result dicts (see classify_document)
+        """
+        if len(images) > 1:
+            try:
+                return self._run_inference([self._load_image(image) for image in images], prompt)
+            except Exception as e:
+                logger.warning(f"Batched Florence classification failed, classifying images one by one: {e}")
+        
+        results = []
+        for image_path_or_pil in images:
+            try:
+                results.extend(self._run_inference([self._load_image(image_path_or_pil)], prompt))
+            except Exception as e:
+                logger.error(f"Florence classification failed: {e}", exc_info=True)
+                results.append({
+                    'is_printed': None,
+                    'confidence': 0.0,
+                    'explanation': f'Classification error: {str(e)}',
+                    'error': str(e)
+                })
+        return results
+    
+    def _run_inference(self, images: List[Image.Image], prompt: Optional[str]) -> List[Dict]:
+        """
+        Generate Florence-2 descriptions for loaded images and parse them.
+        
+        Args:
+            images: RGB PIL images
+            prompt: Custom prompt (optional, uses default if None)
             
+        Returns:
+            List of classification result dicts, one per image
+        """
+        # Default prompt optimized for document classification
+        if prompt is None:
+            prompt = "<MORE_DETAILED_CAPTION>"
+        
+        # Run inference (one padded batch)
+        inputs = self.processor(
+            text=[prompt] * len(images), images=images, return_tensors="pt", padding=True
+        ).to(self.device)
+        pixel_values = inputs["pixel_values"].to(self.dtype)  # Match the model weights (fp16 on GPU)
+        
+        with torch.inference_mode():
+            # OPTIMIZATION: Reduce max_new_tokens significantly - we only need classification, not long descriptions
+            # Reduced from 512 to 50 tokens - much faster while still getting classification info
+            generate_kwargs = dict(
+                input_ids=inputs["input_ids"],
+                pixel_values=pixel_values,
+                max_new_tokens=50,  # Reduced from 512 - we only need classification, not full description
+                num_beams=1,  # Greedy decoding (fastest)
+                do_sample=False,
+                pad_token_id=self.processor.tokenizer.pad_token_id or self.processor.tokenizer.eos_token_id,
+                early_stopping=True  # Stop early if possible
+            )
+            try:
+                if self._use_kv_cache:
+                    # KV cache: each new token attends over cached keys/values instead of recomputing them
+                    try:
+                        generated_ids = self.model.generate(**generate_kwargs, use_cache=True)
+                    except (AttributeError, TypeError) as e:
+                        # Some transformers / Florence remote code combinations break on past_key_values
+                        logger.warning(f"Florence generation with KV cache failed, disabling the cache: {e}")
+                        self._use_kv_cache = False
+                if not self._use_kv_cache:
+                    generated_ids = self.model.generate(**generate_kwargs, use_cache=False)
+            except AttributeError as e:
+                # Fallback: try with minimal parameters
+                logger.warning(f"Generation with cache failed, trying without: {e}")
+                generated_ids = self.model.generate(
+                    input_ids=inputs["input_ids"],
+                    pixel_values=pixel_values,
+                    max_new_tokens=30,  # Even smaller for fallback
+                    do_sample=False,
+                    early_stopping=True
+                )
+        
+        results = []
+        for generated_text, image in zip(self.processor.batch_decode(generated_ids, skip_special_tokens=False), images):
             # Parse the explanation from generated text
             try:
                 explanation = self.processor.post_process_generation(
@@ -205,17 +481,9 @@ class FlorenceHandwritingClassifier:
             # Parse result
             result = self._parse_classification(explanation)
             result['explanation'] = str(explanation)
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Florence classification failed: {e}", exc_info=True)
-            return {
-                'is_printed': None,
-                'confidence': 0.0,
-                'explanation': f'Classification error: {str(e)}',
-                'error': str(e)
-            }
+            results.append(result)
+        
+        return results
     
     def _parse_classification(self, explanation: str) -> Dict:
         """
@@ -228,43 +496,22 @@ class FlorenceHandwritingClassifier:
         Returns:
             dict with classification results
         """
-        text = str(explanation).lower()
-        
-        # Keywords indicating printed documents (strong signals)
-        printed_keywords_strong = [
-            'printed', 'typed', 'computer-generated', 'digital',
-            'system-generated', 'form', 'official document',
-            'certificate', 'template', 'scanned document'
-        ]
-        
-        printed_keywords_weak = [
-            'document', 'pdf', 'text', 'stamp', 'seal'
-        ]
-        
-        # Keywords indicating handwritten (strong signals)
-        handwritten_keywords_strong = [
-            'handwritten', 'handwriting', 'written by hand',
-            'manuscript', 'cursive', 'script', 'hand-drawn',
-            'written manually', 'hand written'
-        ]
-        
-        handwritten_keywords_weak = [
-            'pen', 'pencil', 'ink', 'written'
-        ]
+        # All keywords found in a single regex pass
+        keywords = find_keywords(str(explanation))
         
         # Count strong and weak signals separately
-        printed_strong = sum(1 for kw in printed_keywords_strong if kw in text)
-        printed_weak = sum(1 for kw in printed_keywords_weak if kw in text)
-        handwritten_strong = sum(1 for kw in handwritten_keywords_strong if kw in text)
-        handwritten_weak = sum(1 for kw in handwritten_keywords_weak if kw in text)
+        printed_strong = len(keywords & PRINTED_KEYWORDS_STRONG)
+        printed_weak = len(keywords & PRINTED_KEYWORDS_WEAK)
+        handwritten_strong = len(keywords & HANDWRITTEN_KEYWORDS_STRONG)
+        handwritten_weak = len(keywords & HANDWRITTEN_KEYWORDS_WEAK)
         
         # Weighted scores (strong signals count more)
         printed_score = (printed_strong * 3) + printed_weak
         handwritten_score = (handwritten_strong * 3) + handwritten_weak
         
         # Special handling for mixed documents (signatures/stamps)
-        has_signature = any(word in text for word in ['signature', 'signed', 'stamp', 'seal'])
-        has_printed_text = any(word in text for word in ['text', 'printed', 'typed', 'form', 'document'])
+        has_signature = not keywords.isdisjoint(SIGNATURE_KEYWORDS)
+        has_printed_text = not keywords.isdisjoint(PRINTED_TEXT_KEYWORDS)
         
         # CONSERVATIVE DECISION LOGIC (avoid false positives)
         # Only classify as printed if we have strong evidence
@@ -341,7 +588,9 @@ def get_florence_classifier() -> FlorenceHandwritingClassifier:
     Can be configured via FLORENCE_ENABLED environment variable.
     """
     enabled = os.getenv('FLORENCE_ENABLED', 'false').lower() == 'true'
-    return FlorenceHandwritingClassifier(enabled=enabled)
+    cache_size = int(os.getenv('FLORENCE_CACHE_SIZE', 256))
+    compile_mode = os.getenv('FLORENCE_TORCH_COMPILE', '').strip() or None
+    return FlorenceHandwritingClassifier(enabled=enabled, cache_size=cache_size, compile_mode=compile_mode)
 
 
 # Global instance (will be created on first use)
@@ -6,20 +6,29 @@ Handles image loading and preprocessing.
 import cv2
 import numpy as np
 from PIL import Image
+import mmap
 import os
 from typing import Optional, Tuple
 
+# Supported image file extensions (lowercase, with dot)
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif'})
+
+# Reduced-resolution decode flags by downscale factor (JPEG is scaled inside the IDCT)
+REDUCED_COLOR_FLAGS = ((8, cv2.IMREAD_REDUCED_COLOR_8), (4, cv2.IMREAD_REDUCED_COLOR_4), (2, cv2.IMREAD_REDUCED_COLOR_2))
+
 
 class ImageProcessor:
     """Handles image loading and basic processing."""
     
     @staticmethod
-    def load_image(image_path: str) -> Optional[np.ndarray]:
+    def load_image(image_path: str, max_dim: Optional[int] = None) -> Optional[np.ndarray]:
         """
         Load image from file path.
         
         Args:
             image_path: Path to image file
+            max_dim: If set, decode at 1/2, 1/4 or 1/8 resolution as long as the
+                larger side stays at least max_dim pixels (full resolution otherwise)
             
         Returns:
             Image as numpy array or None if failed
@@ -27,7 +36,25 @@ class ImageProcessor:
         if not os.path.exists(image_path):
             return None
         
-        image = cv2.imread(image_path)
+        flag = cv2.IMREAD_COLOR
+        if max_dim:
+            # Native size from the header only (no pixel decode)
+            try:
+                with Image.open(image_path) as header:
+                    native_max = max(header.size)
+            except Exception:
+                native_max = 0
+            flag = next(
+                (reduced for factor, reduced in REDUCED_COLOR_FLAGS if native_max // factor >= max_dim),
+                cv2.IMREAD_COLOR
+            )
+        
+        # Decode straight from the page-cache mapping (no userspace read copy)
+        try:
+            with open(image_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                image = cv2.imdecode(np.frombuffer(mapped, dtype=np.uint8), flag)
+        except (OSError, ValueError):  # Unreadable or empty file
+            return None
         return image
     
     @staticmethod
@@ -41,8 +68,7 @@ class ImageProcessor:
         Returns:
             True if image, False otherwise
         """
-        valid_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif']
-        return any(file_path.lower().endswith(ext) for ext in valid_extensions)
+        return os.path.splitext(file_path)[1].lower() in IMAGE_EXTENSIONS
     
     @staticmethod
     def get_image_info(image_path: str) -> dict:
@@ -56,14 +82,15 @@ class ImageProcessor:
             Dictionary with image information
         """
         try:
-            image = Image.open(image_path)
-            return {
-                'width': image.width,
-                'height': image.height,
-                'format': image.format,
-                'mode': image.mode,
-                'size_bytes': os.path.getsize(image_path)
-            }
+            # Header parse only - pixels are never decoded; the file handle is closed on exit
+            with Image.open(image_path) as image:
+                return {
+                    'width': image.width,
+                    'height': image.height,
+                    'format': image.format,
+                    'mode': image.mode,
+                    'size_bytes': os.stat(image_path).st_size
+                }
         except Exception as e:
             return {
                 'error': str(e)
@@ -8,12 +8,28 @@ import pytesseract
 from PIL import Image
 import cv2
 import numpy as np
+import copy
+import functools
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import math
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import os
 
 logger = logging.getLogger(__name__)
 
+# Registration type pattern (OCR may drop the colon or add spacing: "regn:63m", "regn 63", "regn.63M")
+_REGN_RE = re.compile(r'regn[:\s\.]*63[mM]?', re.IGNORECASE)
+
+# Whitespace-separated words long enough for a partial negative marker match (markers are
+# longer than 4 characters and words must be at least 70% of the marker length)
+_WORD_RE = re.compile(r'\S{4,}')
+
 # Import PDF converter for handling PDF files
 try:
     from src.utils.pdf_converter import PDFConverter
@@ -28,6 +44,303 @@ try:
 except ImportError:
     PYZBAR_AVAILABLE = False
 
+# Optional xxhash for fast content hashing of the detection cache (falls back to hashlib.blake2b)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# OpenCV's native barcode detector (OpenCV >= 4.5.3) decodes NumPy arrays in-process; pyzbar is the fallback
+CV2_BARCODE_AVAILABLE = hasattr(cv2, 'barcode') and hasattr(cv2.barcode, 'BarcodeDetector')
+
+# DEFINITIVE Index-II markers - a single one of these decides the document (RULE 1)
+# Marker strings are interned (here and in the detector's marker tables) so set lookups of
+# indicator markers hit the identity fast path
+_DEFINITIVE_MARKERS = frozenset(map(sys.intern, {
+    'सूची क्र.2', 'सूची क्र.२',
+    'index-ii', 'index ii',
+    'regn:63m', 'regn.63m',
+    'दुय्यम निबंधक'
+}))
+
+# Negative signals (agreement/will/NOC) strong enough to reject unless a DEFINITIVE marker is present
+_STRONG_NEGATIVE_MARKERS = frozenset({
+    # NOC/No Dues
+    'no objection certificate', 'no objection', 'noc',
+    'no dues certificate', 'no dues',
+    'clearance certificate', 'society',
+    # Agreement/Will/Testament
+    'deed of assignment', 'assignment', 'agreement',
+    'sale agreement', 'purchase agreement', 'agreement to sell',
+    'will', 'testament', 'testator', 'bequeath', 'bequeathed',
+    'vendor', 'purchaser', 'assignor', 'assignee',
+    'transferor', 'transferee', 'power of attorney', 'poa'
+})
+
+# Payment-table terms for the circumstantial rule (RULE 3) - no other marker contains them,
+# so indicators are matched by set membership
+_PAYMENT_MARKERS = frozenset(map(sys.intern, {'stamp duty', 'registration fee', 'echallan'}))
+
+# Contrast enhancers reused across documents (CLAHE objects keep internal buffers,
+# so apply() calls are serialized with a lock)
+_CLAHE_MILD = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+_CLAHE_STRONG = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
+_CLAHE_LOCK = threading.Lock()
+
+# Line-extraction kernels for the payment table grid check (sized for the half-resolution page)
+_TABLE_H_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (20, 1))
+_TABLE_V_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 20))
+# Reach of the opening with those kernels (iterations=2, anchor at index 10) before/after each
+# pixel, used by the Numba grid kernel to reproduce it: erosion keeps x when [x - 20, x + 18] is
+# foreground (pixels outside the page count as foreground), dilation covers [x - 18, x + 20]
+_TABLE_LINE_LEAD = 2 * 10
+_TABLE_LINE_TRAIL = 2 * (20 - 1 - 10)
+
+# Optional tesserocr bindings (persistent Tesseract API - language models are loaded once
+# instead of once per pytesseract subprocess)
+try:
+    from tesserocr import PyTessBaseAPI
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Optional Aho-Corasick automaton for scanning OCR text for all markers in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional Numba JIT for the barcode projection peak count, the table grid line count and the
+# partial marker overlap kernel (fall back to NumPy / OpenCV morphology)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _barcode_peak_count_numpy(edges: np.ndarray) -> int:
+    """NumPy version of _barcode_peak_count (used when Numba is not installed)."""
+    vertical_projection = np.sum(edges, axis=0)
+    if len(vertical_projection) == 0:
+        return 0
+    mean_proj = np.mean(vertical_projection)
+    std_proj = np.std(vertical_projection)
+    return int(np.sum(vertical_projection > (mean_proj + 2 * std_proj)))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _barcode_peak_count(edges):
+        """
+        Count columns of an edge map whose vertical projection exceeds mean + 2*std
+        (barcode bars show up as distinct peaks). One row-major pass builds the column
+        sums, then a pass over the columns computes the statistics and the count.
+        
+        Returns:
+            Number of peak columns, 0 for an empty edge map
+        """
+        height, width = edges.shape
+        if width == 0:
+            return 0
+        projection = np.zeros(width, dtype=np.int64)
+        for y in range(height):
+            for x in range(width):
+                projection[x] += edges[y, x]
+        mean = 0.0
+        for x in range(width):
+            mean += projection[x]
+        mean /= width
+        variance = 0.0
+        for x in range(width):
+            delta = projection[x] - mean
+            variance += delta * delta
+        threshold = mean + 2 * np.sqrt(variance / width)
+        count = 0
+        for x in range(width):
+            if projection[x] > threshold:
+                count += 1
+        return count
+else:
+    _barcode_peak_count = _barcode_peak_count_numpy
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _line_run_pixels(start, end, length, lead, trail, covered_end):
+        """
+        Pixels that the line opening keeps for one foreground run [start, end) of a row or column.
+        
+        Returns:
+            Tuple of (newly covered pixels, end of the covered span) - the opened spans of
+            neighbouring runs can overlap, so coverage up to covered_end is not counted again
+        """
+        # Erosion: runs touching the page edge are not shortened on that side
+        low = start + lead if start > 0 else 0
+        high = end - trail if end < length else length
+        if low >= high:
+            return 0, covered_end
+        # Dilation (clipped to the page)
+        span_start = max(low - trail, covered_end, 0)
+        span_end = min(high + lead, length)
+        if span_end <= span_start:
+            return 0, covered_end
+        return span_end - span_start, span_end
+    
+    @njit(cache=True)
+    def _grid_line_pixels(thresh, lead, trail):
+        """
+        Count the pixels the horizontal and vertical line openings keep (the counts of
+        cv2.morphologyEx(MORPH_OPEN) with the table kernels) in one row-major pass over a
+        binary page: row runs are tracked in scalars, column runs in per-column arrays.
+        
+        Returns:
+            Tuple of (horizontal line pixels, vertical line pixels)
+        """
+        height, width = thresh.shape
+        h_count = 0
+        v_count = 0
+        column_starts = np.full(width, -1, dtype=np.int64)
+        column_covered = np.zeros(width, dtype=np.int64)
+        for y in range(height):
+            row_start = -1
+            row_covered = 0
+            for x in range(width):
+                if thresh[y, x]:
+                    if row_start < 0:
+                        row_start = x
+                    if column_starts[x] < 0:
+                        column_starts[x] = y
+                else:
+                    if row_start >= 0:
+                        pixels, row_covered = _line_run_pixels(row_start, x, width, lead, trail, row_covered)
+                        h_count += pixels
+                        row_start = -1
+                    if column_starts[x] >= 0:
+                        pixels, column_covered[x] = _line_run_pixels(
+                            column_starts[x], y, height, lead, trail, column_covered[x]
+                        )
+                        v_count += pixels
+                        column_starts[x] = -1
+            if row_start >= 0:
+                pixels, row_covered = _line_run_pixels(row_start, width, width, lead, trail, row_covered)
+                h_count += pixels
+        for x in range(width):
+            if column_starts[x] >= 0:
+                pixels, column_covered[x] = _line_run_pixels(
+                    column_starts[x], height, height, lead, trail, column_covered[x]
+                )
+                v_count += pixels
+        return h_count, v_count
+
+
+def _first_overlap_match_numpy(word_masks: np.ndarray, word_lens: np.ndarray,
+                               marker_masks: np.ndarray, marker_lens: np.ndarray,
+                               marker_char_counts: np.ndarray) -> np.ndarray:
+    """NumPy version of _first_overlap_match (used when Numba is not installed)."""
+    shared = (marker_masks[:, None] & word_masks[None, :]).astype(np.uint64)
+    shared_counts = np.unpackbits(shared[..., None].view(np.uint8), axis=-1).sum(axis=-1)
+    matches = (
+        (word_lens[None, :] >= marker_lens[:, None] * 0.7)
+        & (shared_counts / marker_char_counts[:, None] >= 0.8)
+    )
+    return np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _first_overlap_match(word_masks, word_lens, marker_masks, marker_lens, marker_char_counts):
+        """
+        Find, for each marker, the first word sharing 80% of the marker's characters.
+        Character sets are packed as one bit per character in a uint64, so the overlap
+        of a word and a marker is the popcount of their AND.
+        
+        Returns:
+            Index of the first matching word per marker, -1 where no word matches
+        """
+        result = np.full(marker_masks.shape[0], -1, dtype=np.int64)
+        for j in range(marker_masks.shape[0]):
+            for i in range(word_masks.shape[0]):
+                if word_lens[i] < marker_lens[j] * 0.7:  # At least 70% of marker length
+                    continue
+                shared = word_masks[i] & marker_masks[j]
+                count = 0
+                while shared:
+                    shared &= shared - np.uint64(1)
+                    count += 1
+                if count / marker_char_counts[j] >= 0.8:  # 80% character overlap
+                    result[j] = i
+                    break
+        return result
+else:
+    _first_overlap_match = _first_overlap_match_numpy
+
+
+class _MarkerMatcher:
+    """
+    Finds which of a fixed set of lowercase markers occur in a text with one scan:
+    an Aho-Corasick automaton when pyahocorasick is installed, otherwise a regex union.
+    """
+    
+    def __init__(self, markers):
+        """
+        Build the matcher.
+        
+        Args:
+            markers: Iterable of lowercase marker strings
+        """
+        self.markers = frozenset(markers)
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for marker in self.markers:
+                self._automaton.add_word(marker, marker)
+            self._automaton.make_automaton()
+        else:
+            # Regex fallback: a lookahead union (longest first) finds the longest marker starting
+            # at every position in one C-level scan; shorter markers contained in it are added
+            # through _contained
+            self._regex = re.compile(
+                '(?=(' + '|'.join(re.escape(m) for m in sorted(self.markers, key=len, reverse=True)) + '))'
+            )
+            self._contained = {
+                m: frozenset(other for other in self.markers if other in m) for m in self.markers
+            }
+    
+    def find(self, text_lower: str) -> frozenset:
+        """
+        Find the markers present in a text.
+        
+        Args:
+            text_lower: Lowercased text
+            
+        Returns:
+            frozenset of the markers that occur in the text
+        """
+        if self._automaton is not None:
+            return frozenset(marker for _, marker in self._automaton.iter(text_lower))
+        
+        present = set()
+        for match in set(self._regex.findall(text_lower)):
+            present |= self._contained[match]
+        return frozenset(present)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_marker_matcher(markers: frozenset) -> _MarkerMatcher:
+    """
+    Build a marker matcher (cached - detector instances with the same markers share one automaton).
+    
+    Args:
+        markers: Lowercase marker strings
+        
+    Returns:
+        _MarkerMatcher for the markers
+    """
+    return _MarkerMatcher(markers)
+
 
 class Index2Detector:
     """
@@ -37,11 +350,49 @@ class Index2Detector:
     
     def __init__(self):
         """Initialize Index-II detector."""
-        self.use_barcode_lib = PYZBAR_AVAILABLE
-        if not PYZBAR_AVAILABLE:
+        self.use_barcode_lib = CV2_BARCODE_AVAILABLE or PYZBAR_AVAILABLE
+        if not self.use_barcode_lib:
             logger.warning("pyzbar not installed - barcode decoding disabled. Install with: pip install pyzbar")
         
-        self.current_image_path = None  # Store for negative signal check
+        # Barcode detectors are not shared between threads (created on first use)
+        self._barcode = threading.local()
+        
+        # Document being detected, stored for the negative signal check (thread-local so concurrent
+        # detections on one detector don't mix state)
+        self._current = threading.local()
+        
+        # Detection results for repeated files, keyed by file content hash (LRU, 0 = disabled)
+        self.result_cache_size = int(os.getenv('INDEX2_DETECTION_CACHE_SIZE', 256))
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # tesserocr API handles are not thread-safe - keep one per thread and language (created on first use)
+        self._tesserocr = threading.local()
+        
+        # Run the table grid threshold/morphology through cv2.UMat so OpenCV can dispatch them to
+        # an OpenCL device (ignored when OpenCV has no OpenCL support)
+        self.use_opencl = os.getenv('INDEX2_OPENCL', 'false').lower() in ('1', 'true') and cv2.ocl.haveOpenCL()
+        
+        # Headers wider than this are OCR'd at half resolution (0 = always full resolution)
+        self.header_downsample_width = int(os.getenv('INDEX2_HEADER_DOWNSAMPLE_WIDTH', 1500))
+        
+        # Header OCR attempts run in parallel (Tesseract releases the GIL). The pool is kept for the
+        # detector's lifetime so per-thread tesserocr handles are reused across documents.
+        # The visual structure checks (OpenCV also releases the GIL) run on it during page OCR.
+        header_workers = int(os.getenv('INDEX2_HEADER_OCR_WORKERS', 4))
+        self.header_ocr_workers = max(1, min(header_workers, os.cpu_count() or 1))
+        self._header_ocr_pool = None
+        if self.header_ocr_workers > 1:
+            self._header_ocr_pool = ThreadPoolExecutor(
+                max_workers=self.header_ocr_workers, thread_name_prefix='index2-header-ocr'
+            )
+        
+        if NUMBA_AVAILABLE:
+            # Warm up the JIT kernels so compilation is not charged to the first document
+            _barcode_peak_count(np.zeros((2, 2), dtype=np.uint8))
+            _grid_line_pixels(np.zeros((2, 2), dtype=np.uint8), _TABLE_LINE_LEAD, _TABLE_LINE_TRAIL)
+            empty_masks, empty_lens = np.zeros(1, dtype=np.uint64), np.ones(1, dtype=np.int64)
+            _first_overlap_match(empty_masks, empty_lens, empty_masks, empty_lens, empty_lens)
         
         # Initialize PDF converter for handling PDF files
         self.pdf_converter = None
@@ -74,6 +425,17 @@ class Index2Detector:
             'हवेली': 'Haveli (with context)',  # Only if with sub-registrar
         }
         
+        # Header-only extraction patterns (FULL Index-II markers only - no partial/ambiguous matches)
+        # REMOVED: 'सूची', 'क्र', 'निबंधक' - too generic (appear in agreements/wills)
+        self.header_critical_patterns = [
+            'सूची क्र.2', 'सूची क्र.२',  # Full Index-II header
+            'index-ii', 'index ii', 'index-2',  # English Index-II
+            'regn:63m', 'regn.63m', 'regn 63m', 'regn:63',  # Registration type
+            'दुय्यम निबंधक',  # Sub-Registrar (full phrase)
+            'गावाचे नाव', 'विलेखाचा प्रकार', 'बाजारभाव',  # Index-II specific fields
+            'सब रजिस्ट्रार', 'उप निबंधक'  # Alternative registrar terms
+        ]
+        
         # SUPPORTING MARKERS - help but not decisive
         # REMOVED generic markers like "पुणे", "pune", "maharashtra" 
         # These appear in ALL government documents!
@@ -119,36 +481,265 @@ class Index2Detector:
             'power of attorney': 'Power of attorney (not Index-II)',
             'poa': 'Power of attorney',
         }
+        
+        # NEGATIVE SIGNAL MARKERS - checked in page text for the confidence penalty
+        # NOC/Certificate/Agreement/Will markers (case-insensitive, partial matches)
+        self.negative_signal_markers = {
+            # NOC/No Dues
+            'no objection certificate': 'NOC certificate',
+            'no objection': 'NOC',
+            'noc': 'NOC abbreviation',
+            'no dues certificate': 'No Dues certificate',
+            'no dues': 'No Dues',
+            'clearance certificate': 'Clearance',
+            'non encumbrance': 'Non-encumbrance',
+            'bonafide certificate': 'Bonafide',
+            'society': 'Housing society document',
+            'co-op': 'Cooperative society',
+            'co-operative': 'Cooperative society',
+            'cooperative': 'Cooperative society',
+            'housing society': 'Housing society',
+            'to whomsoever': 'Certificate phrase',
+            'to whom': 'Certificate phrase',
+            'this is to certify': 'Certificate phrase',
+            'property tax': 'Tax receipt',
+            'tax receipt': 'Tax receipt',
+            # NEW: Agreement/Will/Testament markers
+            'deed of assignment': 'Assignment deed',
+            'assignment': 'Assignment document',
+            'deed of transfer': 'Transfer deed',
+            'agreement': 'Agreement document',
+            'sale agreement': 'Sale agreement',
+            'purchase agreement': 'Purchase agreement',
+            'agreement to sell': 'Sale agreement',
+            'will': 'Testament/Will',
+            'testament': 'Testament document',
+            'testator': 'Will document',
+            'executor': 'Will document',
+            'bequeath': 'Will document',
+            'bequeathed': 'Will document',
+            'vendor': 'Sale deed',
+            'purchaser': 'Purchase deed',
+            'assignor': 'Assignment deed',
+            'assignee': 'Assignment deed',
+            'transferor': 'Transfer deed',
+            'transferee': 'Transfer deed',
+            'power of attorney': 'Power of attorney (not Index-II)',
+            'poa': 'Power of attorney',
+        }
+        
+        # (marker, marker_lower, description) tuples so per-document scans don't re-lower marker keys
+        # (strings interned, see _DEFINITIVE_MARKERS)
+        self._critical_items = self._intern_items(self.critical_markers)
+        self._strong_items = self._intern_items(self.strong_markers)
+        self._supporting_items = self._intern_items(self.supporting_markers)
+        self._negative_items = self._intern_items(self.negative_markers)
+        self._header_items = tuple((sys.intern(p), sys.intern(p.lower())) for p in self.header_critical_patterns)
+        
+        # Lowercase Index-II markers of every category, matched against text in a single scan
+        self._all_markers_lower = frozenset(
+            m_lower for items in (self._critical_items, self._strong_items, self._supporting_items)
+            for _, m_lower, _ in items
+        ) | frozenset(p_lower for _, p_lower in self._header_items)
+        self._marker_matcher = _get_marker_matcher(self._all_markers_lower)
+        
+        # Negative signal markers are already lowercase - (marker, description, character set) tuples
+        # for the partial-match check, plus their own single-scan matcher
+        self._negative_signal_items = tuple(
+            (sys.intern(m), d, frozenset(m)) for m, d in self.negative_signal_markers.items()
+        )
+        self._negative_signal_matcher = _get_marker_matcher(frozenset(self.negative_signal_markers))
+        # Negative signal names (exact and partial-match forms) containing a strong negative marker,
+        # so RULE 0 is a set lookup per signal
+        self._strong_negative_signals = frozenset(
+            sys.intern(signal)
+            for m in self.negative_signal_markers
+            for signal in (m, f'{m}_partial_match')
+            if any(sn in signal for sn in _STRONG_NEGATIVE_MARKERS)
+        )
     
-    def _convert_pdf_to_image(self, pdf_path: str) -> Optional[str]:
+    @staticmethod
+    def _intern_items(markers: Dict[str, str]) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        Build (marker, marker_lower, description) tuples with interned marker strings.
+        
+        Args:
+            markers: Dictionary mapping marker to description
+            
+        Returns:
+            Tuple of (marker, marker_lower, description) tuples
         """
-        Convert PDF to image (first page only for detection).
-        Returns path to converted image or None if conversion fails.
+        return tuple((sys.intern(m), sys.intern(m.lower()), d) for m, d in markers.items())
+    
+    @property
+    def current_image_path(self) -> Optional[str]:
+        """Path of the document being detected on this thread."""
+        return getattr(self._current, 'image_path', None)
+    
+    @current_image_path.setter
+    def current_image_path(self, image_path: Optional[str]):
+        self._current.image_path = image_path
+    
+    @property
+    def current_text(self) -> Optional[str]:
+        """OCR text of current_image_path, shared with the negative signal check."""
+        return getattr(self._current, 'text', None)
+    
+    @current_text.setter
+    def current_text(self, text: Optional[str]):
+        self._current.text = text
+    
+    def _ocr(self, image: Image.Image, lang: str = 'eng+hin+mar', psm: int = 3) -> str:
+        """
+        Run Tesseract on an image, reusing a persistent tesserocr API when available.
+        
+        Args:
+            image: PIL image to recognize
+            lang: Tesseract language string
+            psm: Page segmentation mode
+            
+        Returns:
+            Recognized text
+        """
+        if not TESSEROCR_AVAILABLE:
+            return pytesseract.image_to_string(image, lang=lang, config=f'--psm {psm}')
+        
+        apis = getattr(self._tesserocr, 'apis', None)
+        if apis is None:
+            apis = self._tesserocr.apis = {}
+        api = apis.get(lang)
+        if api is None:
+            api = apis[lang] = PyTessBaseAPI(lang=lang)
+        api.SetPageSegMode(psm)
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    
+    def _decode_barcode(self, gray: np.ndarray) -> Optional[str]:
+        """
+        Decode the first barcode found in a grayscale image.
+        
+        Args:
+            gray: Grayscale image region
+            
+        Returns:
+            Decoded barcode data, or None if no barcode could be decoded
+        """
+        if CV2_BARCODE_AVAILABLE:
+            detector = getattr(self._barcode, 'detector', None)
+            if detector is None:
+                detector = self._barcode.detector = cv2.barcode.BarcodeDetector()
+            # decoded_info is the second element in both the 4.8+ and the older contrib API
+            if hasattr(detector, 'detectAndDecodeMulti'):
+                decoded_info = detector.detectAndDecodeMulti(gray)[1]
+            else:
+                decoded_info = detector.detectAndDecode(gray)[1]
+            for data in decoded_info or ():
+                if data:
+                    return data
+            return None
+        
+        barcodes = pyzbar.decode(Image.fromarray(gray))
+        if len(barcodes) > 0:
+            return barcodes[0].data.decode('utf-8', errors='ignore')
+        return None
+    
+    def _find_markers(self, text_lower: str) -> frozenset:
+        """
+        Find which Index-II markers occur in a text (single automaton pass when available).
+        
+        Args:
+            text_lower: Lowercased OCR text
+            
+        Returns:
+            frozenset of the lowercase markers present in the text
+        """
+        return self._marker_matcher.find(text_lower)
+    
+    def _convert_pdf_to_array(self, pdf_path: str) -> Optional[np.ndarray]:
+        """
+        Render the first page of a PDF in memory (first page only for detection).
+        Returns the page as an RGB array or None if conversion fails.
         """
         try:
             if not self.pdf_converter:
                 return None
             
-            # Create temp directory for converted image
-            import tempfile
-            temp_dir = tempfile.mkdtemp(prefix='index2_detection_')
-            
-            # Convert first page only (for speed)
-            image_paths = self.pdf_converter.convert_pdf_to_images(pdf_path, temp_dir, first_page_only=True)
+            # Convert first page only (for speed) - kept in memory, no temp PNG round trip
+            pages = self.pdf_converter.render_pages(pdf_path, first_page_only=True)
             
-            if image_paths and len(image_paths) > 0:
-                return image_paths[0]
+            if pages and len(pages) > 0:
+                return np.asarray(pages[0].convert('RGB'))
             return None
             
         except Exception as e:
             logger.warning(f"PDF conversion failed: {e}")
             return None
     
+    @staticmethod
+    def _image_views(rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Image.Image]:
+        """
+        Derive the BGR, grayscale and PIL views of an RGB page.
+        
+        Args:
+            rgb: RGB image as numpy array
+            
+        Returns:
+            (bgr, gray, pil_rgb) tuple
+        """
+        return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR), cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY), Image.fromarray(rgb)
+    
+    def _load_image_once(self, image_path: str) -> Optional[Tuple[np.ndarray, np.ndarray, Image.Image]]:
+        """
+        Decode an image once and derive the grayscale and PIL views shared by all checks.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            (bgr, gray, pil_rgb) tuple, or None if the image could not be decoded
+        """
+        bgr = cv2.imread(image_path)
+        if bgr is None:
+            # Fall back to PIL for formats OpenCV cannot decode
+            try:
+                with Image.open(image_path) as img:
+                    rgb = np.asarray(img.convert('RGB'))
+            except Exception as e:
+                logger.warning(f"Could not decode image {image_path}: {e}")
+                return None
+            return self._image_views(rgb)
+        
+        rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+        return bgr, gray, Image.fromarray(rgb)
+    
+    def _hash_file(self, file_path: str) -> Optional[str]:
+        """
+        Hash a file's bytes for the detection result cache.
+        
+        Args:
+            file_path: Path to the image or PDF file
+            
+        Returns:
+            Hex digest of the file content, or None if caching is disabled or the file can't be read
+        """
+        if self.result_cache_size <= 0:
+            return None
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_hexdigest(data)
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    
     def is_index2_document(self, image_path: str) -> Dict:
         """
         Check if document is Index-II based on content analysis.
         Uses multi-layered detection: text markers, visual structure, barcodes.
-        Handles both PDF and image files.
+        Handles both PDF and image files. Results are cached by file content, so
+        resubmitting the same file skips OCR entirely.
         
         Args:
             image_path: Path to the image or PDF file
@@ -161,6 +752,41 @@ class Index2Detector:
                 'detection_method': str
             }
         """
+        # PDFs are hashed as PDF bytes, so the cache does not depend on rendering
+        content_hash = self._hash_file(image_path)
+        if content_hash is not None:
+            with self._result_cache_lock:
+                cached = self._result_cache.get(content_hash)
+                if cached is not None:
+                    self._result_cache.move_to_end(content_hash)
+            if cached is not None:
+                logger.info(f"Index-II detection cache hit for: {os.path.basename(image_path)}")
+                # Callers may modify the result - never hand out the cached object
+                return copy.deepcopy(cached)
+        
+        result = self._detect_index2(image_path)
+        
+        # Errors are not cached (they may be transient)
+        if content_hash is not None and result.get('detection_method') != 'error':
+            cached = copy.deepcopy(result)
+            with self._result_cache_lock:
+                self._result_cache[content_hash] = cached
+                self._result_cache.move_to_end(content_hash)
+                while len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+        
+        return result
+    
+    def _detect_index2(self, image_path: str) -> Dict:
+        """
+        Run Index-II detection on a file (uncached, see is_index2_document).
+        
+        Args:
+            image_path: Path to the image or PDF file
+            
+        Returns:
+            Detection result dictionary
+        """
         try:
             logger.info(f"\n{'='*60}")
             logger.info(f"Detecting Index-II for: {os.path.basename(image_path)}")
@@ -177,38 +803,48 @@ class Index2Detector:
                 logger.debug(f"Filename negative signal check failed: {e}")
                 filename_negative_signals = []  # Ensure it's still a list even on error
             
-            # Check if file is PDF and convert to image if needed
-            actual_image_path = image_path
-            is_pdf = image_path.lower().endswith('.pdf')
-            temp_image_path = None
-            
-            if is_pdf:
-                logger.info("File is PDF - converting first page to image for detection")
-                temp_image_path = self._convert_pdf_to_image(image_path)
-                if temp_image_path:
-                    actual_image_path = temp_image_path
-                    logger.info(f"PDF converted to image: {actual_image_path}")
+            # Decode the image once - all checks below share these arrays
+            # PDFs: render the first page in memory
+            image = None
+            if image_path.lower().endswith('.pdf'):
+                logger.info("File is PDF - rendering first page in memory for detection")
+                page = self._convert_pdf_to_array(image_path)
+                if page is not None:
+                    image = self._image_views(page)
+                    logger.info(f"PDF first page rendered ({page.shape[1]}x{page.shape[0]})")
                 else:
                     logger.warning("Failed to convert PDF to image - detection may fail")
-                    # Continue with PDF path, but it will likely fail
-            
-            # Store image path for negative signal check (needed in confidence calculation)
-            self.current_image_path = actual_image_path
-            
-            # Method 1: Text content markers (most reliable)
-            text_indicators = self._check_text_content(actual_image_path)
-            
-            # Method 2: Visual structure (barcode, seals, layout)
-            visual_indicators = self._check_visual_structure(actual_image_path)
+            else:
+                image = self._load_image_once(image_path)
+            
+            self.current_image_path = image_path
+            self.current_text = None
+            
+            # Start the visual checks on the worker pool so they overlap with page OCR. Seal detection
+            # is started speculatively - its result is only used when no definitive marker is found.
+            visual_jobs = None
+            if image is not None and self._header_ocr_pool is not None:
+                visual_jobs = (
+                    self._header_ocr_pool.submit(self._check_barcode_structure, image[1]),
+                    self._header_ocr_pool.submit(self._check_layout_structure, image[1])
+                )
             
             # CRITICAL CHECK: Early handwriting detection - extract text FIRST
             # Index-II documents are ALWAYS printed, so if OCR extracts very little, it's NOT Index-II
-            extracted_text = self._extract_text_robust(actual_image_path)
+            # The text is extracted once and shared with the marker and negative signal checks below
+            extracted_text = ""
+            if image is not None:
+                _, gray, pil_img = image
+                extracted_text = self._extract_text_robust(gray, pil_img)
+                # Store text for negative signal check (needed in confidence calculation)
+                self.current_text = extracted_text
             text_length = len(extracted_text.strip())
             
             # NEW: Early handwriting detection - reject immediately if very little text
             if text_length < 100:
-                # Very little text - likely handwritten
+                # Very little text - likely handwritten. Drop the visual checks that haven't started
+                # so they don't hold pool workers needed for header OCR
+                self._cancel_jobs(visual_jobs)
                 logger.warning(f"⚠ Very little text extracted ({text_length} chars) - likely handwritten document")
                 logger.warning("⚠ Index-II documents are always printed - rejecting early based on insufficient text")
                 return {
@@ -223,6 +859,28 @@ class Index2Detector:
             
             has_readable_text = text_length >= 50  # At least 50 characters for further processing
             
+            # Method 1: Text content markers (most reliable)
+            text_indicators = self._check_text_content(extracted_text, gray)
+            
+            # FAST PATH: 2+ CRITICAL markers including a DEFINITIVE one decide the document by RULE 1
+            # (negative signals never override a definitive marker) - skip visual structure and
+            # negative-signal OCR, which could only add the small visual confidence bonus
+            critical_markers = [ind['marker'] for ind in text_indicators if ind['type'] == 'CRITICAL']
+            has_definitive = not _DEFINITIVE_MARKERS.isdisjoint(critical_markers)
+            fast_path = len(critical_markers) >= 2 and has_definitive
+            
+            # Method 2: Visual structure (barcode, seals, layout)
+            # Seal detection only adjusts RULE 1 confidence once a definitive marker is known - skip it
+            if fast_path:
+                self._cancel_jobs(visual_jobs)
+                visual_indicators = []
+            elif visual_jobs is not None:
+                barcode_job, layout_job = visual_jobs
+                seal_indicators, table_indicators = layout_job.result()
+                visual_indicators = barcode_job.result() + ([] if has_definitive else seal_indicators) + table_indicators
+            else:
+                visual_indicators = self._check_visual_structure(gray, skip_expensive=has_definitive)
+            
             # Log what we found
             logger.info(f"Detection results:")
             logger.info(f"  Text indicators: {len(text_indicators)}")
@@ -238,13 +896,20 @@ class Index2Detector:
             # Calculate confidence (no Florence for speed)
             # Pass filename negative signals to confidence calculation (as fallback only)
             # filename_negative_signals is already initialized as empty list, so it's always defined
-            confidence = self._calculate_confidence(text_indicators, visual_indicators, filename_negative_signals)
+            if fast_path:
+                confidence = 0.85  # RULE 1 confidence without visual corroboration
+                logger.info(f"  → FAST PATH: {len(critical_markers)} CRITICAL text markers ({critical_markers[0]}, ...), confidence={confidence:.2f}")
+            else:
+                confidence = self._calculate_confidence(text_indicators, visual_indicators, filename_negative_signals)
             
             # THRESHOLD: 0.60 (must have strong evidence, not just barcode/seal)
             is_index2 = confidence >= 0.60
             
             # Determine primary detection method
-            detection_method = self._determine_method(text_indicators, visual_indicators)
+            if fast_path:
+                detection_method = 'text_critical_fast_path'
+            else:
+                detection_method = self._determine_method(text_indicators, visual_indicators)
             
             logger.info(f"\n{'='*60}")
             logger.info(f"RESULT: is_index2={is_index2}, confidence={confidence:.2f}")
@@ -261,38 +926,11 @@ class Index2Detector:
                 'visual_indicators_count': len(visual_indicators)
             }
             
-            # Clean up temporary image file if PDF was converted
-            if 'temp_image_path' in locals() and temp_image_path and os.path.exists(temp_image_path):
-                try:
-                    os.remove(temp_image_path)
-                    # Also remove temp directory if empty
-                    temp_dir = os.path.dirname(temp_image_path)
-                    if os.path.exists(temp_dir):
-                        try:
-                            os.rmdir(temp_dir)
-                        except:
-                            pass  # Directory not empty, leave it
-                except:
-                    pass  # Cleanup failed, continue
-            
             return result
             
         except Exception as e:
             logger.error(f"Index-II detection failed: {e}", exc_info=True)
             
-            # Clean up temporary image file if PDF was converted
-            if 'temp_image_path' in locals() and temp_image_path and os.path.exists(temp_image_path):
-                try:
-                    os.remove(temp_image_path)
-                    temp_dir = os.path.dirname(temp_image_path)
-                    if os.path.exists(temp_dir):
-                        try:
-                            os.rmdir(temp_dir)
-                        except:
-                            pass
-                except:
-                    pass
-            
             return {
                 'is_index2': False,
                 'confidence': 0.0,
@@ -303,22 +941,31 @@ class Index2Detector:
                 'error': str(e)
             }
     
-    def _extract_text_robust(self, image_path: str) -> str:
+    @staticmethod
+    def _cancel_jobs(jobs: Optional[Tuple[Future, ...]]):
+        """
+        Cancel speculative pool jobs whose results are no longer needed (jobs already running finish).
+        
+        Args:
+            jobs: Futures to cancel, or None
+        """
+        for job in jobs or ():
+            job.cancel()
+    
+    def _extract_text_robust(self, gray: np.ndarray, img: Image.Image) -> str:
         """
         Enhanced OCR with multiple attempts for better Marathi extraction.
+        
+        Args:
+            gray: Grayscale image
+            img: PIL image of the same page
         """
         texts = []
         
         try:
-            img = Image.open(image_path)
-            
             # Method 1: Direct OCR with all languages
             try:
-                text1 = pytesseract.image_to_string(
-                    img, 
-                    lang='eng+hin+mar',
-                    config='--psm 6'  # Assume uniform block of text
-                )
+                text1 = self._ocr(img, psm=6)  # Assume uniform block of text
                 if text1.strip():
                     texts.append(text1)
             except Exception as e:
@@ -326,20 +973,15 @@ class Index2Detector:
             
             # Method 2: Preprocess for better contrast, then OCR
             try:
-                cv_img = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
-                if cv_img is not None:
+                if gray is not None:
                     # Increase contrast
-                    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-                    enhanced = clahe.apply(cv_img)
+                    with _CLAHE_LOCK:
+                        enhanced = _CLAHE_MILD.apply(gray)
                     # Threshold
                     _, thresh = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
                     
                     pil_enhanced = Image.fromarray(thresh)
-                    text2 = pytesseract.image_to_string(
-                        pil_enhanced,
-                        lang='eng+hin+mar',
-                        config='--psm 3'  # Fully automatic page segmentation
-                    )
+                    text2 = self._ocr(pil_enhanced, psm=3)  # Fully automatic page segmentation
                     if text2.strip():
                         texts.append(text2)
             except Exception as e:
@@ -351,12 +993,12 @@ class Index2Detector:
             # Fallback: Try with fewer languages
             if not texts:
                 try:
-                    text_fallback = pytesseract.image_to_string(img, lang='eng+hin')
+                    text_fallback = self._ocr(img, lang='eng+hin')
                     if text_fallback.strip():
                         texts.append(text_fallback)
                 except:
                     try:
-                        text_fallback = pytesseract.image_to_string(img, lang='eng')
+                        text_fallback = self._ocr(img, lang='eng')
                         if text_fallback.strip():
                             texts.append(text_fallback)
                     except:
@@ -377,118 +1019,146 @@ class Index2Detector:
             logger.warning(f"Robust text extraction failed: {e}")
             return ""
     
-    def _extract_critical_markers_from_header(self, image_path: str) -> List[Dict]:
+    def _preprocess_header_iter(self, gray: np.ndarray):
+        """
+        Lazily yield preprocessed versions of the header region, cheapest/most productive first.
+        Later variants are only computed if the earlier ones did not find a definitive marker.
+        
+        Args:
+            gray: Grayscale header region
+            
+        Yields:
+            (method index, label, PIL image) tuples
+        """
+        # Method 1: High contrast
+        with _CLAHE_LOCK:
+            enhanced = _CLAHE_STRONG.apply(gray)
+        yield 0, 'clahe', Image.fromarray(enhanced)
+        
+        # Method 2: Binary threshold
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        yield 1, 'otsu', Image.fromarray(binary)
+        
+        # Method 4: Adaptive threshold
+        adaptive = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+            cv2.THRESH_BINARY, 11, 2
+        )
+        yield 3, 'adaptive', Image.fromarray(adaptive)
+        
+        # Method 3: Inverted binary (last resort) - same Otsu threshold, so just invert method 2
+        yield 2, 'otsu_inverted', Image.fromarray(cv2.bitwise_not(binary))
+    
+    def _extract_critical_markers_from_header(self, page_gray: np.ndarray) -> List[Dict]:
         """
         NEW: Targeted extraction of Index-II markers from header region.
         Uses aggressive preprocessing to extract "सूची क्र.2", "regn:63m", etc.
+        Wide (high-DPI) headers are OCR'd at half resolution; full resolution is only
+        retried if the reduced header produced no text at all.
+        
+        Args:
+            page_gray: Grayscale image of the whole page
         """
         try:
-            img = cv2.imread(image_path)
-            if img is None:
-                return []
-            
-            height, width = img.shape[:2]
+            height, width = page_gray.shape[:2]
             
             # Focus on top 25% of document (where Index-II markers appear)
-            header_region = img[0:int(height*0.25), :]
-            
             # Aggressive preprocessing for Marathi text
-            gray = cv2.cvtColor(header_region, cv2.COLOR_BGR2GRAY)
+            gray = page_gray[0:int(height*0.25), :]
             
-            # Multiple preprocessing attempts
-            preprocessed_images = []
-            
-            # Method 1: High contrast
-            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
-            enhanced = clahe.apply(gray)
-            preprocessed_images.append(enhanced)
-            
-            # Method 2: Binary threshold
-            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            preprocessed_images.append(binary)
-            
-            # Method 3: Inverted binary
-            _, inv_binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-            preprocessed_images.append(inv_binary)
-            
-            # Method 4: Adaptive threshold
-            adaptive = cv2.adaptiveThreshold(
-                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                cv2.THRESH_BINARY, 11, 2
-            )
-            preprocessed_images.append(adaptive)
-            
-            # Try OCR on each preprocessed version
-            found_markers = []
-            # FULL Index-II markers only - no partial/ambiguous matches
-            # REMOVED: 'सूची', 'क्र', 'निबंधक' - too generic (appear in agreements/wills)
-            critical_patterns = [
-                'सूची क्र.2', 'सूची क्र.२',  # Full Index-II header
-                'index-ii', 'index ii', 'index-2',  # English Index-II
-                'regn:63m', 'regn.63m', 'regn 63m', 'regn:63',  # Registration type
-                'दुय्यम निबंधक',  # Sub-Registrar (full phrase)
-                'गावाचे नाव', 'विलेखाचा प्रकार', 'बाजारभाव',  # Index-II specific fields
-                'सब रजिस्ट्रार', 'उप निबंधक'  # Alternative registrar terms
-            ]
-            
-            for idx, preprocessed in enumerate(preprocessed_images):
-                try:
-                    pil_img = Image.fromarray(preprocessed)
-                    
-                    # Try with reduced PSM modes for speed (optimized from [6,7,8,11] to [6,7])
-                    for psm in [6, 7]:  # Reduced PSM modes for faster processing
-                        text = pytesseract.image_to_string(
-                            pil_img,
-                            lang='eng+hin+mar',
-                            config=f'--psm {psm}'
-                        )
-                        
-                        text_lower = text.lower()
-                        
-                        # Check for critical patterns
-                        for pattern in critical_patterns:
-                            pattern_lower = pattern.lower()
-                            if pattern_lower in text_lower or pattern in text:
-                                # Avoid duplicates
-                                if not any(m['marker'] == pattern for m in found_markers):
-                                    found_markers.append({
-                                        'marker': pattern,
-                                        'type': 'CRITICAL',
-                                        'description': f'Index-II marker (header extraction method {idx}, PSM {psm})',
-                                        'weight': 2.0
-                                    })
-                                    logger.info(f"✓ Found CRITICAL marker in header: {pattern} (method {idx}, PSM {psm})")
-                
-                except Exception as e:
-                    logger.debug(f"Header OCR method {idx} failed: {e}")
-                    continue
+            if 0 < self.header_downsample_width < width:
+                # Tesseract time is roughly linear in pixels - markers are still legible at half scale
+                reduced = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+                found_markers, got_text = self._scan_header(reduced)
+                if got_text:
+                    return found_markers
+                logger.info("No text in downsampled header - retrying header extraction at full resolution")
             
+            found_markers, _ = self._scan_header(gray)
             return found_markers
             
         except Exception as e:
             logger.warning(f"Header extraction failed: {e}")
             return []
     
-    def _check_text_content(self, image_path: str) -> List[Dict]:
+    def _scan_header(self, gray: np.ndarray) -> Tuple[List[Dict], bool]:
         """
-        Extract text and look for Index-II specific markers.
-        Enhanced with robust OCR for better Marathi extraction.
+        OCR the preprocessed header variants and collect CRITICAL markers. Preprocessing
+        methods are tried in stages and the remaining ones are skipped once a DEFINITIVE
+        marker is found (it decides the document on its own).
+        
+        Args:
+            gray: Grayscale header region
+            
+        Returns:
+            (found markers, whether any OCR attempt returned text)
+        """
+        def run_ocr(job):
+            idx, psm, pil_img = job
+            try:
+                return self._ocr(pil_img, psm=psm)
+            except Exception as e:
+                logger.debug(f"Header OCR method {idx} (PSM {psm}) failed: {e}")
+                return None
+        
+        # Try OCR on each preprocessed version
+        found_markers = []
+        got_text = False
+        for idx, label, pil_img in self._preprocess_header_iter(gray):
+            # Try with reduced PSM modes for speed (optimized from [6,7,8,11] to [6,7])
+            jobs = [(idx, psm, pil_img) for psm in (6, 7)]  # Reduced PSM modes for faster processing
+            if self._header_ocr_pool is not None:
+                texts = list(self._header_ocr_pool.map(run_ocr, jobs))
+            else:
+                texts = [run_ocr(job) for job in jobs]
+            
+            # Collect markers in PSM order so results match sequential OCR
+            for (_, psm, _), text in zip(jobs, texts):
+                if not text or not text.strip():
+                    continue
+                got_text = True
+                
+                present = self._find_markers(text.lower())
+                
+                # Check for critical patterns
+                for pattern, pattern_lower in self._header_items:
+                    if pattern_lower in present:
+                        # Avoid duplicates
+                        if not any(m['marker'] == pattern for m in found_markers):
+                            found_markers.append({
+                                'marker': pattern,
+                                'type': 'CRITICAL',
+                                'description': f'Index-II marker (header extraction method {idx}, PSM {psm})',
+                                'weight': 2.0
+                            })
+                            logger.info(f"✓ Found CRITICAL marker in header: {pattern} (method {idx}, PSM {psm})")
+            
+            if any(m['marker'] in _DEFINITIVE_MARKERS for m in found_markers):
+                logger.info(f"Header extraction: definitive marker found by '{label}' preprocessing - skipping remaining methods")
+                break
+        
+        return found_markers, got_text
+    
+    def _check_text_content(self, text: str, gray: np.ndarray) -> List[Dict]:
+        """
+        Look for Index-II specific markers in the extracted text.
         Now includes targeted header extraction when standard OCR fails.
+        
+        Args:
+            text: Text extracted from the page by _extract_text_robust
+            gray: Grayscale image (used for header extraction)
         """
         try:
-            # Use robust text extraction
-            text = self._extract_text_robust(image_path)
             text_lower = text.lower()
             
+            # All markers present in the text (case-insensitive, also inside longer OCR words)
+            present = self._find_markers(text_lower)
+            
             indicators_found = []
             
             # Check CRITICAL markers - UNIQUE to Index-II only
-            for marker, description in self.critical_markers.items():
-                # Check both original and lowercase
-                # Also check if marker appears as part of a word (for OCR errors)
-                marker_lower = marker.lower()
-                if (marker in text or marker_lower in text_lower or 
-                    any(marker_lower in word.lower() for word in text.split() if len(word) > 3)):
+            for marker, marker_lower, description in self._critical_items:
+                if marker_lower in present:
                     indicators_found.append({
                         'marker': marker,
                         'type': 'CRITICAL',
@@ -499,8 +1169,9 @@ class Index2Detector:
             
             # Also check for partial matches (OCR might miss some characters)
             # Check for "सूची" and "क्र" separately (OCR might split them)
-            if 'सूची' in text or 'सूची' in text_lower:
-                if 'क्र' in text or 'क्र' in text_lower or '2' in text or 'ii' in text_lower:
+            # (Devanagari and digits have no case - testing text_lower alone covers text as well)
+            if 'सूची' in text_lower:
+                if 'क्र' in text_lower or '2' in text_lower or 'ii' in text_lower:
                     # Found both parts - likely Index-II
                     indicators_found.append({
                         'marker': 'सूची + क्र.2 (partial match)',
@@ -513,9 +1184,7 @@ class Index2Detector:
             # Check for "regn" variations (OCR might miss colon or have spacing)
             if 'regn' in text_lower:
                 # Check if followed by numbers (63, 63m, etc.)
-                import re
-                regn_pattern = r'regn[:\s\.]*63[mM]?'
-                if re.search(regn_pattern, text_lower):
+                if _REGN_RE.search(text_lower):
                     indicators_found.append({
                         'marker': 'regn:63m (pattern match)',
                         'type': 'CRITICAL',
@@ -527,12 +1196,12 @@ class Index2Detector:
             # If no critical markers found, try targeted header extraction
             if not any(ind['type'] == 'CRITICAL' for ind in indicators_found):
                 logger.info("No critical markers in standard OCR - trying targeted header extraction...")
-                header_markers = self._extract_critical_markers_from_header(image_path)
+                header_markers = self._extract_critical_markers_from_header(gray)
                 indicators_found.extend(header_markers)
             
             # Check STRONG markers
-            for marker, description in self.strong_markers.items():
-                if marker in text or marker.lower() in text_lower:
+            for marker, marker_lower, description in self._strong_items:
+                if marker_lower in present:
                     indicators_found.append({
                         'marker': marker,
                         'type': 'STRONG',
@@ -542,8 +1211,8 @@ class Index2Detector:
                     logger.info(f"✓ Found STRONG marker: {marker}")
             
             # Check SUPPORTING markers
-            for marker, description in self.supporting_markers.items():
-                if marker.lower() in text_lower:
+            for marker, marker_lower, description in self._supporting_items:
+                if marker_lower in present:
                     indicators_found.append({
                         'marker': marker,
                         'type': 'SUPPORTING',
@@ -558,18 +1227,38 @@ class Index2Detector:
             logger.warning(f"Text content check failed: {e}")
             return []
     
-    def _check_visual_structure(self, image_path: str) -> List[Dict]:
+    def _check_visual_structure(self, gray: np.ndarray, skip_expensive: bool = False) -> List[Dict]:
         """
         IMPROVED visual detection - should work even if OCR fails.
         Checks for barcodes, seals, table structure, and stamps.
+        
+        Args:
+            gray: Grayscale image
+            skip_expensive: Skip circular seal detection
         """
         try:
-            img = cv2.imread(image_path)
-            if img is None:
-                return []
+            indicators_found = self._check_barcode_structure(gray)
+            seal_indicators, table_indicators = self._check_layout_structure(gray, check_seals=not skip_expensive)
+            indicators_found += seal_indicators + table_indicators
+            
+            # 4. SKIP colored stamp detection - too generic
+            # NOC/No Dues also have stamps, so this is not a good indicator
             
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            height, width = gray.shape
+            return indicators_found
+            
+        except Exception as e:
+            logger.warning(f"Visual structure check failed: {e}")
+            return []
+    
+    def _check_barcode_structure(self, gray: np.ndarray) -> List[Dict]:
+        """
+        Check the top of the page for a barcode (edge projection peaks and decoding).
+        
+        Args:
+            gray: Grayscale image
+        """
+        try:
+            height = gray.shape[0]
             indicators_found = []
             
             # 1. BARCODE DETECTION - but only in TOP section
@@ -577,39 +1266,29 @@ class Index2Detector:
             
             # Method A: Edge detection for vertical lines
             edges = cv2.Canny(top_section, 30, 100)
-            vertical_projection = np.sum(edges, axis=0)
-            
-            if len(vertical_projection) > 0:
-                # Barcode has distinct peaks
-                mean_proj = np.mean(vertical_projection)
-                std_proj = np.std(vertical_projection)
-                peaks = vertical_projection > (mean_proj + 2 * std_proj)
-                peak_count = np.sum(peaks)
-                
-                # BARCODE must have many peaks in TOP section specifically
-                # Added upper limit to avoid noise
-                if 20 < peak_count < 200:  # Reasonable range
-                    indicators_found.append({
-                        'marker': f'barcode_top_section',
-                        'type': 'VISUAL_SUPPORTING',  # DOWNGRADED from CRITICAL
-                        'description': 'Barcode in header area',
-                        'weight': 0.5  # Lowered weight
-                    })
-                    logger.info(f"✓ Found barcode pattern with {peak_count} peaks")
             
-            # Method B: Detect actual barcode using pyzbar (more reliable)
+            # Barcode has distinct peaks in the vertical projection
+            peak_count = _barcode_peak_count(edges)
+            
+            # BARCODE must have many peaks in TOP section specifically
+            # Added upper limit to avoid noise
+            if 20 < peak_count < 200:  # Reasonable range
+                indicators_found.append({
+                    'marker': f'barcode_top_section',
+                    'type': 'VISUAL_SUPPORTING',  # DOWNGRADED from CRITICAL
+                    'description': 'Barcode in header area',
+                    'weight': 0.5  # Lowered weight
+                })
+                logger.info(f"✓ Found barcode pattern with {peak_count} peaks")
+            
+            # Method B: Decode actual barcode (OpenCV detector or pyzbar - more reliable)
             if self.use_barcode_lib:
                 try:
-                    pil_img = Image.open(image_path)
-                    # Only check top portion
-                    width_pil, height_pil = pil_img.size
-                    top_crop = pil_img.crop((0, 0, width_pil, int(height_pil * 0.15)))
-                    barcodes = pyzbar.decode(top_crop)
+                    # Only check top portion (slice the decoded array instead of re-reading the file)
+                    barcode_data = self._decode_barcode(top_section)
                     
-                    if len(barcodes) > 0:
+                    if barcode_data:
                         # Check barcode data for Index-II patterns
-                        barcode_data = barcodes[0].data.decode('utf-8', errors='ignore')
-                        
                         # Index-II barcodes often contain date patterns or specific formats
                         if any(char.isdigit() for char in barcode_data) and len(barcode_data) > 8:
                             indicators_found.append({
@@ -622,81 +1301,132 @@ class Index2Detector:
                 except Exception as e:
                     logger.debug(f"Barcode decode error: {e}")
             
-            # 2. CIRCULAR SEAL DETECTION - MUCH MORE CONSERVATIVE
-            # Blur to reduce noise
-            blurred = cv2.GaussianBlur(gray, (9, 9), 2)
+            return indicators_found
             
-            try:
-                circles = cv2.HoughCircles(
-                    blurred,
-                    cv2.HOUGH_GRADIENT,
-                    dp=1,
-                    minDist=100,  # INCREASED - seals should be far apart
-                    param1=100,   # INCREASED - more strict
-                    param2=35,     # INCREASED - more strict
-                    minRadius=40, # INCREASED - seals are reasonably large
-                    maxRadius=150 # DECREASED - not too large
-                )
-                
-                if circles is not None:
-                    seal_count = len(circles[0])
-                    
-                    # Index-II typically has 1-4 official seals, not 728!
-                    if 1 <= seal_count <= 5:  # Reasonable range
-                        indicators_found.append({
-                            'marker': f'{seal_count}_official_seals',
-                            'type': 'VISUAL_SUPPORTING',  # DOWNGRADED
-                            'description': f'{seal_count} circular seals',
-                            'weight': 0.4 + (seal_count * 0.1)
-                        })
-                        logger.info(f"✓ Found {seal_count} circular seal(s)")
-                    else:
-                        logger.warning(f"Found {seal_count} circles - likely noise, ignoring")
-            except Exception as e:
-                logger.debug(f"Seal detection failed: {e}")
+        except Exception as e:
+            logger.warning(f"Barcode structure check failed: {e}")
+            return []
+    
+    def _check_layout_structure(self, gray: np.ndarray, check_seals: bool = True) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Check for circular seals and the payment table grid. Both run on one half-resolution
+        Otsu binary page (grid lines and seal rings survive a 2x downsample).
+        
+        Args:
+            gray: Grayscale image
+            check_seals: Run circular seal detection
             
-            # 3. TABLE STRUCTURE DETECTION (Payment details table)
-            try:
-                horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))
-                vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 40))
-                
-                _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-                
-                h_lines = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, horizontal_kernel, iterations=2)
-                v_lines = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, vertical_kernel, iterations=2)
-                
-                h_count = np.sum(h_lines) / 255
-                v_count = np.sum(v_lines) / 255
-                
-                # Index-II has DENSE grid structure (payment details table)
-                # NOC/No Dues have simpler tables
-                if h_count > width * 3 and v_count > height * 2:  # More strict thresholds
+        Returns:
+            Tuple of (seal indicators, table indicators)
+        """
+        try:
+            small = cv2.pyrDown(cv2.UMat(gray) if self.use_opencl else gray)
+            _, thresh = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+            small_height, small_width = (gray.shape[0] + 1) // 2, (gray.shape[1] + 1) // 2
+            
+            seal_indicators = []
+            if check_seals:
+                seal_indicators = self._check_seal_structure(thresh.get() if self.use_opencl else thresh)
+            return seal_indicators, self._check_table_structure(thresh, small_width, small_height)
+            
+        except Exception as e:
+            logger.warning(f"Layout structure check failed: {e}")
+            return [], []
+    
+    def _check_seal_structure(self, thresh: np.ndarray) -> List[Dict]:
+        """
+        Check for circular official seals (round outer contours of the binary page).
+        
+        Args:
+            thresh: Half-resolution inverted binary page
+        """
+        indicators_found = []
+        
+        # 2. CIRCULAR SEAL DETECTION - MUCH MORE CONSERVATIVE
+        try:
+            # Seal rings are large, nearly circular outer contours - far cheaper to find than Hough
+            # voting. Radii are at half scale (seals are 40-150 px at full scale)
+            contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            seal_count = 0
+            for contour in contours:
+                _, radius = cv2.minEnclosingCircle(contour)
+                if not 20 <= radius <= 75:
+                    continue
+                perimeter = cv2.arcLength(contour, True)
+                # Circularity 4*pi*area/perimeter^2 is 1.0 for a perfect circle
+                if perimeter > 0 and 4 * math.pi * cv2.contourArea(contour) / perimeter ** 2 > 0.75:
+                    seal_count += 1
+            
+            if seal_count:
+                # Index-II typically has 1-4 official seals, not 728!
+                if 1 <= seal_count <= 5:  # Reasonable range
                     indicators_found.append({
-                        'marker': 'dense_table_grid',
+                        'marker': f'{seal_count}_official_seals',
                         'type': 'VISUAL_SUPPORTING',  # DOWNGRADED
-                        'description': 'Dense table structure',
-                        'weight': 0.5
+                        'description': f'{seal_count} circular seals',
+                        'weight': 0.4 + (seal_count * 0.1)
                     })
-                    logger.info(f"✓ Found table structure (H:{h_count:.0f}, V:{v_count:.0f})")
-            except Exception as e:
-                logger.debug(f"Table detection failed: {e}")
-            
-            # 4. SKIP colored stamp detection - too generic
-            # NOC/No Dues also have stamps, so this is not a good indicator
-            
-            return indicators_found
-            
+                    logger.info(f"✓ Found {seal_count} circular seal(s)")
+                else:
+                    logger.warning(f"Found {seal_count} circles - likely noise, ignoring")
         except Exception as e:
-            logger.warning(f"Visual structure check failed: {e}")
-            return []
+            logger.debug(f"Seal detection failed: {e}")
+        
+        return indicators_found
     
-    def _check_negative_signals(self, image_path: str) -> List[Dict]:
+    def _check_table_structure(self, thresh, small_width: int, small_height: int) -> List[Dict]:
+        """
+        Check for the dense payment-details table grid.
+        
+        Args:
+            thresh: Half-resolution inverted binary page (numpy array or cv2.UMat)
+            small_width: Width of the half-resolution page
+            small_height: Height of the half-resolution page
+        """
+        indicators_found = []
+        
+        # 3. TABLE STRUCTURE DETECTION (Payment details table)
+        try:
+            # Kernels and line-length thresholds are halved to match the half-resolution page
+            if NUMBA_AVAILABLE and not self.use_opencl:
+                # Same counts as the openings below, from run lengths in one pass (no morphology buffers)
+                h_count, v_count = _grid_line_pixels(thresh, _TABLE_LINE_LEAD, _TABLE_LINE_TRAIL)
+            else:
+                # Count line pixels directly; the vertical pass (written into the same buffer)
+                # only runs when the horizontal threshold is met
+                lines = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, _TABLE_H_KERNEL, iterations=2)
+                h_count = cv2.countNonZero(lines)
+                v_count = 0
+                if h_count > small_width * 3:
+                    cv2.morphologyEx(thresh, cv2.MORPH_OPEN, _TABLE_V_KERNEL, dst=lines, iterations=2)
+                    v_count = cv2.countNonZero(lines)
+            
+            # Index-II has DENSE grid structure (payment details table)
+            # NOC/No Dues have simpler tables
+            if h_count > small_width * 3 and v_count > small_height * 2:  # More strict thresholds
+                indicators_found.append({
+                    'marker': 'dense_table_grid',
+                    'type': 'VISUAL_SUPPORTING',  # DOWNGRADED
+                    'description': 'Dense table structure',
+                    'weight': 0.5
+                })
+                logger.info(f"✓ Found table structure (H:{h_count:.0f}, V:{v_count:.0f})")
+        except Exception as e:
+            logger.debug(f"Table detection failed: {e}")
+        
+        return indicators_found
+    
+    def _check_negative_signals(self, text: str, early_exit_on: Optional[frozenset] = None) -> List[Dict]:
         """
         Check for signals that indicate it's NOT Index-II.
         Enhanced to work even with partial OCR extraction.
+        
+        Args:
+            text: OCR text already extracted from the page
+            early_exit_on: Optional set of markers that decide the result on their own - the
+                first exact match is returned alone, skipping the partial-match scan
         """
         try:
-            text = self._extract_text_robust(image_path)
             text_lower = text.lower()
             
             # If text is very short (< 50 chars), likely handwritten or unreadable
@@ -713,55 +1443,29 @@ class Index2Detector:
             
             negative_signals = []
             
-            # NOC/Certificate/Agreement/Will markers (case-insensitive, partial matches)
-            noc_markers = {
-                # NOC/No Dues
-                'no objection certificate': 'NOC certificate',
-                'no objection': 'NOC',
-                'noc': 'NOC abbreviation',
-                'no dues certificate': 'No Dues certificate',
-                'no dues': 'No Dues',
-                'clearance certificate': 'Clearance',
-                'non encumbrance': 'Non-encumbrance',
-                'bonafide certificate': 'Bonafide',
-                'society': 'Housing society document',
-                'co-op': 'Cooperative society',
-                'co-operative': 'Cooperative society',
-                'cooperative': 'Cooperative society',
-                'housing society': 'Housing society',
-                'to whomsoever': 'Certificate phrase',
-                'to whom': 'Certificate phrase',
-                'this is to certify': 'Certificate phrase',
-                'property tax': 'Tax receipt',
-                'tax receipt': 'Tax receipt',
-                # NEW: Agreement/Will/Testament markers
-                'deed of assignment': 'Assignment deed',
-                'assignment': 'Assignment document',
-                'deed of transfer': 'Transfer deed',
-                'agreement': 'Agreement document',
-                'sale agreement': 'Sale agreement',
-                'purchase agreement': 'Purchase agreement',
-                'agreement to sell': 'Sale agreement',
-                'will': 'Testament/Will',
-                'testament': 'Testament document',
-                'testator': 'Will document',
-                'executor': 'Will document',
-                'bequeath': 'Will document',
-                'bequeathed': 'Will document',
-                'vendor': 'Sale deed',
-                'purchaser': 'Purchase deed',
-                'assignor': 'Assignment deed',
-                'assignee': 'Assignment deed',
-                'transferor': 'Transfer deed',
-                'transferee': 'Transfer deed',
-                'power of attorney': 'Power of attorney (not Index-II)',
-                'poa': 'Power of attorney',
-            }
+            
+            # Exact matches of all markers in one scan, then partial matches for the rest
+            present = self._negative_signal_matcher.find(text_lower)
+            
+            if early_exit_on:
+                for marker, description, _ in self._negative_signal_items:
+                    if marker in present and marker in early_exit_on:
+                        logger.warning(f"⚠ Found negative signal: {marker}")
+                        return [{
+                            'marker': marker,
+                            'description': description,
+                            'penalty': 0.4
+                        }]
+            
+            partial_matches = self._find_partial_markers(
+                [(m, chars) for m, _, chars in self._negative_signal_items if m not in present and len(m) > 4],
+                _WORD_RE.findall(text_lower)
+            )
             
             # Check for markers (including partial word matches for OCR errors)
-            for marker, description in noc_markers.items():
+            for marker, description, marker_chars in self._negative_signal_items:
                 # Check exact match
-                if marker in text_lower:
+                if marker in present:
                     negative_signals.append({
                         'marker': marker,
                         'description': description,
@@ -770,21 +1474,13 @@ class Index2Detector:
                     logger.warning(f"⚠ Found negative signal: {marker}")
                 # Also check if marker appears as part of a word (for OCR errors)
                 # e.g., "society" might be extracted as "societ" or "societv"
-                elif len(marker) > 4:  # Only for longer markers to avoid false positives
-                    marker_chars = set(marker.lower())
-                    # Check if most characters of marker appear in text
-                    for word in text_lower.split():
-                        if len(word) >= len(marker) * 0.7:  # At least 70% of marker length
-                            word_chars = set(word)
-                            overlap = len(marker_chars & word_chars) / len(marker_chars)
-                            if overlap >= 0.8:  # 80% character overlap
-                                negative_signals.append({
-                                    'marker': f'{marker}_partial_match',
-                                    'description': f'{description} (partial OCR match)',
-                                    'penalty': 0.3  # Lower penalty for partial match
-                                })
-                                logger.warning(f"⚠ Found negative signal (partial): {marker} in word '{word}'")
-                                break
+                elif marker in partial_matches:
+                    negative_signals.append({
+                        'marker': sys.intern(f'{marker}_partial_match'),
+                        'description': f'{description} (partial OCR match)',
+                        'penalty': 0.3  # Lower penalty for partial match
+                    })
+                    logger.warning(f"⚠ Found negative signal (partial): {marker} in word '{partial_matches[marker]}'")
             
             return negative_signals
             
@@ -792,6 +1488,55 @@ class Index2Detector:
             logger.warning(f"Negative signal check failed: {e}")
             return []
     
+    @staticmethod
+    def _find_partial_markers(markers: List[Tuple[str, frozenset]], words: List[str]) -> Dict[str, str]:
+        """
+        Find markers that appear in the text as OCR-damaged words.
+        
+        A word matches when it is at least 70% of the marker length and contains 80% of the
+        marker's characters (character sets packed as bitmasks and compared in one Numba/NumPy
+        kernel).
+        
+        Args:
+            markers: (marker, marker character set) tuples to check
+            words: Words of the lowercased page text
+            
+        Returns:
+            Dictionary mapping each matched marker to the first word that matched it
+        """
+        matches = {}
+        if not markers or not words:
+            return matches
+        
+        # One bit per character used by the markers (other characters can't overlap)
+        alphabet = frozenset().union(*(marker_chars for _, marker_chars in markers))
+        if len(alphabet) > 64:
+            for marker, marker_chars in markers:
+                for word in words:
+                    if len(word) >= len(marker) * 0.7:  # At least 70% of marker length
+                        overlap = len(marker_chars & set(word)) / len(marker_chars)
+                        if overlap >= 0.8:  # 80% character overlap
+                            matches[marker] = word
+                            break
+            return matches
+        
+        bits = {char: 1 << index for index, char in enumerate(sorted(alphabet))}
+        unique_words = list(dict.fromkeys(words))
+        word_masks = np.fromiter(
+            (sum(bits.get(char, 0) for char in set(word)) for word in unique_words),
+            dtype=np.uint64, count=len(unique_words)
+        )
+        word_lens = np.fromiter((len(word) for word in unique_words), dtype=np.int64, count=len(unique_words))
+        marker_masks = np.array([sum(bits[char] for char in chars) for _, chars in markers], dtype=np.uint64)
+        marker_lens = np.array([len(marker) for marker, _ in markers], dtype=np.int64)
+        marker_char_counts = np.array([len(chars) for _, chars in markers], dtype=np.int64)
+        
+        first_words = _first_overlap_match(word_masks, word_lens, marker_masks, marker_lens, marker_char_counts)
+        for (marker, _), index in zip(markers, first_words):
+            if index >= 0:
+                matches[marker] = unique_words[index]
+        return matches
+    
     def _calculate_confidence(self, text_indicators: List[Dict], 
                              visual_indicators: List[Dict],
                              filename_negative_signals: List[Dict] = None) -> float:
@@ -804,9 +1549,19 @@ class Index2Detector:
             filename_negative_signals = []
         
         # Check for negative signals from content
+        # Invariants that make parts of the scan dead work:
+        # - With a DEFINITIVE CRITICAL marker, negative signals never change the result (RULE 0
+        #   defers to it and RULE 1 accepts) - skip the scan
+        # - Without one, a single strong negative signal decides RULE 0 (any penalty >= 0.20 clamps
+        #   its confidence to 0.0) - stop at the first exact one, before the partial-match scan
         negative_signals = []
-        if self.current_image_path:
-            negative_signals = self._check_negative_signals(self.current_image_path)
+        has_definitive = any(
+            ind['type'] == 'CRITICAL' and ind['marker'] in _DEFINITIVE_MARKERS for ind in text_indicators
+        )
+        if self.current_text is not None and not has_definitive:
+            negative_signals = self._check_negative_signals(
+                self.current_text, early_exit_on=self._strong_negative_signals
+            )
         
         # Add filename negative signals (fallback when OCR fails)
         if filename_negative_signals:
@@ -832,50 +1587,29 @@ class Index2Detector:
         # RULE 0: STRICT - Negative signals ALWAYS take priority unless we have FULL unambiguous markers
         if len(negative_signals) > 0:
             # Check negative signal types - expanded to include agreement/will/testament
-            strong_negative_markers = [
-                # NOC/No Dues
-                'no objection certificate', 'no objection', 'noc',
-                'no dues certificate', 'no dues',
-                'clearance certificate', 'society',
-                # Agreement/Will/Testament
-                'deed of assignment', 'assignment', 'agreement',
-                'sale agreement', 'purchase agreement', 'agreement to sell',
-                'will', 'testament', 'testator', 'bequeath', 'bequeathed',
-                'vendor', 'purchaser', 'assignor', 'assignee',
-                'transferor', 'transferee', 'power of attorney', 'poa'
-            ]
-            
             found_strong_negative = any(
-                any(sn in sig['marker'].lower() for sn in strong_negative_markers)
-                for sig in negative_signals
+                sig['marker'] in self._strong_negative_signals for sig in negative_signals
             )
             
             if found_strong_negative:
                 # Check if we have FULL, UNAMBIGUOUS Index-II markers (NOT partial matches)
                 # Only ignore negative signals if we have COMPLETE, EXACT Index-II markers
                 # Partial matches like "सूची + क्र.2 (partial match)" are NOT sufficient
-                full_unambiguous_markers = [
-                    'सूची क्र.2', 'सूची क्र.२',  # Full exact match only
-                    'index-ii', 'index ii',  # Full exact match
-                    'regn:63m', 'regn.63m',  # Full exact match
-                    'दुय्यम निबंधक'  # Full exact match
-                    # REMOVED: 'सूची + क्र.2 (partial match)' - partial matches should NOT override negative signals
-                ]
-                
+                # REMOVED: 'सूची + क्र.2 (partial match)' - partial matches should NOT override negative signals
                 has_full_marker = any(
-                    ind['marker'] in full_unambiguous_markers
+                    ind['marker'] in _DEFINITIVE_MARKERS
                     for ind in text_critical
                 )
                 
                 if has_full_marker:
                     # Has FULL, EXACT Index-II marker - negative signal is false positive
-                    logger.info(f"  → FULL Index-II marker found ({[ind['marker'] for ind in text_critical if ind['marker'] in full_unambiguous_markers][0]}) - ignoring negative signals")
+                    logger.info(f"  → FULL Index-II marker found ({[ind['marker'] for ind in text_critical if ind['marker'] in _DEFINITIVE_MARKERS][0]}) - ignoring negative signals")
                     # Continue to RULE 1
                 else:
                     # Only partial/generic markers (like "गावाचे नाव" or "सूची + क्र.2 (partial match)") - trust negative signals
                     penalty = sum(sig['penalty'] for sig in negative_signals)
                     confidence = max(0.0, 0.20 - penalty)  # Lower base (0.20 instead of 0.25)
-                    partial_markers = [ind['marker'] for ind in text_critical if ind['marker'] not in full_unambiguous_markers]
+                    partial_markers = [ind['marker'] for ind in text_critical if ind['marker'] not in _DEFINITIVE_MARKERS]
                     logger.info(f"  → RULE 0: STRONG negative signals (agreement/will/NOC) + only partial markers ({partial_markers}) = NOT Index-II, confidence={confidence:.2f}")
                     return confidence
         
@@ -889,14 +1623,7 @@ class Index2Detector:
         # RULE 1: CRITICAL text marker (DEFINITIVE markers only - partial/weak markers handled in RULE 0)
         # Only definitive markers like "सूची क्र.2", "index-ii", "regn:63m", "दुय्यम निबंधक"
         # Weak markers like "गावाचे नाव" alone are NOT enough if negative signals present
-        definitive_markers = [
-            'सूची क्र.2', 'सूची क्र.२',
-            'index-ii', 'index ii',
-            'regn:63m', 'regn.63m',
-            'दुय्यम निबंधक'
-        ]
-        
-        definitive_critical = [ind for ind in text_critical if ind['marker'] in definitive_markers]
+        definitive_critical = [ind for ind in text_critical if ind['marker'] in _DEFINITIVE_MARKERS]
         
         if len(definitive_critical) >= 1:
             confidence = 0.85 + min(0.1, visual_score * 0.02)
@@ -905,7 +1632,7 @@ class Index2Detector:
         
         # If we have weak critical markers (like "गावाचे नाव") but negative signals, reject
         if len(text_critical) >= 1 and len(negative_signals) > 0:
-            weak_markers = [ind['marker'] for ind in text_critical if ind['marker'] not in definitive_markers]
+            weak_markers = [ind['marker'] for ind in text_critical if ind['marker'] not in _DEFINITIVE_MARKERS]
             if weak_markers:
                 penalty = sum(sig['penalty'] for sig in negative_signals)
                 confidence = max(0.0, 0.25 - penalty)
@@ -920,18 +1647,20 @@ class Index2Detector:
         
         # RULE 3: Circumstantial evidence (barcode+table+payment terms, NO negatives)
         # STRICT: Agreement/Will docs also have payment tables but are NOT Index-II
-        has_barcode = any('barcode' in ind['marker'].lower() for ind in visual_indicators)
-        has_table = any('table' in ind['marker'].lower() for ind in visual_indicators)
-        payment_markers = ['stamp duty', 'registration fee', 'echallan']
-        found_payment_terms = [ind for ind in text_indicators 
-                              if any(pm in ind['marker'].lower() for pm in payment_markers)]
+        # Indicator markers are all lowercase (marker tables and generated names), so no .lower() here
+        # One pass over each indicator list
+        has_barcode = has_table = False
+        for ind in visual_indicators:
+            has_barcode = has_barcode or 'barcode' in ind['marker']
+            has_table = has_table or 'table' in ind['marker']
+        payment_term_count = sum(ind['marker'] in _PAYMENT_MARKERS for ind in text_indicators)
         
         # CRITICAL: Must have NO negative signals AND sufficient text indicators
         # Agreement/Will docs have payment tables but are NOT Index-II
-        if has_barcode and has_table and len(found_payment_terms) >= 2:
+        if has_barcode and has_table and payment_term_count >= 2:
             if len(negative_signals) == 0 and len(text_indicators) >= 2:
                 confidence = 0.70
-                logger.info(f"  → RULE 3: CIRCUMSTANTIAL (barcode+table+{len(found_payment_terms)} payments, no negatives), confidence={confidence:.2f}")
+                logger.info(f"  → RULE 3: CIRCUMSTANTIAL (barcode+table+{payment_term_count} payments, no negatives), confidence={confidence:.2f}")
                 return confidence
             else:
                 logger.info(f"  → RULE 3: Pattern matches BUT negative signals present ({len(negative_signals)}) or insufficient text ({len(text_indicators)}) - NOT Index-II")
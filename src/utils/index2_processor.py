@@ -4,7 +4,8 @@ Main component that routes documents to Index-II specialized pipeline or general
 """
 
 import logging
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 import os
 
 from src.utils.index2_detector import Index2Detector
@@ -13,6 +14,50 @@ from src.utils.index2_validator import Index2Validator
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class Index2Result:
+    """Result of Index-II processing (serialized with to_dict() for API responses)."""
+    status: str
+    final_quality_score: float
+    decision: str
+    document_type: str
+    message: str
+    rejection_reason: str
+    index2_processing: bool
+    detection_confidence: Optional[float] = None
+    detection_method: Optional[str] = None
+    indicators_found: List[Dict] = field(default_factory=list)
+    validation_details: Dict = field(default_factory=dict)
+    is_actually_index2: Optional[bool] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """Convert to the result dictionary returned by the API."""
+        result = {
+            'status': self.status,
+            'final_quality_score': self.final_quality_score,
+            'decision': self.decision,
+            'document_type': self.document_type
+        }
+
+        # Detection details are only reported for documents processed as Index-II
+        if self.index2_processing:
+            result['detection_confidence'] = self.detection_confidence
+            result['detection_method'] = self.detection_method
+            result['indicators_found'] = self.indicators_found
+        result['message'] = self.message
+        result['rejection_reason'] = self.rejection_reason
+        if self.index2_processing:
+            result['validation_details'] = self.validation_details
+        result['index2_processing'] = self.index2_processing
+        if self.is_actually_index2 is not None:
+            result['is_actually_index2'] = self.is_actually_index2
+        if self.error is not None:
+            result['error'] = self.error
+
+        return result
+
+
 class Index2Processor:
     """
     Main processor for Index-II documents.
@@ -79,20 +124,20 @@ class Index2Processor:
                         logger.warning("Document rejected for being handwritten - likely NOT Index-II, may be misclassified")
                         is_actually_index2 = False
                 
-                return {
-                    'status': status,
-                    'final_quality_score': result['score'],
-                    'decision': result['decision'],
-                    'document_type': 'INDEX-II' if is_actually_index2 else 'GENERAL',
-                    'detection_confidence': detection['confidence'],
-                    'detection_method': detection.get('detection_method', 'unknown'),
-                    'indicators_found': detection.get('indicators_found', []),
-                    'message': self._format_message(result, detection, is_actually_index2),
-                    'rejection_reason': rejection_reason,
-                    'validation_details': result.get('validation_details', {}),
-                    'index2_processing': True,
-                    'is_actually_index2': is_actually_index2
-                }
+                return Index2Result(
+                    status=status,
+                    final_quality_score=result['score'],
+                    decision=result['decision'],
+                    document_type='INDEX-II' if is_actually_index2 else 'GENERAL',
+                    detection_confidence=detection['confidence'],
+                    detection_method=detection.get('detection_method', 'unknown'),
+                    indicators_found=detection.get('indicators_found', []),
+                    message=self._format_message(result, detection, is_actually_index2),
+                    rejection_reason=rejection_reason,
+                    validation_details=result.get('validation_details', {}),
+                    index2_processing=True,
+                    is_actually_index2=is_actually_index2
+                ).to_dict()
             else:
                 # Not Index-II - use general pipeline
                 logger.info(
@@ -106,15 +151,15 @@ class Index2Processor:
                     general_result['index2_detection_confidence'] = detection['confidence']
                     return general_result
                 else:
-                    return {
-                        'status': 'REJECTED',
-                        'final_quality_score': 0,
-                        'decision': 'REJECT',
-                        'document_type': 'GENERAL',
-                        'message': 'Document is not Index-II and general pipeline not available',
-                        'rejection_reason': 'Not Index-II document',
-                        'index2_processing': False
-                    }
+                    return Index2Result(
+                        status='REJECTED',
+                        final_quality_score=0,
+                        decision='REJECT',
+                        document_type='GENERAL',
+                        message='Document is not Index-II and general pipeline not available',
+                        rejection_reason='Not Index-II document',
+                        index2_processing=False
+                    ).to_dict()
                     
         except Exception as e:
             logger.error(f"Index-II processing failed: {e}", exc_info=True)
@@ -124,16 +169,16 @@ class Index2Processor:
                 logger.warning("Falling back to general pipeline due to error")
                 return general_pipeline_func(image_path)
             
-            return {
-                'status': 'REJECTED',
-                'final_quality_score': 0,
-                'decision': 'REJECT',
-                'document_type': 'UNKNOWN',
-                'message': f'Index-II processing error: {str(e)}',
-                'rejection_reason': 'Processing error',
-                'index2_processing': False,
-                'error': str(e)
-            }
+            return Index2Result(
+                status='REJECTED',
+                final_quality_score=0,
+                decision='REJECT',
+                document_type='UNKNOWN',
+                message=f'Index-II processing error: {str(e)}',
+                rejection_reason='Processing error',
+                index2_processing=False,
+                error=str(e)
+            ).to_dict()
     
     def _format_message(self, result: Dict, detection: Dict, is_actually_index2: bool = True) -> str:
         """Format user-friendly message for Index-II processing."""
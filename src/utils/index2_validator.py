@@ -7,14 +7,70 @@ Focuses on authenticity markers rather than perfect image quality.
 
 import cv2
 import numpy as np
-from PIL import Image
 import pytesseract
 import logging
-from typing import Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+import copy
+import functools
+import hashlib
+import math
 import os
+import re
+import threading
+
+# Optional tesserocr bindings (persistent Tesseract API - language models are loaded once per thread
+# instead of once per pytesseract subprocess)
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Structural checks only answer coarse yes/no questions - pages are shrunk to this width first
+STRUCTURE_CHECK_WIDTH = 1000
+
+# Header markers (सूची क्र.2, Index-II, Regn) and printed-form keywords, each matched in one scan of the OCR text
+_HEADER_RE = re.compile(r'सूची|index|regn', re.IGNORECASE)
+_PRINTED_RE = re.compile(r'payment|details|registry|index|सूची|मोबदला|regn', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1)
+def _tesseract_lang() -> str:
+    """
+    Pick the Tesseract language string for Index-II OCR from the installed language data (probed once).
+    
+    Returns:
+        Installed subset of eng+hin+mar joined with '+' ('eng' if none are installed or the probe fails)
+    """
+    try:
+        langs = set(pytesseract.get_languages(config=''))
+    except Exception as e:
+        logger.warning(f"Could not list Tesseract languages: {e}")
+        return 'eng'
+    return '+'.join(lang for lang in ('eng', 'hin', 'mar') if lang in langs) or 'eng'
+
+
+@dataclass(slots=True)
+class Index2ValidationResult:
+    """Result of Index-II page validation (serialized with to_dict() for the processor and API)."""
+    decision: str
+    score: float
+    rejection_reason: Optional[str] = None
+    validation_details: Dict = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        """Convert to the validation result dictionary."""
+        return {
+            'decision': self.decision,
+            'score': self.score,
+            'rejection_reason': self.rejection_reason,
+            'validation_details': self.validation_details
+        }
+
 
 class Index2Validator:
     """
@@ -29,10 +85,44 @@ class Index2Validator:
         
         # Minimum score to accept Index-II document
         self.min_accept_score = float(os.getenv('INDEX2_MIN_ACCEPT_SCORE', 50))
+        
+        # Installed OCR languages (probed once instead of retrying failed language combinations per page)
+        self.lang = _tesseract_lang()
+        
+        # Run the structural checks through cv2.UMat so OpenCV can dispatch them to an OpenCL device
+        # (ignored when OpenCV has no OpenCL support)
+        self.use_opencl = os.getenv('INDEX2_OPENCL', 'false').lower() in ('1', 'true') and cv2.ocl.haveOpenCL()
+        
+        # tesserocr API handles are not thread-safe - keep one per thread (created on first use)
+        self._tesserocr = threading.local()
+        
+        # Florence-2 classifier, resolved on first use (see florence_classifier)
+        self._florence_classifier = None
+        self._florence_checked = False
+        
+        # Validation results for repeated pages, keyed by file content hash (LRU, 0 = disabled)
+        self.result_cache_size = int(os.getenv('INDEX2_VALIDATION_CACHE_SIZE', 256))
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+    
+    @property
+    def florence_classifier(self):
+        """Florence-2 classifier, imported on first use (None if disabled or unavailable)."""
+        if not self._florence_checked:
+            self._florence_checked = True
+            # Disabled deployments never import the module (it pulls in torch/transformers)
+            if os.getenv('FLORENCE_ENABLED', 'false').lower() == 'true':
+                try:
+                    from src.utils.florence_classifier import get_florence_instance
+                    self._florence_classifier = get_florence_instance()
+                except Exception as e:
+                    logger.warning(f"Florence-2 classifier initialization failed: {e}")
+        return self._florence_classifier
     
     def validate_index2(self, image_path: str) -> Dict:
         """
         Validate Index-II document based on structure and authenticity.
+        Results are cached by file content, so revalidating the same page skips OCR entirely.
         
         Args:
             image_path: Path to the image file
@@ -45,116 +135,251 @@ class Index2Validator:
                 'rejection_reason': str or None
             }
         """
+        content_hash = self._hash_file(image_path)
+        if content_hash is not None:
+            with self._result_cache_lock:
+                cached = self._result_cache.get(content_hash)
+                if cached is not None:
+                    self._result_cache.move_to_end(content_hash)
+            if cached is not None:
+                logger.info(f"Index-II validation cache hit for: {os.path.basename(image_path)}")
+                # Callers may modify the result - never hand out the cached object
+                return copy.deepcopy(cached)
+        
+        result = self._validate_uncached(image_path)
+        
+        # Errors are not cached (they may be transient)
+        if content_hash is not None and not (result.get('rejection_reason') or '').startswith('Validation error'):
+            cached = copy.deepcopy(result)
+            with self._result_cache_lock:
+                self._result_cache[content_hash] = cached
+                self._result_cache.move_to_end(content_hash)
+                while len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+        
+        return result
+    
+    def _validate_uncached(self, image_path: str) -> Dict:
+        """
+        Validate an Index-II page (uncached, see validate_index2).
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            Validation result dictionary
+        """
         try:
             img = cv2.imread(image_path)
             if img is None:
-                return {
-                    'decision': 'REJECT',
-                    'score': 0,
-                    'rejection_reason': 'Could not read image file',
-                    'validation_details': {}
-                }
+                return Index2ValidationResult(
+                    decision='REJECT',
+                    score=0,
+                    rejection_reason='Could not read image file'
+                ).to_dict()
             
-            # Step 1: Check minimum readability (very lenient for Index-II)
-            ocr_result = self._check_ocr_readability(image_path)
-            if ocr_result['confidence'] < self.min_ocr_confidence:
-                return {
-                    'decision': 'REJECT',
-                    'score': ocr_result['confidence'],
-                    'rejection_reason': f'Text completely unreadable (OCR: {ocr_result["confidence"]:.1f}%) - document may be corrupted',
-                    'validation_details': {'ocr': ocr_result}
-                }
+            # OCR the page once - confidence, text content, header and printed-keyword checks
+            # all use this single Tesseract run
+            ocr_data, text = self._run_ocr_once(image_path)
             
-            # Step 2: Verify Index-II structural elements
-            structural_check = self._verify_structure(image_path, img)
+            return self._validate_ocr_page(image_path, img, ocr_data, text).to_dict()
             
-            # Step 3: Check if document is 100% handwritten (reject these)
-            # Pass OCR confidence to help distinguish bold text from actual handwriting
-            handwriting_check = self._check_if_fully_handwritten(image_path, ocr_result['confidence'])
+        except Exception as e:
+            logger.error(f"Index-II validation failed: {e}", exc_info=True)
+            return Index2ValidationResult(
+                decision='REJECT',
+                score=0,
+                rejection_reason=f'Validation error: {str(e)}'
+            ).to_dict()
+    
+    def _hash_file(self, file_path: str) -> Optional[str]:
+        """
+        Hash a file's bytes for the validation result cache.
+        
+        Args:
+            file_path: Path to the image file
             
-            if handwriting_check['is_fully_handwritten']:
-                return {
-                    'decision': 'REJECT',
-                    'score': 0,
-                    'rejection_reason': 'Document is fully handwritten - not a valid Index-II',
-                    'validation_details': {
-                        'ocr': ocr_result,
-                        'handwriting': handwriting_check
-                    }
-                }
+        Returns:
+            Hex digest of the file content, or None if caching is disabled or the file can't be read
+        """
+        if self.result_cache_size <= 0:
+            return None
+        try:
+            with open(file_path, 'rb') as f:
+                return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        except OSError:
+            return None
+    
+    def _validate_ocr_page(self, image_path: str, img: np.ndarray,
+                           ocr_data: Optional[Dict], text: str) -> Index2ValidationResult:
+        """
+        Validate an OCR'd Index-II page (readability, structure, handwriting and overall score).
+        
+        Args:
+            image_path: Path to the image file
+            img: Decoded page (BGR)
+            ocr_data: pytesseract word data of the page (None if OCR failed)
+            text: Page text
             
-            # Step 4: Calculate overall score
-            overall_score = self._calculate_index2_score(
-                ocr_result,
-                structural_check,
-                handwriting_check
+        Returns:
+            Index2ValidationResult
+        """
+        # Step 1: Check minimum readability (very lenient for Index-II)
+        ocr_result = self._check_ocr_readability(ocr_data, text)
+        if ocr_result['confidence'] < self.min_ocr_confidence:
+            return Index2ValidationResult(
+                decision='REJECT',
+                score=ocr_result['confidence'],
+                rejection_reason=f'Text completely unreadable (OCR: {ocr_result["confidence"]:.1f}%) - document may be corrupted',
+                validation_details={'ocr': ocr_result}
             )
-            
-            # Decision: Accept if score >= minimum threshold (lenient)
-            decision = 'ACCEPT' if overall_score >= self.min_accept_score else 'REJECT'
-            
-            return {
-                'decision': decision,
-                'score': round(overall_score, 2),
-                'rejection_reason': None if decision == 'ACCEPT' else f'Quality below minimum threshold (score: {overall_score:.1f})',
-                'validation_details': {
+        
+        # Step 2: Verify Index-II structural elements
+        structural_check = self._verify_structure(img, text)
+        
+        # Step 3: Check if document is 100% handwritten (reject these)
+        # Pass OCR confidence to help distinguish bold text from actual handwriting
+        handwriting_check = self._check_if_fully_handwritten(image_path, ocr_result['confidence'], text)
+        
+        if handwriting_check['is_fully_handwritten']:
+            return Index2ValidationResult(
+                decision='REJECT',
+                score=0,
+                rejection_reason='Document is fully handwritten - not a valid Index-II',
+                validation_details={
                     'ocr': ocr_result,
-                    'structure': structural_check,
                     'handwriting': handwriting_check
                 }
+            )
+        
+        # Step 4: Calculate overall score
+        overall_score = self._calculate_index2_score(
+            ocr_result,
+            structural_check,
+            handwriting_check
+        )
+        
+        # Decision: Accept if score >= minimum threshold (lenient)
+        decision = 'ACCEPT' if overall_score >= self.min_accept_score else 'REJECT'
+        
+        return Index2ValidationResult(
+            decision=decision,
+            score=round(overall_score, 2),
+            rejection_reason=None if decision == 'ACCEPT' else f'Quality below minimum threshold (score: {overall_score:.1f})',
+            validation_details={
+                'ocr': ocr_result,
+                'structure': structural_check,
+                'handwriting': handwriting_check
             }
-            
-        except Exception as e:
-            logger.error(f"Index-II validation failed: {e}", exc_info=True)
-            return {
-                'decision': 'REJECT',
-                'score': 0,
-                'rejection_reason': f'Validation error: {str(e)}',
-                'validation_details': {}
-            }
+        )
     
-    def _check_ocr_readability(self, image_path: str) -> Dict:
+    def _run_ocr_once(self, image_path: str) -> Tuple[Optional[Dict], str]:
         """
-        Check if text is readable - very lenient threshold for Index-II.
+        OCR the page with a single Tesseract run (word data with confidences).
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            Tuple of (pytesseract word data dict or None if OCR failed, page text rebuilt from the words)
         """
         try:
-            img = Image.open(image_path)
-            
-            # Try OCR with multiple languages
-            try:
+            if TESSEROCR_AVAILABLE:
+                ocr_data = self._tesserocr_data(image_path)
+            else:
+                # Tesseract reads the file itself - decoding it into PIL here would only be re-encoded
+                # to a temporary PNG by pytesseract (the page is decoded once more, by OpenCV, for the structure checks)
                 ocr_data = pytesseract.image_to_data(
-                    img,
-                    lang='eng+hin+mar',
+                    image_path,
+                    lang=self.lang,
                     output_type=pytesseract.Output.DICT
                 )
-            except:
-                try:
-                    ocr_data = pytesseract.image_to_data(
-                        img,
-                        lang='eng+hin',
-                        output_type=pytesseract.Output.DICT
-                    )
-                except:
-                    ocr_data = pytesseract.image_to_data(
-                        img,
-                        lang='eng',
-                        output_type=pytesseract.Output.DICT
-                    )
             
-            confidences = [int(conf) for conf in ocr_data['conf'] if conf != '-1' and conf != '']
-            avg_confidence = np.mean(confidences) if confidences else 0
+            return ocr_data, self._text_from_ocr_data(ocr_data)
             
-            # Extract text to check content
-            try:
-                text = pytesseract.image_to_string(img, lang='eng+hin+mar')
-            except:
-                try:
-                    text = pytesseract.image_to_string(img, lang='eng+hin')
-                except:
-                    text = pytesseract.image_to_string(img, lang='eng')
+        except Exception as e:
+            logger.warning(f"OCR failed: {e}")
+            return None, ''
+    
+    def _tesserocr_data(self, image_path: str) -> Dict:
+        """
+        Extract word-level OCR data with this thread's persistent tesserocr API handle.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            Dictionary with 'text', 'conf', 'block_num', 'par_num' and 'line_num' lists
+            (same keys as pytesseract.image_to_data)
+        """
+        api = getattr(self._tesserocr, 'api', None)
+        if api is None:
+            api = PyTessBaseAPI(lang=self.lang)
+            self._tesserocr.api = api
+        
+        api.SetImageFile(image_path)
+        api.Recognize()
+        
+        ocr_data = {'text': [], 'conf': [], 'block_num': [], 'par_num': [], 'line_num': []}
+        iterator = api.GetIterator()
+        if iterator is None:  # Nothing recognized
+            return ocr_data
+        
+        block_num = par_num = line_num = 0
+        for word in iterate_level(iterator, RIL.WORD):
+            if word.IsAtBeginningOf(RIL.BLOCK):
+                block_num += 1
+            if word.IsAtBeginningOf(RIL.PARA):
+                par_num += 1
+            if word.IsAtBeginningOf(RIL.TEXTLINE):
+                line_num += 1
+            ocr_data['text'].append(word.GetUTF8Text(RIL.WORD) or '')
+            ocr_data['conf'].append(int(word.Confidence(RIL.WORD)))
+            ocr_data['block_num'].append(block_num)
+            ocr_data['par_num'].append(par_num)
+            ocr_data['line_num'].append(line_num)
+        
+        return ocr_data
+    
+    @staticmethod
+    def _text_from_ocr_data(ocr_data: Dict) -> str:
+        """
+        Rebuild page text from pytesseract word data (words joined by spaces, one line per OCR line).
+        
+        Args:
+            ocr_data: pytesseract image_to_data output (Output.DICT)
+            
+        Returns:
+            Page text
+        """
+        lines = {}
+        for word, block, paragraph, line in zip(
+            ocr_data['text'], ocr_data['block_num'], ocr_data['par_num'], ocr_data['line_num']
+        ):
+            if word.strip():
+                lines.setdefault((block, paragraph, line), []).append(word)
+        return '\n'.join(' '.join(words) for words in lines.values())
+    
+    def _check_ocr_readability(self, ocr_data: Optional[Dict], text: str) -> Dict:
+        """
+        Check if text is readable - very lenient threshold for Index-II.
+        
+        Args:
+            ocr_data: pytesseract word data of the page (None if OCR failed)
+            text: Page text
+        """
+        try:
+            # No OCR data (OCR failed) scores as unreadable
+            confidences = np.asarray(ocr_data['conf'] if ocr_data is not None else [])
+            if confidences.dtype.kind in 'UO':
+                # Older pytesseract returns confidences as strings ('' for empty cells)
+                confidences = confidences[confidences != ''].astype(np.float64)
+            # Tesseract reports -1 for page/block/line rows that carry no word confidence
+            confidences = confidences[confidences >= 0]
+            avg_confidence = confidences.mean() if confidences.size else 0
             
             return {
-                'confidence': round(avg_confidence, 2),
+                'confidence': round(float(avg_confidence), 2),
                 'text_length': len(text.strip()),
                 'has_content': len(text.strip()) > 50,
                 'word_count': len(text.strip().split())
@@ -169,17 +394,28 @@ class Index2Validator:
                 'word_count': 0
             }
     
-    def _verify_structure(self, image_path: str, img: np.ndarray) -> Dict:
+    def _verify_structure(self, img: np.ndarray, text: str) -> Dict:
         """
         Verify document has Index-II structural elements:
         - Barcode (top area)
         - Official seals/stamps
         - Table structure (payment details, property details)
+        
+        Args:
+            img: Decoded page (BGR)
+            text: OCR text of the page (for the header check)
         """
         try:
-            height, width = img.shape[:2]
             gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
             
+            # Downsample once for all structural checks (pixel thresholds below are scaled to match)
+            scale = min(1.0, STRUCTURE_CHECK_WIDTH / gray.shape[1])
+            if scale < 1.0:
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            height, width = gray.shape[:2]
+            # OpenCL (T-API) input for Canny, threshold and morphology - numpy results are pulled back with get()
+            src = cv2.UMat(gray) if self.use_opencl else gray
+            
             checks = {
                 'has_barcode': False,
                 'has_seal': False,
@@ -187,53 +423,56 @@ class Index2Validator:
                 'has_header': False
             }
             
+            # One edge map serves both the barcode projection (top 20% view) and the seal contours
+            edges = cv2.Canny(src, 50, 150)
+            if self.use_opencl:
+                edges = edges.get()
+            
             # Check for barcode in top 20% of document
-            top_section = gray[0:int(height*0.2), :]
-            edges = cv2.Canny(top_section, 50, 150)
-            vertical_projection = np.sum(edges, axis=0)
+            top_edges = edges[0:int(height*0.2), :]
+            # Column sums accumulated straight into int32 (np.sum would promote the edge map to 64-bit)
+            vertical_projection = cv2.reduce(top_edges, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel()
             
             if len(vertical_projection) > 0:
-                checks['has_barcode'] = (
+                # Plain bools so the result holds no numpy scalars
+                checks['has_barcode'] = bool(
                     np.std(vertical_projection) > 20 and 
                     np.max(vertical_projection) > height * 0.1
                 )
             
-            # Check for circular seals (Hough circles)
+            # Check for circular seals (closed round edge contours - only presence matters, so stop at the first)
             try:
-                circles = cv2.HoughCircles(
-                    gray, cv2.HOUGH_GRADIENT, 1, 50,
-                    param1=100, param2=30, minRadius=30, maxRadius=150
-                )
-                checks['has_seal'] = circles is not None and len(circles[0]) > 0
+                contours, _ = cv2.findContours(edges, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+                min_radius, max_radius = 30 * scale, 150 * scale
+                for contour in contours:
+                    # The bounding box bounds the enclosing radius - skips minEnclosingCircle on text/noise specks
+                    _, _, w, h = cv2.boundingRect(contour)
+                    if math.hypot(w, h) / 2 <= min_radius or max(w, h) / 2 >= max_radius:
+                        continue
+                    _, radius = cv2.minEnclosingCircle(contour)
+                    if min_radius < radius < max_radius and cv2.contourArea(contour) / (np.pi * radius * radius) > 0.7:
+                        checks['has_seal'] = True
+                        break
             except:
                 pass
             
             # Check for table structure (horizontal lines)
             try:
-                horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))
-                _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+                horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (max(1, round(40 * scale)), 1))
+                _, thresh = cv2.threshold(src, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
                 detect_horizontal = cv2.morphologyEx(
                     thresh,
                     cv2.MORPH_OPEN,
                     horizontal_kernel,
                     iterations=2
                 )
-                checks['has_table_structure'] = np.sum(detect_horizontal) > width * height * 0.001
+                # Same test as summing the 255-valued line pixels, without the int64 reduction
+                checks['has_table_structure'] = cv2.countNonZero(detect_horizontal) * 255 > width * height * 0.001
             except:
                 pass
             
             # Check for header text (सूची क्र.2, Index-II)
-            try:
-                text = pytesseract.image_to_string(
-                    Image.open(image_path),
-                    lang='eng+hin+mar'
-                )
-                checks['has_header'] = any(
-                    marker in text.lower() 
-                    for marker in ['सूची', 'index', 'regn']
-                )
-            except:
-                pass
+            checks['has_header'] = _HEADER_RE.search(text) is not None
             
             structure_score = sum(checks.values()) * 25  # 0-100 scale
             
@@ -249,13 +488,19 @@ class Index2Validator:
                 'score': 0
             }
     
-    def _check_if_fully_handwritten(self, image_path: str, ocr_confidence: float = None) -> Dict:
+    def _check_if_fully_handwritten(self, image_path: str, ocr_confidence: float = None,
+                                    text: Optional[str] = None) -> Dict:
         """
         Check if document is 100% handwritten (should reject these).
         Uses Florence-2 if available, otherwise uses OCR text analysis.
         
         For Index-II documents: If OCR confidence is high (>= 70%), trust OCR over handwriting detection.
         Bold text in Index-II documents can trigger false handwriting detection.
+        
+        Args:
+            image_path: Path to the image file
+            ocr_confidence: Average OCR confidence of the page
+            text: OCR text of the page (OCR'd here if None)
         """
         try:
             # CRITICAL: If OCR confidence is high (>= 70%), document is readable
@@ -271,9 +516,7 @@ class Index2Validator:
             
             # Try Florence-2 first (if available)
             try:
-                from src.utils.florence_classifier import get_florence_instance
-                
-                florence = get_florence_instance()
+                florence = self.florence_classifier
                 if florence and florence.enabled:
                     result = florence.classify_document(image_path)
                     
@@ -307,20 +550,11 @@ class Index2Validator:
             
             # Fallback: Check for printed text patterns using OCR
             try:
-                img = Image.open(image_path)
-                try:
-                    text = pytesseract.image_to_string(img, lang='eng+hin+mar')
-                except:
-                    try:
-                        text = pytesseract.image_to_string(img, lang='eng+hin')
-                    except:
-                        text = pytesseract.image_to_string(img, lang='eng')
+                if text is None:
+                    _, text = self._run_ocr_once(image_path)
                 
                 # If we can extract significant printed text, it's not fully handwritten
-                has_printed_keywords = any(
-                    kw in text.lower() 
-                    for kw in ['payment', 'details', 'registry', 'index', 'सूची', 'मोबदला', 'regn']
-                )
+                has_printed_keywords = _PRINTED_RE.search(text) is not None
                 
                 # Also check OCR confidence if available
                 if ocr_confidence is not None and ocr_confidence >= 50:
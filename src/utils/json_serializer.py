@@ -7,6 +7,10 @@ import numpy as np
 from typing import Any, Dict, List
 
 
+# Leaf types that need no conversion (checked by exact type - the common case in result dicts)
+_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def convert_numpy_types(obj: Any) -> Any:
     """
     Recursively convert numpy types to Python native types for JSON serialization.
@@ -17,20 +21,27 @@ def convert_numpy_types(obj: Any) -> Any:
     Returns:
         Object with numpy types converted to Python native types
     """
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
+    # Fast paths keyed on the exact type (no MRO walk) for native leaves and plain containers
+    obj_type = type(obj)
+    if obj_type in _NATIVE_TYPES:
+        return obj
+    convert = convert_numpy_types
+    if obj_type is dict:
+        return {key: convert(value) for key, value in obj.items()}
+    if obj_type is list or obj_type is tuple:
+        return [convert(item) for item in obj]
+    
+    if isinstance(obj, (np.integer, np.floating, np.bool_)):
+        # item() returns the matching Python int/float/bool
+        return obj.item()
     elif isinstance(obj, np.ndarray):
         return obj.tolist()
     elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
+        return {key: convert(value) for key, value in obj.items()}
     elif isinstance(obj, (list, tuple)):
-        return [convert_numpy_types(item) for item in obj]
+        return [convert(item) for item in obj]
     elif isinstance(obj, set):
-        return {convert_numpy_types(item) for item in obj}
+        return {convert(item) for item in obj}
     else:
         return obj
 
@@ -5,21 +5,54 @@ Converts PDF files to images for processing.
 
 from pdf2image import convert_from_path
 from PIL import Image
+import logging
 import os
 from typing import List, Optional
 
+logger = logging.getLogger(__name__)
+
+
+# Page image formats poppler can write directly, with their file extensions
+PAGE_FORMAT_EXTENSIONS = {'png': 'png', 'jpeg': 'jpg', 'ppm': 'ppm'}
+
+# JPEG pages are OCR intermediates - quality 90 without optimization passes
+JPEG_OPTIONS = {'quality': 90, 'progressive': False, 'optimize': False}
+
 
 class PDFConverter:
     """Converts PDF files to images."""
     
-    def __init__(self, dpi: int = 300):
+    def __init__(self, dpi: int = 300, thread_count: Optional[int] = None, output_format: Optional[str] = None):
         """
         Initialize PDF converter.
         
         Args:
             dpi: DPI for PDF conversion (default: 300)
+            thread_count: Number of poppler processes rasterizing pages in parallel (default: CPU count)
+            output_format: Page image format - png, jpeg or ppm (default: PDF_PAGE_FORMAT env, png)
         """
         self.dpi = dpi
+        self.output_format = (output_format or os.getenv('PDF_PAGE_FORMAT', 'png')).lower()
+        if self.output_format not in PAGE_FORMAT_EXTENSIONS:
+            logger.warning(f"Unsupported PDF page format '{self.output_format}', using png")
+            self.output_format = 'png'
+        self.thread_count = thread_count or os.cpu_count() or 1
+    
+    def render_pages(self, pdf_path: str, first_page_only: bool = False) -> List[Image.Image]:
+        """
+        Render PDF pages to in-memory PIL images (nothing is written to disk).
+        
+        Args:
+            pdf_path: Path to PDF file
+            first_page_only: If True, only render first page (for quick detection)
+            
+        Returns:
+            List of PIL images, one per rendered page
+        """
+        if first_page_only:
+            # Only convert first page
+            return convert_from_path(pdf_path, dpi=self.dpi, first_page=1, last_page=1)
+        return convert_from_path(pdf_path, dpi=self.dpi, thread_count=self.thread_count)
     
     def convert_pdf_to_images(self, pdf_path: str, output_dir: Optional[str] = None, first_page_only: bool = False) -> List[str]:
         """
@@ -34,14 +67,6 @@ class PDFConverter:
             List of image file paths
         """
         try:
-            # Convert PDF to images
-            if first_page_only:
-                # Only convert first page
-                images = convert_from_path(pdf_path, dpi=self.dpi, first_page=1, last_page=1)
-            else:
-                images = convert_from_path(pdf_path, dpi=self.dpi)
-            
-            image_paths = []
             base_name = os.path.splitext(os.path.basename(pdf_path))[0]
             
             if output_dir is None:
@@ -49,11 +74,26 @@ class PDFConverter:
             
             os.makedirs(output_dir, exist_ok=True)
             
-            # Save each page as image
-            for i, image in enumerate(images):
-                image_filename = f"{base_name}_page_{i+1}.png"
+            # Poppler writes the page images straight to output_dir (split across parallel processes)
+            # instead of decoding every page into PIL and re-encoding it here
+            page_range = {'first_page': 1, 'last_page': 1} if first_page_only else {}
+            rendered_paths = convert_from_path(
+                pdf_path,
+                dpi=self.dpi,
+                output_folder=output_dir,
+                fmt=self.output_format,
+                jpegopt=JPEG_OPTIONS if self.output_format == 'jpeg' else None,
+                paths_only=True,
+                thread_count=self.thread_count,
+                **page_range
+            )
+            
+            # Rename each page to its page-numbered image name
+            image_paths = []
+            for i, rendered_path in enumerate(rendered_paths):
+                image_filename = f"{base_name}_page_{i+1}.{PAGE_FORMAT_EXTENSIONS[self.output_format]}"
                 image_path = os.path.join(output_dir, image_filename)
-                image.save(image_path, 'PNG')
+                os.replace(rendered_path, image_path)
                 image_paths.append(image_path)
             
             return image_paths
@@ -0,0 +1,80 @@
+"""
+Equivalence tests for the Numba table grid kernel in the Index-II detector.
+The kernel must count exactly the pixels kept by the OpenCV line openings it replaces.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from src.utils.index2_detector import (
+    NUMBA_AVAILABLE, _TABLE_H_KERNEL, _TABLE_LINE_LEAD, _TABLE_LINE_TRAIL, _TABLE_V_KERNEL
+)
+
+if NUMBA_AVAILABLE:
+    from src.utils.index2_detector import _grid_line_pixels
+
+pytestmark = pytest.mark.skipif(not NUMBA_AVAILABLE, reason='Numba is not installed')
+
+
+def _opened_counts(thresh):
+    """Horizontal and vertical line pixel counts from the OpenCV openings."""
+    h_lines = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, _TABLE_H_KERNEL, iterations=2)
+    v_lines = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, _TABLE_V_KERNEL, iterations=2)
+    return cv2.countNonZero(h_lines), cv2.countNonZero(v_lines)
+
+
+def _random_lines(rng, height, width, count):
+    """Binary page with random horizontal and vertical segments (many touching the page edge)."""
+    thresh = np.zeros((height, width), dtype=np.uint8)
+    for _ in range(count):
+        length = int(rng.integers(1, 120))
+        if rng.random() < 0.5:
+            y = int(rng.integers(0, height))
+            x = int(rng.choice([0, width - length, rng.integers(0, width)]))
+            thresh[y, max(x, 0):x + length] = 255
+        else:
+            x = int(rng.integers(0, width))
+            y = int(rng.choice([0, height - length, rng.integers(0, height)]))
+            thresh[max(y, 0):y + length, x] = 255
+    return thresh
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_grid_line_pixels_matches_opening_on_random_lines(seed):
+    rng = np.random.default_rng(seed)
+    height, width = (int(v) for v in rng.integers(20, 160, size=2))
+    thresh = _random_lines(rng, height, width, count=int(rng.integers(5, 60)))
+    
+    assert _grid_line_pixels(thresh, _TABLE_LINE_LEAD, _TABLE_LINE_TRAIL) == _opened_counts(thresh)
+
+
+@pytest.mark.parametrize('density', [0.5, 0.9, 0.97])
+def test_grid_line_pixels_matches_opening_on_random_noise(density):
+    rng = np.random.default_rng(7)
+    thresh = np.where(rng.random((90, 130)) < density, 255, 0).astype(np.uint8)
+    
+    assert _grid_line_pixels(thresh, _TABLE_LINE_LEAD, _TABLE_LINE_TRAIL) == _opened_counts(thresh)
+
+
+@pytest.mark.parametrize('start, end', [
+    (0, 19), (0, 20), (0, 38), (0, 39), (81, 100), (80, 100), (62, 100), (61, 100),
+    (30, 68), (30, 69), (0, 100),
+])
+def test_grid_line_pixels_matches_opening_on_edge_runs(start, end):
+    thresh = np.zeros((100, 100), dtype=np.uint8)
+    thresh[50, start:end] = 255
+    thresh[start:end, 50] = 255
+    
+    assert _grid_line_pixels(thresh, _TABLE_LINE_LEAD, _TABLE_LINE_TRAIL) == _opened_counts(thresh)
+
+
+def test_grid_line_pixels_counts_overlapping_opened_runs_once():
+    # Opening shifts kept runs by two pixels, so runs separated by a short gap overlap once opened
+    thresh = np.zeros((100, 100), dtype=np.uint8)
+    thresh[50, 5:45] = 255
+    thresh[50, 46:90] = 255
+    thresh[5:45, 50] = 255
+    thresh[46:90, 50] = 255
+    
+    assert _grid_line_pixels(thresh, _TABLE_LINE_LEAD, _TABLE_LINE_TRAIL) == _opened_counts(thresh)